@@ -0,0 +1,416 @@
+import io
+import os
+import bz2
+import sys
+import gzip
+import lzma
+import zlib
+import itertools
+from enum import Enum
+from typing import IO, Dict, Iterator, List, Tuple
+
+"""
+Contains transparent streaming compression of input and output files.
+"""
+
+# End of byte ranges of compressed input files, they can not be split by offsets in the compressed file
+STREAM_END: int = sys.maxsize
+
+# Uncompressed size of gzip members of output files. Results of a torn member are recovered in memory when a run is resumed.
+GZIP_MEMBER_SIZE: int = 8*1024*1024
+
+# Minimal uncompressed size of bzip2 and xz streams of output files. Smaller streams compress poorly, their text is kept
+# in memory until it is written as a whole stream and the instances log waits for it.
+MIN_STREAM_SIZE: int = 1024*1024
+
+_READ_SIZE: int = 1024*1024
+
+class Compressions(Enum):
+    """
+    Contains all compressions of input and output files. Files are compressed if their name ends with the suffix of a compression.
+
+    NONE -- Plain text files.
+    GZIP -- Gzip files (.gz). Output files are a single deflate stream that is flushed at byte boundaries,
+    a new gzip member is started after GZIP_MEMBER_SIZE bytes of results.
+    BZ2 -- Bzip2 files (.bz2). A new bzip2 stream is appended to output files at the first flush after MIN_STREAM_SIZE bytes of results.
+    XZ -- XZ files (.xz). A new xz stream is appended to output files at the first flush after MIN_STREAM_SIZE bytes of results.
+    """
+    NONE = "none"
+    GZIP = "gzip"
+    BZ2 = "bz2"
+    XZ = "xz"
+
+    def get_suffix(self) -> str:
+        """
+        Returns:
+            str -- Suffix of files with this compression.
+        """
+        return {Compressions.GZIP: ".gz", Compressions.BZ2: ".bz2", Compressions.XZ: ".xz"}.get(self, "")
+
+def get_compression(path: str) -> Compressions:
+    """
+    Returns:
+        Compressions -- Compression of the file chosen by the suffix of its path.
+    """
+    for compression in Compressions:
+        if compression != Compressions.NONE and path.endswith(compression.get_suffix()):
+            return compression
+
+    return Compressions.NONE
+
+def strip_compression_suffix(path: str) -> str:
+    """
+    Returns:
+        str -- The path without the suffix of its compression.
+    """
+    suffix: str = get_compression(path).get_suffix()
+
+    return path[:-len(suffix)] if len(suffix) > 0 else path
+
+class CompressedInputFile(io.TextIOWrapper):
+    """
+    Text stream of a compressed input file that is decompressed while it is read.
+
+    Offsets returned by tell are positions in the decompressed stream, seeking decompresses the file from its start
+    if the position is before the current one. fileno returns the descriptor of the compressed file.
+    """
+
+    def __init__(self, path: str, compression: Compressions):
+        """
+        Arguments:
+            path {str} -- Path to the input file.
+            compression {Compressions} -- Compression of the file.
+        """
+        if compression == Compressions.GZIP:
+            binary_file: IO = gzip.GzipFile(path, "rb")
+        elif compression == Compressions.BZ2:
+            binary_file = bz2.BZ2File(path, "rb")
+        else:
+            binary_file = lzma.LZMAFile(path, "rb")
+
+        super().__init__(binary_file)
+        self._path: str = path
+
+    @property
+    def name(self) -> str:
+        return self._path
+
+def open_input_file(path: str) -> IO:
+    """
+    Arguments:
+        path {str} -- Path to the input file.
+
+    Returns:
+        IO -- The input file opened for reading text. Compressed files are decompressed while they are read.
+    """
+    compression: Compressions = get_compression(path)
+    if compression == Compressions.NONE:
+        return open(path, "r")
+
+    return CompressedInputFile(path, compression)
+
+def is_compressed(input_file: IO) -> bool:
+    """
+    Returns:
+        bool -- True if offsets of the opened input file are positions in a decompressed stream.
+    """
+    return isinstance(input_file, CompressedInputFile)
+
+def get_output_path(path: str, compression: Compressions) -> Tuple[str, Compressions]:
+    """
+    Arguments:
+        path {str} -- Path to the output file given by the parser.
+        compression {Compressions} -- Compression of output files selected by the user.
+
+    Returns:
+        (str, Compressions) -- Path to the output file and its compression. The suffix of the compression is appended to the path
+        unless it already ends with a suffix of a compression, which is then used instead.
+    """
+    path_compression: Compressions = get_compression(path)
+    if path_compression != Compressions.NONE or compression == Compressions.NONE:
+        return path, path_compression
+
+    return f'{path}{compression.get_suffix()}', compression
+
+def _create_decompressor(compression: Compressions):
+    if compression == Compressions.GZIP:
+        return zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+    if compression == Compressions.BZ2:
+        return bz2.BZ2Decompressor()
+
+    return lzma.LZMADecompressor(format=lzma.FORMAT_XZ)
+
+_DECOMPRESSION_ERRORS = (zlib.error, OSError, EOFError, lzma.LZMAError)
+
+# Bytes every stream of the compression starts with
+_STREAM_MAGICS: Dict[Compressions, bytes] = {Compressions.GZIP: b"\x1f\x8b\x08", Compressions.BZ2: b"BZh", Compressions.XZ: b"\xfd7zXZ\x00"}
+
+# Compressed bytes given to a decompressor at once while a torn stream is recovered
+_DECOMPRESS_SIZE: int = 64*1024
+
+def _find_stream_starts(output_file: IO, compression: Compressions) -> Iterator[int]:
+    """
+    Searches the file backwards for the magic bytes of streams. Compressed data can contain them as well,
+    so the offsets are only candidates for starts of streams.
+
+    Returns:
+        Iterator[int] -- Offsets of the magic bytes from the end of the file.
+    """
+    magic: bytes = _STREAM_MAGICS[compression]
+    end: int = output_file.seek(0, os.SEEK_END)
+    while end > 0:
+        start: int = max(end - _READ_SIZE, 0)
+        output_file.seek(start)
+        # Magic bytes can cross the end of the chunk
+        chunk: bytes = output_file.read(end - start + len(magic) - 1)
+
+        index: int = chunk.rfind(magic)
+        while index >= 0:
+            if start + index < end:
+                yield start + index
+            index = chunk.rfind(magic, 0, index)
+
+        end = start
+
+def _find_incomplete_stream(output_file: IO, compression: Compressions, start: int = 0) -> Tuple[int, bool]:
+    """
+    Arguments:
+        output_file {IO} -- The compressed output file opened in binary mode.
+        compression {Compressions} -- Compression of the file.
+
+    Keyword Arguments:
+        start {int} -- Offset where the first decompressed stream starts. (default: {0})
+
+    Returns:
+        (int, bool) -- Offset of the first stream after start that is not complete, None if all streams are complete.
+        True if the first stream after start is complete.
+    """
+    output_file.seek(start)
+    offset: int = start
+    stream_start: int = start
+    completed: int = 0
+    decompressor = None
+
+    chunk: bytes = output_file.read(_READ_SIZE)
+    while len(chunk) > 0:
+        if decompressor is None:
+            decompressor = _create_decompressor(compression)
+            stream_start = offset
+
+        try:
+            decompressor.decompress(chunk)
+        except _DECOMPRESSION_ERRORS:
+            # Garbage after the last complete data, e.g. a torn write
+            return (stream_start, completed > 0)
+
+        if decompressor.eof:
+            unused_data: bytes = decompressor.unused_data
+            offset += len(chunk) - len(unused_data)
+            chunk = unused_data
+            decompressor = None
+            completed += 1
+        else:
+            offset += len(chunk)
+            chunk = b""
+
+        if len(chunk) == 0:
+            chunk = output_file.read(_READ_SIZE)
+
+    return (None if decompressor is None else stream_start, completed > 0)
+
+def _decompress_prefix(output_file: IO, compression: Compressions) -> bytes:
+    """
+    Returns:
+        bytes -- All data that can be decompressed from the current position of the file until the first error.
+    """
+    decompressor = _create_decompressor(compression)
+    decompressed: List[bytes] = list()
+    # Compressed data that was decompressed without an error
+    decompressed_data: List[bytes] = list()
+
+    chunk: bytes = output_file.read(_READ_SIZE)
+    while len(chunk) > 0:
+        for start in range(0, len(chunk), _DECOMPRESS_SIZE):
+            data: bytes = chunk[start:start + _DECOMPRESS_SIZE]
+            try:
+                decompressed.append(decompressor.decompress(data))
+            except _DECOMPRESSION_ERRORS:
+                # Data decompressed by the call that failed is lost, only the failed data is decompressed byte by byte again
+                decompressor = _create_decompressor(compression)
+                decompressed = [decompressor.decompress(b"".join(decompressed_data))]
+                for index in range(len(data)):
+                    try:
+                        decompressed.append(decompressor.decompress(data[index:index + 1]))
+                    except _DECOMPRESSION_ERRORS:
+                        break
+
+                return b"".join(decompressed)
+
+            decompressed_data.append(data)
+
+        chunk = output_file.read(_READ_SIZE)
+
+    return b"".join(decompressed)
+
+def recover_output_file(path: str, compression: Compressions) -> bytes:
+    """
+    Makes an output file left by an interrupted run appendable. The first stream of the file that is not complete is removed with everything after it.
+
+    Only the last stream can be incomplete, so the file is decompressed from the last candidate start of a stream
+    that is followed by a complete stream. The whole file is decompressed only if there is no such candidate.
+    Bzip2 and xz streams are written by a single flush, so instances with results in the removed stream were not logged
+    and nothing is recovered. Gzip members contain results of many flushes.
+
+    Arguments:
+        path {str} -- Path to the compressed output file.
+        compression {Compressions} -- Compression of the file.
+
+    Returns:
+        bytes -- Complete lines that were decompressed from the removed gzip member. They should be written into the file again.
+    """
+    if not os.path.isfile(path):
+        return b""
+
+    with open(path, "r+b") as output_file:
+        for start in itertools.chain(_find_stream_starts(output_file, compression), [0]):
+            stream_start, is_complete = _find_incomplete_stream(output_file, compression, start)
+            if is_complete or start == 0:
+                break
+
+        if stream_start is None:
+            return b""
+
+        data: bytes = b""
+        if compression == Compressions.GZIP:
+            output_file.seek(stream_start)
+            data = _decompress_prefix(output_file, compression)
+        output_file.truncate(stream_start)
+
+    return data[:data.rfind(b"\n") + 1]
+
+class CompressedOutputFile(object):
+    """
+    Text output file that is compressed while it is written. Behaves like a file opened for appending.
+
+    Written text is compressed when the file is flushed, every flush writes complete compressed data at once.
+    Bzip2 and xz streams can not be flushed, so their text stays unwritten until MIN_STREAM_SIZE bytes are flushed
+    or the file is closed, see unwritten_size. Text that was not written is lost when a run is interrupted.
+    Only the stream that was written when a run was interrupted can be incomplete, it is recovered when the file is opened again.
+    """
+
+    def __init__(self, path: str, compression: Compressions, level: int = 6):
+        """
+        Arguments:
+            path {str} -- Path to the output file.
+            compression {Compressions} -- Compression of the file.
+
+        Keyword Arguments:
+            level {int} -- Compression level. (default: {6})
+        """
+        self._path: str = path
+        self._compression: Compressions = compression
+        self._level: int = level
+        self._pending: List[str] = list()
+        self._pending_size: int = 0
+        self._compressor = None
+        self._member_size: int = 0
+
+        recovered: bytes = recover_output_file(path, compression)
+        self._output_file: IO = open(path, "ab")
+
+        if len(recovered) > 0:
+            self._output_file.write(self._compress(recovered))
+            self.flush()
+
+    @property
+    def name(self) -> str:
+        return self._path
+
+    @property
+    def closed(self) -> bool:
+        return self._output_file.closed
+
+    @property
+    def unwritten_size(self) -> int:
+        """
+        Returns:
+            int -- Number of characters that were written but are not in the file after it is flushed.
+            Instances with results among them must not be logged as done yet.
+        """
+        if self._compression == Compressions.GZIP or self._pending_size >= MIN_STREAM_SIZE:
+            return 0
+
+        return self._pending_size
+
+    def fileno(self) -> int:
+        return self._output_file.fileno()
+
+    def write(self, text: str) -> int:
+        self._pending.append(text)
+        self._pending_size += len(text)
+
+        return len(text)
+
+    def _compress(self, data: bytes) -> bytes:
+        if self._compression == Compressions.BZ2:
+            return bz2.compress(data, self._level)
+        if self._compression == Compressions.XZ:
+            return lzma.compress(data, preset=self._level)
+
+        # Gzip members are flushed at byte boundaries, so compression continues across flushes
+        if self._compressor is None:
+            self._compressor = zlib.compressobj(self._level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+            self._member_size = 0
+
+        compressed: bytes = self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        self._member_size += len(data)
+        if self._member_size >= GZIP_MEMBER_SIZE:
+            compressed += self._finish_member()
+
+        return compressed
+
+    def _finish_member(self) -> bytes:
+        if self._compressor is None:
+            return b""
+
+        compressed: bytes = self._compressor.flush(zlib.Z_FINISH)
+        self._compressor = None
+
+        return compressed
+
+    def flush(self):
+        if len(self._pending) > 0 and self.unwritten_size == 0:
+            self._write_pending()
+
+        self._output_file.flush()
+
+    def _write_pending(self):
+        data: bytes = "".join(self._pending).encode()
+        self._pending = list()
+        self._pending_size = 0
+        self._output_file.write(self._compress(data))
+
+    def close(self):
+        if self.closed:
+            return
+
+        try:
+            if len(self._pending) > 0:
+                self._write_pending()
+            self._output_file.write(self._finish_member())
+        finally:
+            self._output_file.close()
+
+def open_output(path: str, compression: Compressions) -> IO:
+    """
+    Arguments:
+        path {str} -- Path to the output file.
+        compression {Compressions} -- Compression of the file.
+
+    Returns:
+        IO -- The output file opened for appending text.
+    """
+    if compression == Compressions.NONE:
+        return open(path, "a")
+
+    return CompressedOutputFile(path, compression)
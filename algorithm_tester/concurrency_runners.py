@@ -4,11 +4,23 @@ import time
 import multiprocessing
 import concurrent.futures
 import copy
+import collections
+import itertools
+import heapq
+import queue
+import threading
 from enum import Enum
-from typing import IO, Dict, List
-from algorithm_tester_common.tester_dataclasses import AlgTesterContext, Algorithm, Parser, Communicator, InstancesLogger
+from typing import IO, Dict, List, Deque, Tuple, Iterator, Callable
+from algorithm_tester_common.tester_dataclasses import AlgTesterContext, Algorithm, Parser, Communicator, InstancesLogger, InstancesIndex, ResultSink
 from algorithm_tester.plugins import plugins
-from algorithm_tester.helpers import curr_time_millis
+from algorithm_tester.helpers import ShardModes, curr_time_millis, is_in_shard
+from algorithm_tester.measurements import TimingModes, IsolatedMeasurement, ResourceUsage, wrap_algorithm, measure_adaptive, get_timing_stats, isolate_worker
+from algorithm_tester.writers import BufferedResultsWriter
+from algorithm_tester.sinks import OutputSinks, create_sink
+from algorithm_tester.compression import Compressions, STREAM_END, open_input_file, open_output, get_output_path, is_compressed
+from algorithm_tester.results_cache import ResultsCache, DuplicatesCache
+from algorithm_tester.transports import Transports, SharedChunk, SharedMemoryPool, MAX_ATTACHED, release_attached, load_shared_values, unload_shared_values, shared_memory
+from algorithm_tester.executors import Executors, create_executor, get_num_of_workers, start_watch, stop_watch, get_worker_index, InstanceTimeoutError, WorkerCrashError
 
 """
 Contains logic of all concurrency runners. These provide logic of the application with different types of concurrency.
@@ -50,6 +62,30 @@ def get_click_options(context: AlgTesterContext, algorithm: Algorithm) -> Dict[s
 
     return click_options
 
+def get_algorithm(context: AlgTesterContext, algorithm_name: str) -> Algorithm:
+    """
+    Arguments:
+        context {AlgTesterContext} -- Current application context.
+        algorithm_name {str} -- Name of the algorithm plugin.
+    
+    Returns:
+        Algorithm -- The algorithm plugin. Its columns contain columns the tester adds to results.
+    """
+    return wrap_algorithm(context, plugins.get_algorithm(algorithm_name))
+
+def get_instances_shard(context: AlgTesterContext) -> Tuple[int, int]:
+    """
+    Arguments:
+        context {AlgTesterContext} -- Current application context.
+    
+    Returns:
+        (int, int) -- Index of the current shard and number of all shards if instances are sharded. None otherwise.
+    """
+    if context.shard is None or ShardModes[context.shard_by_name] != ShardModes.INSTANCES:
+        return None
+
+    return context.shard
+
 def get_communicators(context: AlgTesterContext):
     """
     Prepares and returns a list of Communicator instances.
@@ -80,10 +116,331 @@ def create_columns_description_file(context: AlgTesterContext, algorithm: Algori
     with open(f'{context.output_dir}/column_description_{algorithm.get_name()}.dat', "w") as f:
         f.write(f'{" ".join(column_descriptions)}\n')
 
+def open_output_file(context: AlgTesterContext, parser: Parser, output_filename: str, algorithm: Algorithm = None) -> BufferedResultsWriter:
+    """
+    Arguments:
+        context {AlgTesterContext} -- Current application context.
+        parser {Parser} -- Used parser.
+        output_filename {str} -- Name of the output file in the output directory.
+
+    Keyword Arguments:
+        algorithm {Algorithm} -- Algorithm whose results are written. Required by result sinks, they store its columns. (default: {None})
+    
+    Returns:
+        BufferedResultsWriter -- The output file or the result sink of the context opened for appending. Results are written in batches.
+    """
+    if OutputSinks[context.output_sink_name] != OutputSinks.TEXT:
+        sink: ResultSink = create_sink(context, output_filename, algorithm.get_columns())
+
+        return BufferedResultsWriter(sink, None, batch_size=context.write_batch_size, batch_interval=context.write_batch_interval)
+
+    output_path, compression = get_output_path(f'{context.output_dir}/{output_filename}', Compressions[context.output_compression_name])
+    output_file: IO = open_output(output_path, compression)
+
+    return BufferedResultsWriter(output_file, parser, batch_size=context.write_batch_size, batch_interval=context.write_batch_interval)
+
+def copy_instance_values(instance_data: Dict[str, object]) -> Dict[str, object]:
+    """
+    Returns:
+        Dict[str, object] -- Copy of instance data with copies of its mutable values, so algorithms can modify them in place.
+    """
+    return {key: copy.deepcopy(value) if isinstance(value, (list, dict, set)) else value for key, value in instance_data.items()}
+
+def get_input_file_key(context: AlgTesterContext, input_file: IO) -> str:
+    """
+    Arguments:
+        context {AlgTesterContext} -- Current application context.
+        input_file {IO} -- The opened input file.
+    
+    Returns:
+        str -- Identifies the input file in checkpoints. Path of the file relative to the input directory.
+    """
+    return os.path.relpath(input_file.name, context.input_dir)
+
+def get_input_file_size(input_file: IO) -> int:
+    return os.fstat(input_file.fileno()).st_size
+
+def split_input_file(context: AlgTesterContext, parser: Parser, input_file: IO, start: int) -> List[Tuple[int, int]]:
+    """
+    Arguments:
+        context {AlgTesterContext} -- Current application context.
+        parser {Parser} -- Used parser.
+        input_file {IO} -- The opened input file.
+        start {int} -- Offset in the input file where the first range starts.
+    
+    Returns:
+        List[Tuple[int, int]] -- Ranges of the rest of the input file given by the parser. Compressed input files
+        can not be split by the parser, the rest of the decompressed stream is a single range.
+    """
+    if is_compressed(input_file):
+        return [(start, STREAM_END)] if start < STREAM_END else []
+
+    return parser.split_input_file(input_file, start, get_max_in_flight(context))
+
+class CheckpointTracker(object):
+    """
+    Tracks the offset of the last contiguous done instance of one input file for one algorithm.
+
+    Instances are registered in the order they are read from the input file and can be completed in any order.
+    The checkpoint moves only when all instances before it are completed. Failed instances are never completed,
+    so they are computed again when the computation is resumed.
+    """
+
+    def __init__(self, algorithm_name: str, input_file_key: str, file_size: int, offset: int):
+        self.algorithm_name: str = algorithm_name
+        self.input_file_key: str = input_file_key
+        self.file_size: int = file_size
+        self.offset: int = offset
+
+        self._first_ticket: int = 0
+        self._pending: Deque[List[object]] = collections.deque()
+
+    def register(self, end_offset: int) -> int:
+        """
+        Arguments:
+            end_offset {int} -- Offset in the input file right after the registered instance.
+        
+        Returns:
+            int -- Ticket used to complete the instance.
+        """
+        self._pending.append([end_offset, False])
+
+        return self._first_ticket + len(self._pending) - 1
+
+    def complete(self, ticket: int) -> bool:
+        """
+        Arguments:
+            ticket {int} -- Ticket of the completed instance.
+        
+        Returns:
+            bool -- True if the checkpoint moved.
+        """
+        self._pending[ticket - self._first_ticket][1] = True
+
+        moved: bool = False
+        while len(self._pending) > 0 and self._pending[0][1]:
+            self.offset = self._pending.popleft()[0]
+            self._first_ticket += 1
+            moved = True
+
+        return moved
+
+def get_checkpoint_tracker(context: AlgTesterContext, instances_logger: InstancesLogger, algorithm: Algorithm, input_file: IO) -> CheckpointTracker:
+    """
+    Creates a checkpoint tracker which starts at the last persisted checkpoint of the input file.
+    
+    Arguments:
+        context {AlgTesterContext} -- Current application context.
+        instances_logger {InstancesLogger} -- Logger with persisted checkpoints.
+        algorithm {Algorithm} -- Currently tested algorithm.
+        input_file {IO} -- The opened input file.
+    
+    Returns:
+        CheckpointTracker -- Tracker of the input file and algorithm.
+    """
+    input_file_key: str = get_input_file_key(context, input_file)
+    file_size: int = get_input_file_size(input_file)
+    offset: int = 0
+
+    if not context.is_forced:
+        offset = instances_logger.get_checkpoint(algorithm.get_name(), input_file_key, file_size)
+
+    return CheckpointTracker(algorithm.get_name(), input_file_key, file_size, offset)
+
+def complete_checkpoint(instances_logger: InstancesLogger, tracker: CheckpointTracker, ticket: int):
+    """
+    Completes an instance and persists the checkpoint if it moved.
+    """
+    if tracker.complete(ticket):
+        instances_logger.write_checkpoint(tracker.algorithm_name, tracker.input_file_key, tracker.file_size, tracker.offset)
+
+def get_max_in_flight(context: AlgTesterContext) -> int:
+    """
+    Arguments:
+        context {AlgTesterContext} -- Current application context.
+    
+    Returns:
+        int -- How many tasks can be submitted to an executor at once. Defaults to 4 tasks per worker.
+    """
+    if context.max_in_flight is not None:
+        return context.max_in_flight
+
+    return 4 * get_num_of_workers(context)
+
+def submit_bounded(executor: concurrent.futures.Executor, tasks: Iterator[Tuple[object, Callable, Tuple]], max_in_flight: int) -> Iterator[Tuple[object, concurrent.futures.Future]]:
+    """
+    Submits tasks to the executor while keeping at most max_in_flight of them unfinished.
+    New tasks are taken from the iterator only when some submitted task is done.
+    Tasks without a function are already done, their only argument is their result.
+    
+    Arguments:
+        executor {concurrent.futures.Executor} -- Used executor.
+        tasks {Iterator[Tuple[object, Callable, Tuple]]} -- Tasks in a form of (key, function, arguments).
+        max_in_flight {int} -- Maximum number of unfinished tasks.
+    
+    Yields:
+        (object, concurrent.futures.Future) -- Key of a task and its finished future.
+    """
+    tasks = iter(tasks)
+    pending: Dict[concurrent.futures.Future, object] = dict()
+    tasks_remaining: bool = True
+
+    while True:
+        while tasks_remaining and len(pending) < max_in_flight:
+            try:
+                key, func, args = next(tasks)
+            except StopIteration:
+                tasks_remaining = False
+            else:
+                if func is None:
+                    future = concurrent.futures.Future()
+                    future.set_result(args[0])
+                else:
+                    future = executor.submit(func, *args)
+                pending[future] = key
+
+        if len(pending) == 0:
+            return
+
+        done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+        for future in done:
+            yield (pending.pop(future), future)
+
+def with_retries(items: Iterator[object], retries: Deque[object]) -> Iterator[object]:
+    """
+    Yields items and items that are added to retries meanwhile. Retries go first.
+    
+    Arguments:
+        items {Iterator[object]} -- New items.
+        retries {Deque[object]} -- Items that are to be processed again.
+    
+    Yields:
+        object -- Retried or new items.
+    """
+    for item in items:
+        while len(retries) > 0:
+            yield retries.popleft()
+        yield item
+
+    while len(retries) > 0:
+        yield retries.popleft()
+
+class SchedulingPolicies(Enum):
+    """
+    Order in which concurrency runners submit instances.
+
+    FIFO -- Instances are submitted in the order they are read.
+    LPT -- Longest processing time first. Instances within the lookahead window are ordered by their estimated cost, largest first.
+    """
+    FIFO = "fifo"
+    LPT = "lpt"
+
+def schedule_items(context: AlgTesterContext, parser: Parser, items: Iterator[Tuple[object, Algorithm, Dict[str, object]]]) -> Iterator[Tuple[object, Algorithm, Dict[str, object]]]:
+    """
+    Reorders items according to the scheduling policy of the context. 
+    
+    LPT keeps at most lookahead items in a heap and always yields the most expensive one. 
+    Costs are estimated by Parser.get_instance_cost, instances with unknown cost keep their order.
+    
+    Arguments:
+        context {AlgTesterContext} -- Current application context.
+        parser {Parser} -- Used parser.
+        items {Iterator[Tuple[object, Algorithm, Dict[str, object]]]} -- Items in a form of (key, algorithm, instance data).
+    
+    Yields:
+        (object, Algorithm, Dict[str, object]) -- Reordered items.
+    """
+    if SchedulingPolicies[context.schedule_name] == SchedulingPolicies.FIFO:
+        yield from items
+        return
+
+    heap: List[Tuple[float, int, Tuple[object, Algorithm, Dict[str, object]]]] = list()
+    for index, item in enumerate(items):
+        cost: float = parser.get_instance_cost(item[2])
+        heapq.heappush(heap, (-(cost or 0), index, item))
+
+        if len(heap) >= context.lookahead:
+            yield heapq.heappop(heap)[2]
+
+    while len(heap) > 0:
+        yield heapq.heappop(heap)[2]
+
+class ChunkSizer(object):
+    """
+    Chooses how many instances are sent to a worker in one task.
+
+    A fixed chunk size is used if it is provided. Otherwise the size is chosen automatically so that one chunk
+    takes roughly TARGET_CHUNK_TIME seconds to compute. This amortizes the cost of sending tasks to workers for tiny instances.
+    """
+
+    TARGET_CHUNK_TIME: float = 0.05
+    MAX_CHUNK_SIZE: int = 1024
+
+    def __init__(self, chunk_size: int):
+        """
+        Arguments:
+            chunk_size {int} -- Number of instances in one chunk. 0 means the size is chosen automatically.
+        """
+        self._fixed_size: int = chunk_size
+        self._chunk_size: int = chunk_size if chunk_size > 0 else 1
+        self._instance_time: float = None
+
+    def get_chunk_size(self) -> int:
+        return self._chunk_size
+
+    def record(self, num_of_instances: int, elapsed_time: float):
+        """
+        Updates the chunk size using time a chunk took to compute.
+        
+        Arguments:
+            num_of_instances {int} -- Number of instances in the chunk.
+            elapsed_time {float} -- Seconds it took to compute the chunk.
+        """
+        if self._fixed_size > 0 or num_of_instances <= 0:
+            return
+
+        instance_time: float = elapsed_time / num_of_instances
+        if self._instance_time is None:
+            self._instance_time = instance_time
+        else:
+            self._instance_time = 0.8*self._instance_time + 0.2*instance_time
+
+        if self._instance_time <= 0:
+            self._chunk_size = self.MAX_CHUNK_SIZE
+        else:
+            self._chunk_size = max(1, min(self.MAX_CHUNK_SIZE, int(self.TARGET_CHUNK_TIME / self._instance_time)))
+
+    def get_chunks(self, items: Iterator[Tuple[object, Algorithm, Dict[str, object]]]) -> Iterator[List[Tuple[object, Algorithm, Dict[str, object]]]]:
+        """
+        Arguments:
+            items {Iterator[Tuple[object, Algorithm, Dict[str, object]]]} -- Items in a form of (key, algorithm, instance data).
+        
+        Yields:
+            List[Tuple[object, Algorithm, Dict[str, object]]] -- Chunks of items. Size of every chunk is the current chunk size.
+        """
+        items = iter(items)
+        while True:
+            chunk = list(itertools.islice(items, self.get_chunk_size()))
+            if len(chunk) == 0:
+                return
+
+            yield chunk
+
 class Runner(object):
+    results_cache: ResultsCache = None
+    duplicates_cache: DuplicatesCache = None
 
-    def init(self, instances_logger: InstancesLogger):
+    def init(self, instances_logger: InstancesLogger, results_cache: ResultsCache = None, duplicates_cache: DuplicatesCache = None):
         self.instances_logger: InstancesLogger = instances_logger
+        self.results_cache: ResultsCache = results_cache
+        self.duplicates_cache: DuplicatesCache = duplicates_cache
+
+    def get_caches(self) -> List[object]:
+        """
+        Returns:
+            List[object] -- Used caches of solutions, the cache of duplicate instances goes first.
+        """
+        return [cache for cache in (self.duplicates_cache, self.results_cache) if cache is not None]
 
     def compute_results(self, context: AlgTesterContext, input_files: List[str]):
         pass
@@ -135,48 +492,528 @@ class BaseRunner(Runner):
         Returns:
             Dict[str, object] -- Contains result data of the current instance. Used keys are column names specified by the algorithm.
         """
+        if context.check_time and context.isolate:
+            with IsolatedMeasurement() as measurement:
+                solution = self.measure_solution(context, algorithm, parsed_instance_data)
+            solution.update(measurement.get_noise_stats())
+        else:
+            solution = self.measure_solution(context, algorithm, parsed_instance_data)
+
+        if context.instance_timeout is not None:
+            solution.setdefault("timed_out", False)
+
+        return solution
+
+    def get_cached_solution(self, context: AlgTesterContext, algorithm: Algorithm, parsed_instance_data: Dict[str, object]) -> Dict[str, object]:
+        """
+        Returns the solution from caches of the runner, i. e. the solution of a duplicate instance or from the results cache.
+        If it is not cached, it is computed and stored in the caches.
+        
+        Arguments:
+            context {AlgTesterContext} -- Current application context.
+            algorithm {Algorithm} -- Currently tested algorithm.
+            parsed_instance_data {Dict[str, object]} -- Instance data of 1 instance parsed from the instance file.
+        
+        Returns:
+            Dict[str, object] -- Contains result data of the current instance.
+        """
+        caches: List[object] = self.get_caches()
+        if len(caches) == 0:
+            return self.get_solution_for_instance(context, algorithm, parsed_instance_data)
+
+        cache_key: str = caches[0].get_key(context, algorithm, parsed_instance_data)
+        for cache in caches:
+            solution: Dict[str, object] = cache.get_solution(context, cache_key, algorithm, parsed_instance_data)
+            if solution is not None:
+                return solution
+
+        solution = self.get_solution_for_instance(context, algorithm, parsed_instance_data)
+        for cache in caches:
+            cache.put_solution(cache_key, solution)
+
+        return solution
+
+    def time_solution(self, context: AlgTesterContext, algorithm: Algorithm, parsed_instance_data: Dict[str, object]) -> Tuple[Dict[str, object], int]:
+        """
+        Invoke the selected algorithm's perform_algorithm method and measure its time if required.
         
-        if context.check_time:
+        Arguments:
+            context {AlgTesterContext} -- Current application context.
+            algorithm {Algorithm} -- Currently tested algorithm.
+            parsed_instance_data {Dict[str, object]} -- Instance data of 1 instance parsed from the instance file.
+        
+        Returns:
+            (Dict[str, object], int) -- Result data of the current instance and how many times the algorithm was run.
+        """
+        if context.check_time and TimingModes[context.timing_name] == TimingModes.ADAPTIVE:
+            times, solution = measure_adaptive(context, lambda: algorithm._run_perform_algorithm_func(context, parsed_instance_data))
+            solution.update(get_timing_stats(times))
+
+            return solution, len(times)
+        elif context.check_time:
             # Use timeit to get time
             t = timeit.Timer(lambda: algorithm._run_perform_algorithm_func(context, parsed_instance_data))
             elapsed_time, solution = t.timeit(number=context.time_retries)
             solution["elapsed_time"] = round((elapsed_time*1000)/context.time_retries, 10)   # Store in millis
-        else:
-            solution = algorithm._run_perform_algorithm_func(context, parsed_instance_data)
+
+            return solution, context.time_retries
+
+        return algorithm._run_perform_algorithm_func(context, parsed_instance_data), 1
+
+    def measure_solution(self, context: AlgTesterContext, algorithm: Algorithm, parsed_instance_data: Dict[str, object]) -> Dict[str, object]:
+        """
+        Invoke the selected algorithm's perform_algorithm method and measure its time and resources if required.
+        Resources are accounted around all runs of the algorithm, so the accounting is not a part of measured times.
+        
+        Arguments:
+            context {AlgTesterContext} -- Current application context.
+            algorithm {Algorithm} -- Currently tested algorithm.
+            parsed_instance_data {Dict[str, object]} -- Instance data of 1 instance parsed from the instance file.
+        
+        Returns:
+            Dict[str, object] -- Contains result data of the current instance. Used keys are column names specified by the algorithm.
+        """
+        if not context.track_resources and not context.track_memory:
+            return self.time_solution(context, algorithm, parsed_instance_data)[0]
+
+        with ResourceUsage(track_memory=context.track_memory) as usage:
+            solution, runs = self.time_solution(context, algorithm, parsed_instance_data)
+        solution.update(usage.get_resource_stats(runs))
 
         return solution
 
-    def get_parsed_instances_data(self, context: AlgTesterContext, input_file: IO, parser: Parser, algorithm: Algorithm) -> Dict[str, object]:
+    def get_solutions_for_chunk(self, context: AlgTesterContext, chunk: List[Tuple[int, Algorithm, Dict[str, object]]]) -> Tuple[List[object], float]:
         """
-        Parses instances from the input file.
+        Computes solutions of multiple instances in one task. 
+        Computation of every instance is watched so that the worker can be killed if the instance timeout is exceeded.
         
         Arguments:
             context {AlgTesterContext} -- Current application context.
-            input_file {IO} -- The opened input file.
-            parser {Parser} -- Currently used instances parser.
+            chunk {List[Tuple[int, Algorithm, Dict[str, object]]]} -- Instance IDs, algorithms and instance data to compute solutions for.
+        
+        Returns:
+            (List[object], float) -- Solution or raised exception of every instance and seconds it took to compute the whole chunk.
+        """
+        results: List[object] = list()
+        start: float = time.perf_counter()
+
+        for instance_id, algorithm, parsed_instance_data in chunk:
+            start_watch(instance_id)
+            try:
+                results.append(self.get_solution_for_instance(context, algorithm, parsed_instance_data))
+            except Exception as e:
+                results.append(e)
+            finally:
+                stop_watch()
+
+        return (results, time.perf_counter() - start)
+
+    def solve_in_chunks(self, context: AlgTesterContext, executor: concurrent.futures.Executor, items: Iterator[Tuple[object, Algorithm, Dict[str, object]]], 
+            results_cache: ResultsCache = None, duplicates_cache: DuplicatesCache = None) -> Iterator[Tuple[object, object]]:
+        """
+        Computes solutions of instances using the executor. Instances are sent to workers in chunks.
+        At most max_in_flight chunks are submitted at once.
+
+        Workers of the executor must be initialized by init_worker. Tasks refer to algorithms only by their names.
+
+        If an instance exceeds the instance timeout, its solution contains the instance data, timed_out set to True 
+        and elapsed_time set to the timeout in milliseconds. Other instances of its chunk are computed again.
+        Instances of a chunk that was quarantined for killing workers are computed again one by one to find the culprit.
+
+        With the shared memory transport and a process executor, lists of integer tuples are sent to workers in shared memory segments
+        of a pool that lives until all solutions are computed.
+
+        Solutions found in the results cache are returned without sending their instances to workers. Computed solutions are stored in it.
+
+        If duplicates are removed, only one of instances with the same content is sent to workers. Other instances wait for its solution
+        and get its copies with their own identifiers and output files. Solutions are also kept for duplicates that come later.
+        
+        Arguments:
+            context {AlgTesterContext} -- Current application context.
+            executor {concurrent.futures.Executor} -- Used executor.
+            items {Iterator[Tuple[object, Algorithm, Dict[str, object]]]} -- Items in a form of (key, algorithm, instance data).
+
+        Keyword Arguments:
+            results_cache {ResultsCache} -- Opened results cache or None if results are not cached. (default: {None})
+            duplicates_cache {DuplicatesCache} -- Cache of duplicate instances or None if duplicates are not removed. (default: {None})
+        
+        Yields:
+            (object, object) -- Key of an item and its solution or the exception that was raised.
+        """
+        chunk_sizer: ChunkSizer = ChunkSizer(context.chunk_size)
+        algorithms: Dict[str, Algorithm] = dict()
+        instance_ids = itertools.count()
+        # Items of submitted chunks under their instance IDs
+        in_flight: Dict[int, Tuple[object, Algorithm, Dict[str, object]]] = dict()
+        retries: Deque[Tuple[object, Algorithm, Dict[str, object]]] = collections.deque()
+        singles: Deque[Tuple[object, Algorithm, Dict[str, object]]] = collections.deque()
+        # Chunks in shared memory under the first instance ID of their chunk
+        shared_chunks: Dict[int, SharedChunk] = dict()
+        use_shared_memory: bool = Transports[context.transport_name] == Transports.SHARED_MEMORY and shared_memory is not None \
+            and Executors[context.executor_name].is_process()
+        shared_pool: SharedMemoryPool = SharedMemoryPool() if use_shared_memory else None
+        caches: List[object] = [cache for cache in (duplicates_cache, results_cache) if cache is not None]
+        # Keys of computed solutions in the caches under keys of their items
+        cache_keys: Dict[object, str] = dict()
+        # Items waiting for the solution of a computed instance with the same content, under its cache key
+        duplicates: Dict[str, List[Tuple[object, Algorithm, Dict[str, object]]]] = dict() if duplicates_cache is not None else None
+
+        def get_task(chunk):
+            ids: List[int] = list()
+            worker_chunk: List[Tuple[int, str, Dict[str, object]]] = list()
+            for key, algorithm, data in chunk:
+                # Workers already have the algorithm, only its name is sent
+                algorithms[algorithm.get_name()] = algorithm
+                data.pop("algorithm", None)
+
+                instance_id: int = next(instance_ids)
+                in_flight[instance_id] = (key, algorithm, data)
+                ids.append(instance_id)
+                worker_chunk.append((instance_id, algorithm.get_name(), data))
+
+            if use_shared_memory:
+                shared_chunk: SharedChunk = SharedChunk([data for _, _, data in worker_chunk], shared_pool)
+                shared_chunks[ids[0]] = shared_chunk
+                worker_chunk = [(instance_id, algorithm_name, shared_data) for (instance_id, algorithm_name, _), shared_data in zip(worker_chunk, shared_chunk.instances_data)]
+
+            return (ids, solve_chunk_in_worker, (worker_chunk,))
+
+        def get_cached_task(chunk):
+            ids: List[int] = list()
+            solutions: List[Dict[str, object]] = list()
+            for (key, algorithm, data), solution in chunk:
+                algorithms[algorithm.get_name()] = algorithm
+
+                instance_id: int = next(instance_ids)
+                in_flight[instance_id] = (key, algorithm, data)
+                ids.append(instance_id)
+                solutions.append(solution)
+
+            # Task is done without the executor, it has no elapsed time
+            return (ids, None, ((solutions, None),))
+
+        def get_tasks(items):
+            for chunk in chunk_sizer.get_chunks(with_retries(items, retries)):
+                while len(singles) > 0:
+                    yield get_task([singles.popleft()])
+
+                if len(caches) > 0:
+                    cached, chunk = self.split_cached(context, caches, chunk, cache_keys, duplicates)
+                    if len(cached) > 0:
+                        yield get_cached_task(cached)
+                    if len(chunk) == 0:
+                        continue
+
+                yield get_task(chunk)
+
+            while len(singles) > 0:
+                yield get_task([singles.popleft()])
+
+        try:
+            while True:
+                for ids, future in submit_bounded(executor, get_tasks(items), get_max_in_flight(context)):
+                    chunk_items = [in_flight.pop(instance_id) for instance_id in ids]
+                    shared_chunk: SharedChunk = shared_chunks.pop(ids[0], None)
+
+                    try:
+                        results, elapsed_time = future.result()
+                        if shared_chunk is not None:
+                            shared_chunk.restore_results(results, [data for _, _, data in chunk_items])
+                    except InstanceTimeoutError as e:
+                        for instance_id, (key, algorithm, data) in zip(ids, chunk_items):
+                            if instance_id == e.detail:
+                                print(f'Algorithm {algorithm.get_name()}. Instance timed out after {e.timeout} seconds.')
+                                waiting: List[Tuple[object, Algorithm, Dict[str, object]]] = self.pop_duplicates(duplicates, cache_keys.pop(key, None))
+                                for item_key, item_algorithm, item_data in [(key, algorithm, data)] + waiting:
+                                    yield (item_key, self.get_timed_out_solution(item_algorithm, item_data, e.timeout))
+                            else:
+                                retries.append((key, algorithm, data))
+                        continue
+                    except WorkerCrashError as e:
+                        if len(chunk_items) > 1:
+                            singles.extend(chunk_items)
+                            continue
+                        results = [e]
+                    except Exception as e:
+                        results = [e]*len(ids)
+                    else:
+                        if elapsed_time is not None:
+                            chunk_sizer.record(len(ids), elapsed_time)
+                    finally:
+                        if shared_chunk is not None:
+                            shared_chunk.close()
+
+                    # Solutions are stored and copied before they are written, parsers may modify them
+                    solved: List[Tuple[object, object]] = list()
+                    for (key, _, _), result in zip(chunk_items, results):
+                        cache_key: str = cache_keys.pop(key, None)
+                        if not isinstance(result, Exception):
+                            result["algorithm"] = algorithms[result["algorithm_name"]]
+
+                            if cache_key is not None:
+                                for cache in caches:
+                                    cache.put_solution(cache_key, result)
+
+                        solved.append((key, result))
+                        for item_key, item_algorithm, item_data in self.pop_duplicates(duplicates, cache_key):
+                            if isinstance(result, Exception):
+                                solved.append((item_key, result))
+                            else:
+                                solved.append((item_key, duplicates_cache.copy_solution(context, result, item_algorithm, item_data)))
+
+                    yield from solved
+
+                if len(retries) == 0 and len(singles) == 0:
+                    return
+
+                # Instances of chunks that failed at the very end are computed in another pass
+                items = iter(())
+        finally:
+            if shared_pool is not None:
+                shared_pool.close()
+
+    def split_cached(self, context: AlgTesterContext, caches: List[object], chunk: List[Tuple[object, Algorithm, Dict[str, object]]], 
+            cache_keys: Dict[object, str], duplicates: Dict[str, List[Tuple[object, Algorithm, Dict[str, object]]]] = None
+            ) -> Tuple[List[Tuple[Tuple[object, Algorithm, Dict[str, object]], Dict[str, object]]], List[Tuple[object, Algorithm, Dict[str, object]]]]:
+        """
+        Finds solutions of items of a chunk in the caches. Duplicates of instances that are being computed are put aside.
+        
+        Arguments:
+            context {AlgTesterContext} -- Current application context.
+            caches {List[object]} -- Used caches of solutions, e. g. the opened results cache.
+            chunk {List[Tuple[object, Algorithm, Dict[str, object]]]} -- Items in a form of (key, algorithm, instance data).
+            cache_keys {Dict[object, str]} -- Filled with cache keys of items that are to be computed, under keys of the items.
+
+        Keyword Arguments:
+            duplicates {Dict[str, List[Tuple[object, Algorithm, Dict[str, object]]]]} -- Filled with items waiting for a computed instance 
+                with the same content, under its cache key. None if duplicates are not removed. (default: {None})
+        
+        Returns:
+            (List[Tuple[Tuple[object, Algorithm, Dict[str, object]], Dict[str, object]]], List[Tuple[object, Algorithm, Dict[str, object]]]) -- 
+            Cached items with their solutions and items that are to be computed.
+        """
+        cached: List[Tuple[Tuple[object, Algorithm, Dict[str, object]], Dict[str, object]]] = list()
+        uncached: List[Tuple[object, Algorithm, Dict[str, object]]] = list()
+
+        for item in chunk:
+            key, algorithm, data = item
+            if key in cache_keys:
+                # Retried item, it was looked up already
+                uncached.append(item)
+                continue
+
+            cache_key: str = caches[0].get_key(context, algorithm, data)
+            solution: Dict[str, object] = None
+            for cache in caches:
+                solution = cache.get_solution(context, cache_key, algorithm, data)
+                if solution is not None:
+                    break
+
+            if solution is not None:
+                cached.append((item, solution))
+            elif duplicates is not None and cache_key in duplicates:
+                duplicates[cache_key].append(item)
+            else:
+                cache_keys[key] = cache_key
+                uncached.append(item)
+                if duplicates is not None:
+                    duplicates[cache_key] = list()
+
+        return (cached, uncached)
+
+    def pop_duplicates(self, duplicates: Dict[str, List[Tuple[object, Algorithm, Dict[str, object]]]], cache_key: str) -> List[Tuple[object, Algorithm, Dict[str, object]]]:
+        """
+        Arguments:
+            duplicates {Dict[str, List[Tuple[object, Algorithm, Dict[str, object]]]]} -- Items waiting for computed instances. None if duplicates are not removed.
+            cache_key {str} -- Cache key of a computed instance or None.
+        
+        Returns:
+            List[Tuple[object, Algorithm, Dict[str, object]]] -- Items that were waiting for the instance, they are not waiting anymore.
+        """
+        if duplicates is None or cache_key is None:
+            return list()
+
+        return duplicates.pop(cache_key, list())
+
+    def get_timed_out_solution(self, algorithm: Algorithm, parsed_instance_data: Dict[str, object], timeout: float) -> Dict[str, object]:
+        """
+        Arguments:
+            algorithm {Algorithm} -- Algorithm that did not finish in time.
+            parsed_instance_data {Dict[str, object]} -- Instance data of the instance that timed out.
+            timeout {float} -- Time budget of the instance in seconds.
+        
+        Returns:
+            Dict[str, object] -- Solution written instead of the result of the algorithm.
+        """
+        solution: Dict[str, object] = dict(parsed_instance_data)
+        solution["algorithm"] = algorithm
+        solution["timed_out"] = True
+        solution["elapsed_time"] = timeout*1000     # Store in millis
+
+        return solution
+
+    def get_instance_ranges(self, context: AlgTesterContext, parser: Parser, algorithm: Algorithm, input_path: str, start: int, end: int) -> List[Tuple[int, int]]:
+        """
+        Parses a byte range of an input file and returns ranges of its single instances.
+        
+        Arguments:
+            context {AlgTesterContext} -- Current application context.
+            parser {Parser} -- Used parser.
             algorithm {Algorithm} -- Currently tested algorithm.
+            input_path {str} -- Path to the input file.
+            start {int} -- Start of the range.
+            end {int} -- End of the range.
         
         Returns:
-            Dict[str, object] -- One parsed instance from the input file.
+            List[Tuple[int, int]] -- Start and end offsets of instances that start in the range.
         """
-        output = list()
-        parsed_instance_data = parser.get_next_instance(input_file)
+        instance_ranges: List[Tuple[int, int]] = list()
+
+        with open_input_file(input_path) as input_file:
+            input_file.seek(start)
+            instance_start: int = start
+
+            for _, instance_end in self.get_parsed_instances(context, input_file, parser, algorithm):
+                instance_ranges.append((instance_start, instance_end))
+                if instance_end >= end:
+                    break
+                instance_start = instance_end
+
+        return instance_ranges
+
+    def get_instance_at(self, context: AlgTesterContext, parser: Parser, algorithm: Algorithm, input_path: str, offset: int) -> Dict[str, object]:
+        """
+        Returns:
+            Dict[str, object] -- Instance data of the instance that starts at the offset of the input file.
+        """
+        with open_input_file(input_path) as input_file:
+            input_file.seek(offset)
+
+            return next(self.get_parsed_instances(context, input_file, parser, algorithm))[0]
+
+    def solve_ranges(self, context: AlgTesterContext, executor: concurrent.futures.Executor, parser: Parser, ranges: Iterator[Tuple[object, str, int, int, Algorithm]]) -> Iterator[Tuple[object, List[object], bool]]:
+        """
+        Computes solutions of instances that are parsed by workers. Every task is a byte range of an input file.
+        At most max_in_flight ranges are submitted at once.
+
+        Workers of the executor must be initialized by init_worker with the parser. Instances done before the computation started are skipped by workers.
+
+        If an instance of a range exceeds the instance timeout, its timed out solution is returned and the rest of the range is computed again.
+        A range that was quarantined for killing workers is split into single instances to find the culprit.
+        
+        Arguments:
+            context {AlgTesterContext} -- Current application context.
+            executor {concurrent.futures.Executor} -- Used executor.
+            parser {Parser} -- Used parser.
+            ranges {Iterator[Tuple[object, str, int, int, Algorithm]]} -- Ranges in a form of (key, input file path, start, end, algorithm).
+        
+        Yields:
+            (object, List[object], bool) -- Key of a range, solutions or raised exceptions of some of its instances 
+            and True if all instances of the range are done without an exception.
+        """
+        # Number of unfinished parts and failure flag of every range
+        parts: Dict[object, List[object]] = dict()
+        retries: Deque[Tuple[object, str, int, int, Algorithm]] = collections.deque()
+
+        def get_tasks(ranges):
+            for item in with_retries(ranges, retries):
+                key, input_path, start, end, algorithm = item
+                if key not in parts:
+                    parts[key] = [1, False]
+
+                yield (item, solve_range_in_worker, (input_path, start, end, algorithm.get_name()))
+
+        while True:
+            for (key, input_path, start, end, algorithm), future in submit_bounded(executor, get_tasks(ranges), get_max_in_flight(context)):
+                state: List[object] = parts[key]
+                state[0] -= 1
+
+                try:
+                    results, _ = future.result()
+                except InstanceTimeoutError as e:
+                    instance_start, instance_end = e.detail
+                    print(f'Algorithm {algorithm.get_name()}. Instance timed out after {e.timeout} seconds.')
+                    instance_data: Dict[str, object] = self.get_instance_at(context, parser, algorithm, input_path, instance_start)
+                    results = [self.get_timed_out_solution(algorithm, instance_data, e.timeout)]
+
+                    # Results of other instances of the range were lost
+                    for part_start, part_end in ((start, instance_start), (instance_end, end)):
+                        if part_start < part_end:
+                            state[0] += 1
+                            retries.append((key, input_path, part_start, part_end, algorithm))
+                except WorkerCrashError as e:
+                    instance_ranges: List[Tuple[int, int]] = self.get_instance_ranges(context, parser, algorithm, input_path, start, end)
+                    if len(instance_ranges) > 1:
+                        state[0] += len(instance_ranges)
+                        retries.extend([(key, input_path, instance_start, instance_end, algorithm) for instance_start, instance_end in instance_ranges])
+                        results = list()
+                    else:
+                        results = [e]
+                except Exception as e:
+                    results = [e]
+
+                for result in results:
+                    if isinstance(result, Exception):
+                        state[1] = True
+                    else:
+                        result["algorithm"] = algorithm
+
+                range_finished: bool = state[0] == 0
+                if range_finished:
+                    del parts[key]
+
+                yield (key, results, range_finished and not state[1])
+
+            if len(retries) == 0:
+                return
+
+            # Parts of ranges that failed at the very end are computed in another pass
+            ranges = iter(())
+
+    def get_parsed_instances(self, context: AlgTesterContext, input_file: IO, parser: Parser, algorithm: Algorithm) -> Iterator[Tuple[Dict[str, object], int]]:
+        """
+        Lazily parses instances from the current position of the input file. Instances of other shards are skipped.
         
+        Arguments:
+            context {AlgTesterContext} -- Current application context.
+            input_file {IO} -- The opened input file.
+            parser {Parser} -- Currently used instances parser.
+            algorithm {Algorithm} -- Currently tested algorithm.
+        
+        Yields:
+            (Dict[str, object], int) -- One parsed instance from the input file and offset right after it.
+        """
         click_options: Dict[str, object] = get_click_options(context, algorithm)
         
         output_filename: str = parser.get_output_file_name(context, input_file, click_options)
+        shard: Tuple[int, int] = get_instances_shard(context)
 
+        parsed_instance_data = parser.get_next_instance(input_file)
         while parsed_instance_data is not None:
-            parsed_instance_data["output_filename"] = output_filename
-            parsed_instance_data["algorithm_name"] = algorithm.get_name()
-            parsed_instance_data["algorithm"] = algorithm
-            parsed_instance_data.update(context.extra_options)
+            if is_in_shard(parser.get_instance_identifier(parsed_instance_data), shard):
+                parsed_instance_data["output_filename"] = output_filename
+                parsed_instance_data["algorithm_name"] = algorithm.get_name()
+                parsed_instance_data["algorithm"] = algorithm
+                parsed_instance_data.update(context.extra_options)
 
-            output.append(parsed_instance_data)
+                yield (parsed_instance_data, input_file.tell())
 
             parsed_instance_data = parser.get_next_instance(input_file)
 
-        return output
+    def get_parsed_instances_data(self, context: AlgTesterContext, input_file: IO, parser: Parser, algorithm: Algorithm) -> List[Dict[str, object]]:
+        """
+        Parses instances from the input file.
+        
+        Arguments:
+            context {AlgTesterContext} -- Current application context.
+            input_file {IO} -- The opened input file.
+            parser {Parser} -- Currently used instances parser.
+            algorithm {Algorithm} -- Currently tested algorithm.
+        
+        Returns:
+            List[Dict[str, object]] -- All parsed instances from the input file.
+        """
+        return [parsed_instance_data for parsed_instance_data, _ in self.get_parsed_instances(context, input_file, parser, algorithm)]
 
     def run_tester_for_file_algorithm(self, context: AlgTesterContext, parser: Parser, algorithm: Algorithm, communicators: Communicator, input_file: IO, notification_vars: Dict[str, object]):
         """
@@ -193,27 +1030,38 @@ class BaseRunner(Runner):
         click_options = get_click_options(context, algorithm)
         output_filename: str = parser.get_output_file_name(context, input_file, click_options)
 
-        with open(f'{context.output_dir}/{output_filename}', "a") as output_file:
-            for parsed_instance_data in self.get_parsed_instances_data(context, input_file, parser, algorithm):
+        # Skip instances that are done according to the checkpoint
+        tracker: CheckpointTracker = get_checkpoint_tracker(context, self.instances_logger, algorithm, input_file)
+        input_file.seek(tracker.offset)
+
+        with open_output_file(context, parser, output_filename, algorithm) as output_file:
+            for parsed_instance_data, end_offset in self.get_parsed_instances(context, input_file, parser, algorithm):
+                ticket: int = tracker.register(end_offset)
+
                 # Use solution only if no exception was raised
                 try:
                     if not context.is_forced:
                         # Check if instance is already solved
                         instance_identifier: str = parser._get_complete_instance_identifier(algorithm, parsed_instance_data)
                         if self.instances_logger.is_instance_already_done(instance_identifier):
+                            complete_checkpoint(self.instances_logger, tracker, ticket)
                             continue
 
-                    solution = self.get_solution_for_instance(context, algorithm, parsed_instance_data)
+                    solution = self.get_cached_solution(context, algorithm, parsed_instance_data)
                     instance_identifier: str = parser._get_complete_instance_identifier(algorithm, solution)
                 except Exception as e:
                     print(f'Algorithm {algorithm.get_name()}. Exception occured: {e}')
                     notification_vars["instances_failed"] += 1
                 else:
-                    parser.write_result_to_file(output_file, solution)
+                    output_file.write_result(solution)
                     notification_vars["instances_done"] += 1
-                    self.instances_logger.write_instance_to_log(instance_identifier)
+                    self.instances_logger.write_instance_to_log(instance_identifier, output_file)
+                    complete_checkpoint(self.instances_logger, tracker, ticket)
                     self.notify_communicators(context, communicators, solution, notification_vars)
 
+            # Persist log entries while the output file is still opened
+            self.instances_logger.commit()
+
     def run_tester_for_file(self, context: AlgTesterContext, input_file_path: str, notification_vars: Dict[str, object]):
         """
         Compute results for the given input file.
@@ -227,10 +1075,9 @@ class BaseRunner(Runner):
         solution = dict()
         
         print(f'Currently testing file \'{input_file_path.split("/")[-1]}\'. Started {time.strftime("%H:%M:%S %d.%m.")}')
-        with open(input_file_path, "r") as input_file:
+        with open_input_file(input_file_path) as input_file:
             for algorithm_name in context.algorithm_names:
-                input_file.seek(0)
-                algorithm: Algorithm = plugins.get_algorithm(algorithm_name)
+                algorithm: Algorithm = get_algorithm(context, algorithm_name)
 
                 create_columns_description_file(context, algorithm)
                 self.run_tester_for_file_algorithm(context, parser, algorithm, communicators, input_file, notification_vars)
@@ -247,6 +1094,9 @@ class BaseRunner(Runner):
         """
 
         notification_vars: Dict[str, object] = init_notification_vars(context.is_forced, self.instances_logger.get_num_of_done_instances())
+
+        if context.isolate:
+            isolate_worker(0)
         
         for index, filename in enumerate(sorted(input_files)):
             if context.max_files_to_check is not None and index >= context.max_files_to_check:
@@ -255,6 +1105,110 @@ class BaseRunner(Runner):
             input_file_path: str = f'{context.input_dir}/{filename}'
             self.run_tester_for_file(context, input_file_path, notification_vars)
 
+_worker_runner: BaseRunner = BaseRunner()
+_worker_context: AlgTesterContext = None
+_worker_algorithms: Dict[str, Algorithm] = dict()
+_worker_parser: Parser = None
+_worker_done_instances: Dict[str, InstancesIndex] = dict()
+
+def init_worker(context: AlgTesterContext, algorithms: List[Algorithm], parser: Parser = None, done_instances: Dict[str, InstancesIndex] = None):
+    """
+    Initializer of executor workers. Keeps a copy of the context and instances of used algorithms for the whole life of the worker,
+    so they are not sent with every task and algorithms can keep their precomputed data between instances.
+    
+    Arguments:
+        context {AlgTesterContext} -- Current application context.
+        algorithms {List[Algorithm]} -- All used algorithms.
+    
+    Keyword Arguments:
+        parser {Parser} -- Used parser. Required if workers parse instances. (default: {None})
+        done_instances {Dict[str, InstancesIndex]} -- Snapshot of done instances that workers skip when they parse instances. (default: {None})
+    """
+    global _worker_context, _worker_algorithms, _worker_parser, _worker_done_instances
+
+    _worker_context = copy.copy(context)
+    _worker_algorithms = {algorithm.get_name(): algorithm for algorithm in algorithms}
+    _worker_parser = parser
+    _worker_done_instances = done_instances or dict()
+
+    if context.isolate:
+        # Only process workers have their own CPU
+        isolate_worker(get_worker_index())
+
+def solve_chunk_in_worker(chunk: List[Tuple[int, str, Dict[str, object]]]) -> Tuple[List[object], float]:
+    """
+    Computes solutions of a chunk of instances in a worker initialized by init_worker.
+    
+    Arguments:
+        chunk {List[Tuple[int, str, Dict[str, object]]]} -- Instance IDs, names of algorithms and instance data to compute solutions for.
+    
+    Returns:
+        (List[object], float) -- Solution or raised exception of every instance and seconds it took to compute the whole chunk.
+        Solutions do not contain the algorithm instance.
+    """
+    algorithms_chunk: List[Tuple[int, Algorithm, Dict[str, object]]] = list()
+    loaded_values: List[Dict[str, object]] = list()
+    for instance_id, algorithm_name, data in chunk:
+        algorithm: Algorithm = _worker_algorithms[algorithm_name]
+        data["algorithm"] = algorithm
+        # Values in shared memory are read once, not whenever the timed algorithm indexes them
+        loaded_values.append(load_shared_values(data))
+        algorithms_chunk.append((instance_id, algorithm, data))
+
+    results, elapsed_time = _worker_runner.get_solutions_for_chunk(_worker_context, algorithms_chunk)
+
+    for result, loaded in zip(results, loaded_values):
+        if not isinstance(result, Exception):
+            result.pop("algorithm", None)
+        unload_shared_values(result, loaded)
+
+    # Segments are reused by next chunks, the parent process frees them when the computation ends
+    release_attached(keep=MAX_ATTACHED)
+
+    return (results, elapsed_time)
+
+def solve_range_in_worker(input_path: str, start: int, end: int, algorithm_name: str) -> Tuple[List[object], float]:
+    """
+    Parses instances that start in a byte range of an input file and computes their solutions in a worker initialized by init_worker.
+    Instances that were done before the computation started are skipped.
+    
+    Arguments:
+        input_path {str} -- Path to the input file.
+        start {int} -- Start of the range.
+        end {int} -- End of the range.
+        algorithm_name {str} -- Name of the used algorithm.
+    
+    Returns:
+        (List[object], float) -- Solution or raised exception of every computed instance and seconds it took to compute the whole range.
+        Solutions do not contain the algorithm instance.
+    """
+    algorithm: Algorithm = _worker_algorithms[algorithm_name]
+    done_instances: InstancesIndex = _worker_done_instances.get(algorithm_name)
+    results: List[object] = list()
+    start_time: float = time.perf_counter()
+
+    with open_input_file(input_path) as input_file:
+        input_file.seek(start)
+        instance_start: int = start
+
+        for parsed_instance_data, instance_end in _worker_runner.get_parsed_instances(_worker_context, input_file, _worker_parser, algorithm):
+            if done_instances is None or _worker_parser._get_complete_instance_identifier(algorithm, parsed_instance_data) not in done_instances:
+                start_watch((instance_start, instance_end))
+                try:
+                    solution = _worker_runner.get_solution_for_instance(_worker_context, algorithm, parsed_instance_data)
+                    solution.pop("algorithm", None)
+                    results.append(solution)
+                except Exception as e:
+                    results.append(e)
+                finally:
+                    stop_watch()
+
+            if instance_end >= end:
+                break
+            instance_start = instance_end
+
+    return (results, time.perf_counter() - start_time)
+
 class ConcurrentFilesRunner(Runner):
     """
     Processes multiple files concurrently.
@@ -262,6 +1216,7 @@ class ConcurrentFilesRunner(Runner):
     Technically reads first instances of all files and stores them for multiprocessing. 
     Then reads second instances of all files and stores them for multiprocessing. 
     This repeats until no new instances are left in any input file.
+    Instances are read only when there is space for them in the executor.
     
     """
     _base_runner: BaseRunner = BaseRunner()
@@ -277,7 +1232,7 @@ class ConcurrentFilesRunner(Runner):
             if not file.closed:
                 file.close()
 
-    def get_base_instances(self, input_files: Dict[str, IO], parser: Parser) -> (Dict[str, object], IO):
+    def get_base_instances(self, input_files: Dict[str, IO], parser: Parser, shard: Tuple[int, int] = None) -> (Dict[str, object], IO):
         """
         Reads instance data directly from all input files.
         
@@ -285,6 +1240,9 @@ class ConcurrentFilesRunner(Runner):
             input_files {Dict[str, IO]} -- All opened input files.
             parser {Parser} -- Used parser.
         
+        Keyword Arguments:
+            shard {Tuple[int, int]} -- Only instances of this shard are read. (default: {None})
+        
         Yields:
             (Dict[str, object], IO) -- Opened input file and instance data of one of its instances.
         """
@@ -303,11 +1261,12 @@ class ConcurrentFilesRunner(Runner):
 
                 if instance is not None:
                     instances_remaining = True
-                    yield (instance, file)
+                    if is_in_shard(parser.get_instance_identifier(instance), shard):
+                        yield (instance, file)
             
         print
 
-    def get_data_for_executor(self, context: AlgTesterContext, input_files_dict: Dict[str, IO], parser: Parser, algorithms: List[Algorithm]):
+    def get_instances_for_executor(self, context: AlgTesterContext, input_files_dict: Dict[str, IO], parser: Parser, algorithms: List[Algorithm]) -> Iterator[Tuple[Algorithm, Dict[str, object], IO, int]]:
         """
         Fully prepares instance data that is to be used for an algorithm.
         
@@ -318,42 +1277,185 @@ class ConcurrentFilesRunner(Runner):
             algorithms {List[Algorithm]} -- List of all used algorithms.
         
         Yields:
-            (Algorithm, Dict[str, object]) -- Used algorithm and full instance data.
+            (Algorithm, Dict[str, object], IO, int) -- Used algorithm, full instance data, its input file and offset right after the instance.
         """
-        for (instance_data, input_file) in self.get_base_instances(input_files_dict, parser):
+        output_filenames: Dict[Tuple[str, str], str] = dict()
+        # Process workers get their own copy of instance data, other executors would share parsed values between algorithms
+        copy_values: bool = len(algorithms) > 1 and not Executors[context.executor_name].is_process()
+
+        for (instance_data, input_file) in self.get_base_instances(input_files_dict, parser, shard=get_instances_shard(context)):
+            end_offset: int = input_file.tell()
+
             # Give all instances to the executor
             for alg in algorithms:
-                click_options: Dict[str, object] = get_click_options(context, alg)
-                output_filename: str = parser.get_output_file_name(context, input_file, click_options)
-
-                full_instance_data = copy.deepcopy(instance_data)
-                full_instance_data["output_filename"] = output_filename
+                key: Tuple[str, str] = (alg.get_name(), input_file.name)
+                if key not in output_filenames:
+                    click_options: Dict[str, object] = get_click_options(context, alg)
+                    output_filenames[key] = parser.get_output_file_name(context, input_file, click_options)
+
+                # Only top-level keys differ between algorithms, parsed values are shared without copying
+                full_instance_data = copy_instance_values(instance_data) if copy_values else dict(instance_data)
+                full_instance_data["output_filename"] = output_filenames[key]
                 full_instance_data["algorithm_name"] = alg.get_name()
                 full_instance_data["algorithm"] = alg
-                yield (alg, full_instance_data)
+                yield (alg, full_instance_data, input_file, end_offset)
+
+    def get_data_for_executor(self, context: AlgTesterContext, input_files_dict: Dict[str, IO], parser: Parser, algorithms: List[Algorithm]):
+        """
+        Fully prepares instance data that is to be used for an algorithm.
+        
+        Arguments:
+            context {AlgTesterContext} -- Used context.
+            input_files_dict {Dict[str, IO]} -- All currently opened input files.
+            parser {Parser} -- Used parser.
+            algorithms {List[Algorithm]} -- List of all used algorithms.
+        
+        Yields:
+            (Algorithm, Dict[str, object]) -- Used algorithm and full instance data.
+        """
+        for (alg, full_instance_data, _, _) in self.get_instances_for_executor(context, input_files_dict, parser, algorithms):
+            yield (alg, full_instance_data)
+
+    def prepare_checkpoint_trackers(self, context: AlgTesterContext, input_files_dict: Dict[str, IO], algorithms: List[Algorithm]) -> Dict[Tuple[str, str], CheckpointTracker]:
+        """
+        Creates checkpoint trackers for all input files and algorithms. 
+        Each input file is moved to the lowest checkpoint of all algorithms.
+        
+        Arguments:
+            context {AlgTesterContext} -- Used context.
+            input_files_dict {Dict[str, IO]} -- All currently opened input files.
+            algorithms {List[Algorithm]} -- List of all used algorithms.
+        
+        Returns:
+            Dict[Tuple[str, str], CheckpointTracker] -- Trackers under (algorithm name, input file name) keys.
+        """
+        trackers: Dict[Tuple[str, str], CheckpointTracker] = dict()
+
+        for input_file in input_files_dict.values():
+            offsets: List[int] = list()
+            for alg in algorithms:
+                tracker: CheckpointTracker = get_checkpoint_tracker(context, self.instances_logger, alg, input_file)
+                trackers[(alg.get_name(), input_file.name)] = tracker
+                offsets.append(tracker.offset)
+
+            input_file.seek(min(offsets, default=0))
+
+        return trackers
 
-    def write_result(self, context: AlgTesterContext, parser: Parser, output_files: Dict[str, IO], data: Dict[str, object]):
+    def write_result(self, context: AlgTesterContext, parser: Parser, output_files: Dict[str, BufferedResultsWriter], data: Dict[str, object]):
         """
         Writes results into an appropriate output file.
         
         Arguments:
             context {AlgTesterContext} -- Used context.
             parser {Parser} -- Used parser.
-            output_files {Dict[str, IO]} -- Dictionary of all currently opened output files.
+            output_files {Dict[str, BufferedResultsWriter]} -- Dictionary of all currently opened output files.
             data {Dict[str, object]} -- Computation results of an instance.
         """
         output_filename: str = data["output_filename"]
 
         if output_filename not in output_files:
             # Output file not yet opened
-            output_files[output_filename] = open(f'{context.output_dir}/{output_filename}', "a")
+            output_files[output_filename] = open_output_file(context, parser, output_filename, data.get("algorithm"))
+        
+        output_files[output_filename].write_result(data)
+
+    def get_tasks(self, context: AlgTesterContext, input_files_dict: Dict[str, IO], parser: Parser, algorithms: List[Algorithm], trackers: Dict[Tuple[str, str], CheckpointTracker]) -> Iterator[Tuple[Tuple[CheckpointTracker, int], Algorithm, Dict[str, object]]]:
+        """
+        Lazily prepares tasks for the executor. Already done instances are skipped.
+        
+        Arguments:
+            context {AlgTesterContext} -- Used context.
+            input_files_dict {Dict[str, IO]} -- All currently opened input files.
+            parser {Parser} -- Used parser.
+            algorithms {List[Algorithm]} -- List of all used algorithms.
+            trackers {Dict[Tuple[str, str], CheckpointTracker]} -- Checkpoint trackers of all input files and algorithms.
+        
+        Yields:
+            ((CheckpointTracker, int), Algorithm, Dict[str, object]) -- Checkpoint tracker and ticket of the instance, used algorithm and instance data.
+        """
+        for (alg, instance_data, input_file, end_offset) in self.get_instances_for_executor(context, input_files_dict, parser, algorithms):
+            tracker: CheckpointTracker = trackers[(alg.get_name(), input_file.name)]
+            if end_offset <= tracker.offset:
+                # Instance is before the checkpoint of this algorithm
+                continue
+            ticket: int = tracker.register(end_offset)
+
+            if not context.is_forced:
+                # Check if instance is already solved
+                instance_identifier: str = parser._get_complete_instance_identifier(alg, instance_data)
+                if self.instances_logger.is_instance_already_done(instance_identifier):
+                    complete_checkpoint(self.instances_logger, tracker, ticket)
+                    continue
+
+            yield ((tracker, ticket), alg, instance_data)
+
+    def get_ranges(self, context: AlgTesterContext, input_files_dict: Dict[str, IO], parser: Parser, algorithms: List[Algorithm], trackers: Dict[Tuple[str, str], CheckpointTracker]) -> Iterator[Tuple[Tuple[CheckpointTracker, int], str, int, int, Algorithm]]:
+        """
+        Splits the rest of all input files after checkpoints of all algorithms into byte ranges that workers parse themselves.
+        Ranges of different input files and algorithms are interleaved.
+        
+        Arguments:
+            context {AlgTesterContext} -- Used context.
+            input_files_dict {Dict[str, IO]} -- All currently opened input files.
+            parser {Parser} -- Used parser.
+            algorithms {List[Algorithm]} -- List of all used algorithms.
+            trackers {Dict[Tuple[str, str], CheckpointTracker]} -- Checkpoint trackers of all input files and algorithms.
+        
+        Yields:
+            ((CheckpointTracker, int), str, int, int, Algorithm) -- Checkpoint tracker and ticket of the range, path to the input file, 
+            start and end of the range and used algorithm.
+        """
+        all_ranges: List[List[Tuple[Tuple[CheckpointTracker, int], str, int, int, Algorithm]]] = list()
+
+        for input_file in input_files_dict.values():
+            for alg in algorithms:
+                tracker: CheckpointTracker = trackers[(alg.get_name(), input_file.name)]
+                ranges = split_input_file(context, parser, input_file, tracker.offset)
+                all_ranges.append([((tracker, tracker.register(end)), input_file.name, start, end, alg) for start, end in ranges])
+
+        for ranges in itertools.zip_longest(*all_ranges):
+            yield from [item for item in ranges if item is not None]
+
+    def write_solution(self, context: AlgTesterContext, parser: Parser, communicators: List[Communicator], notification_vars: Dict[str, object], output_files_dict: Dict[str, IO], result: object) -> bool:
+        """
+        Writes a result into an appropriate output file and notifies communicators. Raised exceptions are counted as failed instances.
+        
+        Arguments:
+            context {AlgTesterContext} -- Used context.
+            parser {Parser} -- Used parser.
+            communicators {List[Communicator]} -- Used communicators.
+            notification_vars {Dict[str, object]} -- Notification variables.
+            output_files_dict {Dict[str, IO]} -- Dictionary of all currently opened output files.
+            result {object} -- Solution of an instance or the exception that was raised.
         
-        output_file: IO = output_files[output_filename]
-        parser.write_result_to_file(output_file, data)
+        Returns:
+            bool -- True if the solution was written.
+        """
+        try:
+            if isinstance(result, Exception):
+                raise result
+            solution: Dict[str, object] = result
+        except Exception as e:
+            print(f'Exception occured: {e}')
+            notification_vars["instances_failed"] += 1
+            return False
+
+        instance_identifier: str = parser._get_complete_instance_identifier(solution["algorithm"], solution)
+
+        self.write_result(context, parser, output_files_dict, solution)
+        notification_vars["instances_done"] += 1
+        self.instances_logger.write_instance_to_log(instance_identifier, output_files_dict[solution["output_filename"]])
+        self._base_runner.notify_communicators(context, communicators, solution, notification_vars)
+
+        return True
 
     def run_tester_for_data(self, context: AlgTesterContext, algorithms: List[Algorithm], parser: Parser, communicators: List[Communicator], input_files_dict: Dict[str, IO], output_files_dict: Dict[str, IO]):
         """
         Parses instances from given input files, solve them using required algorithms and write results to the output file.
+
+        Instances are streamed, at most max_in_flight of them are parsed and submitted to the executor at once.
+        If workers parse instances, byte ranges of input files are submitted instead and the main process only writes results.
         
         Arguments:
             context {AlgTesterContext} -- Used context.
@@ -363,34 +1465,35 @@ class ConcurrentFilesRunner(Runner):
             input_files_dict {Dict[str, IO]} -- Opened input files.
             output_files_dict {Dict[str, IO]} -- A dictionary for all output files to be opened.
         """
-        with concurrent.futures.ProcessPoolExecutor() as executor:
-            futures = list()
+        trackers: Dict[Tuple[str, str], CheckpointTracker] = self.prepare_checkpoint_trackers(context, input_files_dict, algorithms)
+        notification_vars: Dict[str, object] = init_notification_vars(context.is_forced, self.instances_logger.get_num_of_done_instances())
+
+        initargs: Tuple = (context, algorithms)
+        if context.parse_in_workers:
+            initargs = (context, algorithms, parser, self.instances_logger.get_done_instances())
+
+        with create_executor(context, initializer=init_worker, initargs=initargs) as executor:
             solution = dict()
-            for data in self.get_data_for_executor(context, input_files_dict, parser, algorithms):
-                # Give all instances to the executor
-                if not context.is_forced:
-                    # Check if instance is already solved
-                    instance_identifier: str = parser._get_complete_instance_identifier(data[0], data[1])
-                    if self.instances_logger.is_instance_already_done(instance_identifier):
-                        continue
-                futures.append(executor.submit(self._base_runner.get_solution_for_instance, context, *data))
 
-            notification_vars: Dict[str, object] = init_notification_vars(context.is_forced, self.instances_logger.get_num_of_done_instances())
-            
-            for future in concurrent.futures.as_completed(futures):
-                # An instance is done, write it down and notify communicators
-                try:
-                    solution: Dict[str, object] = future.result()
-                except Exception as e:
-                    print(f'Exception occured: {e}')
-                    notification_vars["instances_failed"] += 1      
-                else:
-                    instance_identifier: str = parser._get_complete_instance_identifier(solution["algorithm"], solution)
+            if context.parse_in_workers:
+                ranges = self.get_ranges(context, input_files_dict, parser, algorithms, trackers)
 
-                    self.write_result(context, parser, output_files_dict, solution)
-                    notification_vars["instances_done"] += 1
-                    self.instances_logger.write_instance_to_log(instance_identifier)
-                    self._base_runner.notify_communicators(context, communicators, solution, notification_vars)              
+                for (tracker, ticket), results, range_done in self._base_runner.solve_ranges(context, executor, parser, ranges):
+                    for result in results:
+                        if self.write_solution(context, parser, communicators, notification_vars, output_files_dict, result):
+                            solution = result
+
+                    # The checkpoint moves only over ranges without failed instances
+                    if range_done:
+                        complete_checkpoint(self.instances_logger, tracker, ticket)
+            else:
+                tasks = schedule_items(context, parser, self.get_tasks(context, input_files_dict, parser, algorithms, trackers))
+
+                for (tracker, ticket), result in self._base_runner.solve_in_chunks(context, executor, tasks, results_cache=self.results_cache, duplicates_cache=self.duplicates_cache):
+                    # An instance is done, write it down and notify communicators
+                    if self.write_solution(context, parser, communicators, notification_vars, output_files_dict, result):
+                        solution = result
+                        complete_checkpoint(self.instances_logger, tracker, ticket)
 
             self._base_runner.notify_communicators(context, communicators, solution, notification_vars, forced=True)
 
@@ -410,7 +1513,7 @@ class ConcurrentFilesRunner(Runner):
 
         parser: Parser = plugins.get_parser(context.parser_name)
         communicators: List[Communicator] = get_communicators(context)
-        algorithms: List[Algorithm] = [plugins.get_algorithm(alg_name) for alg_name in context.algorithm_names]
+        algorithms: List[Algorithm] = [get_algorithm(context, alg_name) for alg_name in context.algorithm_names]
 
         for alg in algorithms:
             create_columns_description_file(context, alg)
@@ -421,14 +1524,15 @@ class ConcurrentFilesRunner(Runner):
                 if context.max_files_to_check is not None and index >= context.max_files_to_check:
                     break
                 
-                input_files_dict[filename] = open(f'{context.input_dir}/{filename}', "r")
+                input_files_dict[filename] = open_input_file(f'{context.input_dir}/{filename}')
 
             self.run_tester_for_data(context, algorithms, parser, communicators, input_files_dict, output_files_dict)
 
         except Exception as e:
             print(f"Error occured: {e}")        
         finally:
-            # Make sure all input and output files are closed.
+            # Make sure all input and output files are closed. Log entries are persisted first.
+            self.instances_logger.commit()
             self.close_all_files(input_files_dict)
             self.close_all_files(output_files_dict)
 
@@ -439,9 +1543,87 @@ class ConcurrentInstancesRunner(Runner):
     """
     _base_runner: BaseRunner = BaseRunner()
 
-    def compute_solution_for_file_and_algorithm(self, context: AlgTesterContext, input_file: IO, parser: Parser, algorithm: Algorithm, communicators: List[Communicator], notification_vars: Dict[str, object], executor: concurrent.futures.ProcessPoolExecutor):
+    def get_tasks(self, context: AlgTesterContext, input_file: IO, parser: Parser, algorithm: Algorithm, tracker: CheckpointTracker) -> Iterator[Tuple[int, Algorithm, Dict[str, object]]]:
+        """
+        Lazily parses instances of the input file and prepares tasks for the executor. Already done instances are skipped.
+        
+        Arguments:
+            context {AlgTesterContext} -- Current application context.
+            input_file {IO} -- Opened input file with instances.
+            parser {Parser} -- Currently used instances parser.
+            algorithm {Algorithm} -- Currently tested algorithm.
+            tracker {CheckpointTracker} -- Checkpoint tracker of the input file.
+        
+        Yields:
+            (int, Algorithm, Dict[str, object]) -- Checkpoint ticket of the instance, used algorithm and instance data.
+        """
+        for instance_data, end_offset in self._base_runner.get_parsed_instances(context, input_file, parser, algorithm):
+            ticket: int = tracker.register(end_offset)
+
+            if not context.is_forced:
+                # Check if instance is already solved
+                instance_identifier: str = parser._get_complete_instance_identifier(algorithm, instance_data)
+                if self.instances_logger.is_instance_already_done(instance_identifier):
+                    complete_checkpoint(self.instances_logger, tracker, ticket)
+                    continue
+
+            yield (ticket, algorithm, instance_data)
+
+    def get_ranges(self, context: AlgTesterContext, input_file: IO, parser: Parser, algorithm: Algorithm, tracker: CheckpointTracker) -> Iterator[Tuple[int, str, int, int, Algorithm]]:
+        """
+        Splits the rest of the input file after the checkpoint into byte ranges that workers parse themselves.
+        
+        Arguments:
+            context {AlgTesterContext} -- Current application context.
+            input_file {IO} -- Opened input file with instances.
+            parser {Parser} -- Currently used instances parser.
+            algorithm {Algorithm} -- Currently tested algorithm.
+            tracker {CheckpointTracker} -- Checkpoint tracker of the input file.
+        
+        Yields:
+            (int, str, int, int, Algorithm) -- Checkpoint ticket of the range, path to the input file, start and end of the range and used algorithm.
+        """
+        for start, end in split_input_file(context, parser, input_file, tracker.offset):
+            yield (tracker.register(end), input_file.name, start, end, algorithm)
+
+    def write_solution(self, context: AlgTesterContext, parser: Parser, communicators: List[Communicator], notification_vars: Dict[str, object], output_file: BufferedResultsWriter, result: object) -> bool:
+        """
+        Writes a result into the output file and notifies communicators. Raised exceptions are counted as failed instances.
+        
+        Arguments:
+            context {AlgTesterContext} -- Current application context.
+            parser {Parser} -- Currently used instances parser.
+            communicators {List[Communicator]} -- Used communicators.
+            notification_vars {Dict[str, object]} -- Notification variables
+            output_file {BufferedResultsWriter} -- Opened output file.
+            result {object} -- Solution of an instance or the exception that was raised.
+        
+        Returns:
+            bool -- True if the solution was written.
+        """
+        try:
+            if isinstance(result, Exception):
+                raise result
+            solution: Dict[str, object] = result
+            instance_identifier: str = parser._get_complete_instance_identifier(solution["algorithm"], solution)
+        except Exception as e:
+            print(f'Exception occured: {e}')
+            notification_vars["instances_failed"] += 1
+            return False
+
+        output_file.write_result(solution)
+        notification_vars["instances_done"] += 1
+        self.instances_logger.write_instance_to_log(instance_identifier, output_file)
+        self._base_runner.notify_communicators(context, communicators, solution, notification_vars)
+
+        return True
+
+    def compute_solution_for_file_and_algorithm(self, context: AlgTesterContext, input_file: IO, parser: Parser, algorithm: Algorithm, communicators: List[Communicator], notification_vars: Dict[str, object], executor: concurrent.futures.Executor):
         """
         Asynchronously gets results from multiple instances and writes them into the output file using the Parser.
+
+        At most max_in_flight instances are parsed and submitted to the executor at once, the rest is parsed as results arrive.
+        If workers parse instances, byte ranges of the input file are submitted instead.
         
         Arguments:
             context {AlgTesterContext} -- Current application context.
@@ -449,42 +1631,45 @@ class ConcurrentInstancesRunner(Runner):
             parser {Parser} -- Currently used instances parser.
             algorithm {Algorithm} -- Currently tested algorithm.
             notification_vars {Dict[str, object]} -- Notification variables
-            executor {concurrent.futures.ProcessPoolExecutor} -- [description]
+            executor {concurrent.futures.Executor} -- Used executor.
         """
         
         click_options = get_click_options(context, algorithm)
         output_filename: str = parser.get_output_file_name(context, input_file, click_options)
         solution: Dict[str, object] = dict()
 
-        create_columns_description_file(context, algorithm)
-        with open(f'{context.output_dir}/{output_filename}', "a") as output_file:
-            futures = list()
-            for instance_data in self._base_runner.get_parsed_instances_data(context, input_file, parser, algorithm):
-                if not context.is_forced:
-                    # Check if instance is already solved
-                    instance_identifier: str = parser._get_complete_instance_identifier(algorithm, instance_data)
-                    if self.instances_logger.is_instance_already_done(instance_identifier):
-                        continue
-                futures.append(executor.submit(self._base_runner.get_solution_for_instance, context, algorithm, instance_data))
+        # Skip instances that are done according to the checkpoint
+        tracker: CheckpointTracker = get_checkpoint_tracker(context, self.instances_logger, algorithm, input_file)
+        input_file.seek(tracker.offset)
 
-            print(f'There are {len(futures)} futures being done.')
-            for future in concurrent.futures.as_completed(futures):
-                # Write results and notify communicators                
-                try:
-                    solution: Dict[str, object] = future.result()
-                    instance_identifier: str = parser._get_complete_instance_identifier(solution["algorithm"], solution)
-                except Exception as e:
-                    print(f'Exception occured: {e}')
-                    notification_vars["instances_failed"] += 1
-                else:
-                    parser.write_result_to_file(output_file, solution)
-                    notification_vars["instances_done"] += 1
-                    self.instances_logger.write_instance_to_log(instance_identifier)
-                    self._base_runner.notify_communicators(context, communicators, solution, notification_vars)
+        create_columns_description_file(context, algorithm)
+        with open_output_file(context, parser, output_filename, algorithm) as output_file:
+            if context.parse_in_workers:
+                ranges = self.get_ranges(context, input_file, parser, algorithm, tracker)
+
+                for ticket, results, range_done in self._base_runner.solve_ranges(context, executor, parser, ranges):
+                    for result in results:
+                        if self.write_solution(context, parser, communicators, notification_vars, output_file, result):
+                            solution = result
+                    
+                    # The checkpoint moves only over ranges without failed instances
+                    if range_done:
+                        complete_checkpoint(self.instances_logger, tracker, ticket)
+            else:
+                tasks = schedule_items(context, parser, self.get_tasks(context, input_file, parser, algorithm, tracker))
+
+                for ticket, result in self._base_runner.solve_in_chunks(context, executor, tasks, results_cache=self.results_cache, duplicates_cache=self.duplicates_cache):
+                    # Write results and notify communicators
+                    if self.write_solution(context, parser, communicators, notification_vars, output_file, result):
+                        solution = result
+                        complete_checkpoint(self.instances_logger, tracker, ticket)
+
+            # Persist log entries while the output file is still opened
+            self.instances_logger.commit()
         
         self._base_runner.notify_communicators(context, communicators, solution, notification_vars, forced=True)
 
-    def run_tester_for_file(self, context: AlgTesterContext, input_file_path: str, notification_vars: Dict[str, object], executor: concurrent.futures.ProcessPoolExecutor):
+    def run_tester_for_file(self, context: AlgTesterContext, input_file_path: str, notification_vars: Dict[str, object], executor: concurrent.futures.Executor):
         """
         Run all algorithms for the selected file.
         
@@ -492,16 +1677,16 @@ class ConcurrentInstancesRunner(Runner):
             context {AlgTesterContext} -- Current application context.
             input_file_path {str} -- String path to the input file
             notification_vars {Dict[str, object]} -- Notification variables
-            executor {concurrent.futures.ProcessPoolExecutor} -- [description]
+            executor {concurrent.futures.Executor} -- Used executor.
         """
         
         parser: Parser = plugins.get_parser(context.parser_name)
         communicators: List[Communicator] = get_communicators(context)
         
         print(f'Currently testing file \'{input_file_path.split("/")[-1]}\'. Started {time.strftime("%H:%M:%S %d.%m.")}')
-        with open(input_file_path, "r") as input_file:
+        with open_input_file(input_file_path) as input_file:
             for algorithm_name in context.algorithm_names:
-                algorithm: Algorithm = plugins.get_algorithm(algorithm_name)
+                algorithm: Algorithm = get_algorithm(context, algorithm_name)
                 
                 self.compute_solution_for_file_and_algorithm(context, input_file, parser, algorithm, communicators, notification_vars, executor)
 
@@ -513,7 +1698,12 @@ class ConcurrentInstancesRunner(Runner):
             context {AlgTesterContext} -- Current application context.
             input_files {List[str]} -- Unsorted list of input file names.
         """
-        with concurrent.futures.ProcessPoolExecutor() as executor:
+        algorithms: List[Algorithm] = [get_algorithm(context, algorithm_name) for algorithm_name in context.algorithm_names]
+        initargs: Tuple = (context, algorithms)
+        if context.parse_in_workers:
+            initargs = (context, algorithms, plugins.get_parser(context.parser_name), self.instances_logger.get_done_instances())
+
+        with create_executor(context, initializer=init_worker, initargs=initargs) as executor:
 
             notification_vars: Dict[str, object] = init_notification_vars(context.is_forced, self.instances_logger.get_num_of_done_instances())
             for index, filename in enumerate(sorted(input_files)):
@@ -523,6 +1713,216 @@ class ConcurrentInstancesRunner(Runner):
                 input_file_path: str = f'{context.input_dir}/{filename}'
                 self.run_tester_for_file(context, input_file_path, notification_vars, executor)
 
+_PIPELINE_END: object = object()
+
+def put_to_stage(stage_queue: queue.Queue, item: object, stop: threading.Event) -> bool:
+    """
+    Puts an item into a bounded queue between pipeline stages. Waits while the queue is full.
+    
+    Arguments:
+        stage_queue {queue.Queue} -- Queue of the next stage.
+        item {object} -- Passed item.
+        stop {threading.Event} -- Set when the pipeline is stopped because of an error.
+    
+    Returns:
+        bool -- False if the pipeline was stopped before the item was put.
+    """
+    while not stop.is_set():
+        try:
+            stage_queue.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+
+    return False
+
+def get_from_stage(stage_queue: queue.Queue, stop: threading.Event) -> Iterator[object]:
+    """
+    Arguments:
+        stage_queue {queue.Queue} -- Queue of the current stage.
+        stop {threading.Event} -- Set when the pipeline is stopped because of an error.
+
+    Yields:
+        object -- Items of the queue until the previous stage ends or the pipeline is stopped.
+    """
+    while not stop.is_set():
+        try:
+            item = stage_queue.get(timeout=0.1)
+        except queue.Empty:
+            continue
+
+        if item is _PIPELINE_END:
+            return
+
+        yield item
+
+class PipelineRunner(ConcurrentFilesRunner):
+    """
+    Processes files in three stages connected by bounded queues.
+
+    A reader thread parses instances of input files one after another, workers of the executor compute solutions
+    and a writer thread writes results, the instances log and checkpoints. 
+    Reading, solving and writing overlap, so I/O is not on the critical path even with a single worker.
+    Solvers use the executor, scheduling, transport and chunking options like other concurrency runners, instances are always parsed by the reader.
+    """
+
+    def read_instances(self, context: AlgTesterContext, parser: Parser, algorithms: List[Algorithm], input_file_paths: List[str], 
+            tasks_queue: queue.Queue, results_queue: queue.Queue, lock: threading.Lock, stop: threading.Event):
+        """
+        Reader stage. Parses instances and puts them into the tasks queue. Already done instances go directly to the writer.
+        
+        Arguments:
+            context {AlgTesterContext} -- Used context.
+            parser {Parser} -- Used parser.
+            algorithms {List[Algorithm]} -- Used algorithms.
+            input_file_paths {List[str]} -- Paths to input files in the order they are read.
+            tasks_queue {queue.Queue} -- Queue of the solver stage.
+            results_queue {queue.Queue} -- Queue of the writer stage.
+            lock {threading.Lock} -- Guards checkpoint trackers shared with the writer.
+            stop {threading.Event} -- Set when the pipeline is stopped because of an error.
+        """
+        for input_file_path in input_file_paths:
+            with open_input_file(input_file_path) as input_file:
+                for algorithm in algorithms:
+                    # Skip instances that are done according to the checkpoint
+                    tracker: CheckpointTracker = get_checkpoint_tracker(context, self.instances_logger, algorithm, input_file)
+                    input_file.seek(tracker.offset)
+
+                    for instance_data, end_offset in self._base_runner.get_parsed_instances(context, input_file, parser, algorithm):
+                        with lock:
+                            ticket: int = tracker.register(end_offset)
+
+                        if not context.is_forced:
+                            # Check if instance is already solved
+                            instance_identifier: str = parser._get_complete_instance_identifier(algorithm, instance_data)
+                            if self.instances_logger.is_instance_already_done(instance_identifier):
+                                if not put_to_stage(results_queue, ((tracker, ticket), None), stop):
+                                    return
+                                continue
+
+                        if not put_to_stage(tasks_queue, ((tracker, ticket), algorithm, instance_data), stop):
+                            return
+
+    def write_results(self, context: AlgTesterContext, parser: Parser, communicators: List[Communicator], notification_vars: Dict[str, object], 
+            output_files_dict: Dict[str, IO], results_queue: queue.Queue, lock: threading.Lock, stop: threading.Event, last_solution: Dict[str, object]):
+        """
+        Writer stage. Writes results from the results queue into output files, the instances log and checkpoints.
+        
+        Arguments:
+            context {AlgTesterContext} -- Used context.
+            parser {Parser} -- Used parser.
+            communicators {List[Communicator]} -- Used communicators.
+            notification_vars {Dict[str, object]} -- Notification variables.
+            output_files_dict {Dict[str, IO]} -- A dictionary for all output files to be opened.
+            results_queue {queue.Queue} -- Queue of the writer stage.
+            lock {threading.Lock} -- Guards checkpoint trackers shared with the reader.
+            stop {threading.Event} -- Set when the pipeline is stopped because of an error.
+            last_solution {Dict[str, object]} -- Filled with the last written solution.
+        """
+        for (tracker, ticket), result in get_from_stage(results_queue, stop):
+            if result is None:
+                # Instance was done before
+                with lock:
+                    complete_checkpoint(self.instances_logger, tracker, ticket)
+                continue
+
+            if self.write_solution(context, parser, communicators, notification_vars, output_files_dict, result):
+                last_solution.clear()
+                last_solution.update(result)
+                with lock:
+                    complete_checkpoint(self.instances_logger, tracker, ticket)
+
+    def run_stage(self, stage: Callable, args: Tuple, next_queue: queue.Queue, errors: List[Exception], stop: threading.Event) -> threading.Thread:
+        """
+        Starts a stage in a thread. If the stage fails, the whole pipeline is stopped.
+        
+        Arguments:
+            stage {Callable} -- Function of the stage.
+            args {Tuple} -- Arguments of the function.
+            next_queue {queue.Queue} -- Queue of the next stage which gets the end of the stage. None for the last stage.
+            errors {List[Exception]} -- Collects errors of all stages.
+            stop {threading.Event} -- Set when the pipeline is stopped because of an error.
+
+        Returns:
+            threading.Thread -- The started thread.
+        """
+        def run():
+            try:
+                stage(*args)
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                if next_queue is not None:
+                    put_to_stage(next_queue, _PIPELINE_END, stop)
+
+        thread: threading.Thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+
+        return thread
+
+    def compute_results(self, context: AlgTesterContext, input_files: List[str]):
+        """
+        Parses instances from given input files, solve them using required algorithms and write results to the output file.
+        
+        Arguments:
+            context {AlgTesterContext} -- Current application context.
+            input_files {List[str]} -- Unsorted list of input file names.
+        """
+        output_files_dict: Dict[str, IO] = dict()
+
+        parser: Parser = plugins.get_parser(context.parser_name)
+        communicators: List[Communicator] = get_communicators(context)
+        algorithms: List[Algorithm] = [get_algorithm(context, alg_name) for alg_name in context.algorithm_names]
+        notification_vars: Dict[str, object] = init_notification_vars(context.is_forced, self.instances_logger.get_num_of_done_instances())
+
+        input_file_paths: List[str] = list()
+        for index, filename in enumerate(sorted(input_files)):
+            if context.max_files_to_check is not None and index >= context.max_files_to_check:
+                break
+
+            input_file_paths.append(f'{context.input_dir}/{filename}')
+
+        for alg in algorithms:
+            create_columns_description_file(context, alg)
+
+        tasks_queue: queue.Queue = queue.Queue(maxsize=get_max_in_flight(context))
+        results_queue: queue.Queue = queue.Queue(maxsize=get_max_in_flight(context))
+        lock: threading.Lock = threading.Lock()
+        stop: threading.Event = threading.Event()
+        errors: List[Exception] = list()
+        last_solution: Dict[str, object] = dict()
+
+        reader: threading.Thread = self.run_stage(self.read_instances, (context, parser, algorithms, input_file_paths, tasks_queue, results_queue, lock, stop), 
+            tasks_queue, errors, stop)
+        writer: threading.Thread = self.run_stage(self.write_results, (context, parser, communicators, notification_vars, output_files_dict, results_queue, lock, stop, last_solution), 
+            None, errors, stop)
+
+        try:
+            # Solver stage runs in workers of the executor
+            with create_executor(context, initializer=init_worker, initargs=(context, algorithms)) as executor:
+                tasks = schedule_items(context, parser, get_from_stage(tasks_queue, stop))
+
+                for key, result in self._base_runner.solve_in_chunks(context, executor, tasks, results_cache=self.results_cache, duplicates_cache=self.duplicates_cache):
+                    if not put_to_stage(results_queue, (key, result), stop):
+                        break
+        except Exception as e:
+            errors.append(e)
+            stop.set()
+        finally:
+            put_to_stage(results_queue, _PIPELINE_END, stop)
+            reader.join()
+            writer.join()
+
+            # Log entries are persisted before output files are closed
+            self.instances_logger.commit()
+            self.close_all_files(output_files_dict)
+
+        for e in errors:
+            print(f"Error occured: {e}")
+
+        self._base_runner.notify_communicators(context, communicators, last_solution, notification_vars, forced=True)
+
 class Runners(Enum):
     """
     Contains references to all Concurrency runners available.
@@ -532,4 +1932,5 @@ class Runners(Enum):
     """
     BASE = BaseRunner()
     FILES = ConcurrentFilesRunner()
-    INSTANCES = ConcurrentInstancesRunner()
\ No newline at end of file
+    INSTANCES = ConcurrentInstancesRunner()
+    PIPELINE = PipelineRunner()
\ No newline at end of file
@@ -0,0 +1,132 @@
+import os
+import itertools
+import multiprocessing
+import concurrent.futures
+from typing import Dict, List, Tuple
+from algorithm_tester_common.tester_dataclasses import AlgTesterContext, Parser
+from algorithm_tester.executors import Executors, get_num_of_workers
+from algorithm_tester.helpers import get_cache_dir
+from algorithm_tester.compression import open_input_file
+
+"""
+Contains counting of instances in input files. Counts are used only to report progress.
+"""
+
+def get_counts_cache_path() -> str:
+    """
+    Returns:
+        str -- Path to the file with cached counts of instances. It is in the user cache directory, 
+        so it survives forced runs that delete the output directory and input directories are not modified.
+    """
+    return os.path.join(get_cache_dir(), "instances_counts.dat")
+
+class InstancesCountsCache(object):
+    """
+    File in the user cache directory with numbers of instances of input files.
+
+    Entries are keyed by the parser, absolute path of the file, its size and modification time,
+    so a changed input file is counted again. If the file cannot be written, counts are simply not cached.
+    """
+
+    def __init__(self, path: str):
+        """
+        Arguments:
+            path {str} -- Path to the sidecar file.
+        """
+        self._path: str = path
+        # (size, mtime, count) under (parser name, absolute path of the input file)
+        self._counts: Dict[Tuple[str, str], Tuple[int, int, int]] = dict()
+        self._changed: bool = False
+
+    def load(self):
+        if not os.path.isfile(self._path):
+            return
+
+        with open(self._path, "r") as counts_file:
+            for line in counts_file:
+                try:
+                    parser_name, size, mtime, count, input_file_key = line.rstrip("\n").split(" ", 4)
+                    self._counts[(parser_name, input_file_key)] = (int(size), int(mtime), int(count))
+                except ValueError:
+                    # Skip damaged entries
+                    continue
+
+    def get_count(self, parser_name: str, input_file_key: str, stat: os.stat_result) -> int:
+        """
+        Arguments:
+            parser_name {str} -- Name of the used parser.
+            input_file_key {str} -- Absolute path of the input file.
+            stat {os.stat_result} -- Current status of the input file.
+
+        Returns:
+            int -- Cached number of instances. None if the file is not cached or it changed.
+        """
+        size, mtime, count = self._counts.get((parser_name, input_file_key), (None, None, None))
+
+        if size != stat.st_size or mtime != stat.st_mtime_ns:
+            return None
+
+        return count
+
+    def set_count(self, parser_name: str, input_file_key: str, stat: os.stat_result, count: int):
+        self._counts[(parser_name, input_file_key)] = (stat.st_size, stat.st_mtime_ns, count)
+        self._changed = True
+
+    def save(self):
+        """
+        Rewrites the sidecar file if any count changed.
+        """
+        if not self._changed:
+            return
+
+        temp_path: str = f'{self._path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            with open(temp_path, "w") as counts_file:
+                for (parser_name, input_file_key), (size, mtime, count) in self._counts.items():
+                    counts_file.write(f'{parser_name} {size} {mtime} {count} {input_file_key}\n')
+
+            os.replace(temp_path, self._path)
+            self._changed = False
+        except OSError as e:
+            print(f'Counts of instances were not cached: {e}')
+
+def count_instances_in_file(context: AlgTesterContext, parser: Parser, input_file_path: str) -> int:
+    """
+    Returns:
+        int -- Number of instances of the input file given by the parser.
+    """
+    with open_input_file(input_file_path) as input_file:
+        return parser.get_num_of_instances(context, input_file)
+
+def count_instances_in_files(context: AlgTesterContext, parser: Parser, input_file_paths: List[str], parallel: bool = True) -> List[int]:
+    """
+    Counts instances of input files. Files are counted concurrently by workers of the executor backend selected in the context.
+
+    Arguments:
+        context {AlgTesterContext} -- Current application context.
+        parser {Parser} -- Used parser.
+        input_file_paths {List[str]} -- Paths to input files.
+
+    Keyword Arguments:
+        parallel {bool} -- False if all files are counted in the current thread. (default: {True})
+
+    Returns:
+        List[int] -- Number of instances of every input file.
+    """
+    backend: Executors = Executors[context.executor_name]
+    num_of_workers: int = min(get_num_of_workers(context), len(input_file_paths))
+
+    if not parallel or num_of_workers <= 1 or backend == Executors.INLINE:
+        return [count_instances_in_file(context, parser, input_file_path) for input_file_path in input_file_paths]
+
+    if backend == Executors.THREAD:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=num_of_workers)
+    else:
+        mp_context = None
+        if backend.get_start_method() is not None:
+            mp_context = multiprocessing.get_context(backend.get_start_method())
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=num_of_workers, mp_context=mp_context)
+
+    with executor:
+        return list(executor.map(count_instances_in_file, itertools.repeat(context), itertools.repeat(parser), input_file_paths))
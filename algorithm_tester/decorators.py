@@ -2,6 +2,8 @@ import click
 from typing import Dict, List
 from algorithm_tester_common.tester_dataclasses import DynamicClickOption, Algorithm, Parser, Communicator
 from algorithm_tester.concurrency_runners import Runner, Runners
+from algorithm_tester.executors import Executors
+from algorithm_tester.plugins import Plugins
 
 """
 Contains all helper decorators.
@@ -18,35 +20,63 @@ def __get_full_info_strings(title: str, objects_list: List[object]):
 
     return full_infos
 
-def dynamic_help(algorithms: List[Algorithm], parsers: List[Parser], communicators: List[Communicator]):
+def create_help_string(algorithms: List[Algorithm], parsers: List[Parser], communicators: List[Communicator]) -> str:
     """
-    A decorator for Click interface. Creates more detailed help string.
+    Creates more detailed help string.
     
     Arguments:
         algorithms {List[Algorithm]} -- All available algorithms.
         parsers {List[Parser]} -- All available parsers.
         communicators {List[Communicator]} -- All available communicators.
     
+    Returns:
+        str -- The help string.
+    """
+    runners = [(r.name, r.value) for r in Runners]
+    runners_full_infos: List[str] = ["RUNNERS:"]
+    runners_short_infos: str = __help_short_info.format(title="runners", names=", ".join([r[0].lower() for r in runners]))
+    for (name, runner) in runners:
+        runners_full_infos.append(__help_full_info.format(name=name.lower(), doc=runner.__doc__.strip()))
+
+    algorithm_full_infos: List[str] = __get_full_info_strings("ALGORITHMS", algorithms)
+    algorithm_short_infos: str = __help_short_info.format(title="algorithms", names=", ".join([alg.get_name() for alg in algorithms]))
+    parsers_full_infos: List[str] = __get_full_info_strings("PARSERS", parsers)
+    parsers_short_infos: str = __help_short_info.format(title="parsers", names=", ".join([p.get_name() for p in parsers]))
+    communicators_full_infos: List[str] = __get_full_info_strings("COMMUNICATORS", communicators)
+    communicators_short_infos: str = __help_short_info.format(title="communicators", names=", ".join([c.get_name() for c in communicators]))
+    joined_full_infos: List[str] = algorithm_full_infos + parsers_full_infos + communicators_full_infos + runners_full_infos
+    executors_short_infos: str = __help_short_info.format(title="executors", names=", ".join([e.value for e in Executors]))
+    joined_short_infos: List[str] = [algorithm_short_infos, parsers_short_infos, communicators_short_infos, runners_short_infos, executors_short_infos]
+
+    return '{full_info}\b\n\n\nSHORT_INFO:\n\n{short_info}'.format(full_info="\n\n".join(joined_full_infos), short_info="\n\n".join(joined_short_infos))
+
+class DynamicHelpCommand(click.Command):
+    """
+    Click command with help string created by the dynamic_help decorator. The help string is created only when it is shown,
+    so plugins are not instantiated when the command only runs.
+    """
+
+    @property
+    def help(self) -> str:
+        if self._help is None and getattr(self.callback, "__dynamic_help__", None) is not None:
+            self._help = self.callback.__dynamic_help__()
+
+        return self._help
+
+    @help.setter
+    def help(self, value: str):
+        self._help = value
+
+def dynamic_help(plugins: Plugins):
+    """
+    A decorator for Click interface. Creates more detailed help string when a DynamicHelpCommand shows it.
+    
+    Arguments:
+        plugins {Plugins} -- Plugins with all available algorithms, parsers and communicators.
+    
     """
     def dec(obj):
-        runners = [(r.name, r.value) for r in Runners]
-        runners_full_infos: List[str] = ["RUNNERS:"]
-        runners_short_infos: str = __help_short_info.format(title="runners", names=", ".join([r[0].lower() for r in runners]))
-        for (name, runner) in runners:
-            runners_full_infos.append(__help_full_info.format(name=name.lower(), doc=runner.__doc__.strip()))
-
-        algorithm_full_infos: List[str] = __get_full_info_strings("ALGORITHMS", algorithms)
-        algorithm_short_infos: str = __help_short_info.format(title="algorithms", names=", ".join([alg.get_name() for alg in algorithms]))
-        parsers_full_infos: List[str] = __get_full_info_strings("PARSERS", parsers)
-        parsers_short_infos: str = __help_short_info.format(title="parsers", names=", ".join([p.get_name() for p in parsers]))
-        communicators_full_infos: List[str] = __get_full_info_strings("COMMUNICATORS", communicators)
-        communicators_short_infos: str = __help_short_info.format(title="communicators", names=", ".join([c.get_name() for c in communicators]))
-        joined_full_infos: List[str] = algorithm_full_infos + parsers_full_infos + communicators_full_infos + runners_full_infos
-        joined_short_infos: List[str] = [algorithm_short_infos, parsers_short_infos, communicators_short_infos, runners_short_infos]
-
-        help_string: str = '{full_info}\b\n\n\nSHORT_INFO:\n\n{short_info}'.format(full_info="\n\n".join(joined_full_infos), short_info="\n\n".join(joined_short_infos))
-
-        obj.__doc__ = help_string
+        obj.__dynamic_help__ = lambda: create_help_string(plugins.get_algorithms(), plugins.get_parsers(), plugins.get_communicators())
         return obj
     return dec
 
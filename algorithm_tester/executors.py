@@ -0,0 +1,456 @@
+import os
+import sys
+import collections
+import itertools
+import threading
+import time
+import functools
+import multiprocessing
+import concurrent.futures
+import concurrent.futures.process
+from enum import Enum
+from typing import Callable, Deque, Dict, List, Tuple
+from algorithm_tester_common.tester_dataclasses import AlgTesterContext
+
+"""
+Contains executor backends that concurrency runners can use to compute solutions.
+"""
+
+class InlineExecutor(concurrent.futures.Executor):
+    """
+    Executor that runs every task immediately in the calling thread. Useful for debugging and profiling.
+    """
+
+    def __init__(self, initializer: Callable = None, initargs: Tuple = ()):
+        if initializer is not None:
+            initializer(*initargs)
+
+    def submit(self, fn, *args, **kwargs) -> concurrent.futures.Future:
+        future: concurrent.futures.Future = concurrent.futures.Future()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+        return future
+
+class InstanceTimeoutError(Exception):
+    """
+    Raised for a task whose instance was not computed in time. The worker that computed it was killed.
+    """
+
+    def __init__(self, detail: object, timeout: float):
+        """
+        Arguments:
+            detail {object} -- Identifies the instance that timed out. Given to start_watch by the task.
+            timeout {float} -- Time budget of the instance in seconds.
+        """
+        super().__init__(f'Instance was not computed in {timeout} seconds.')
+        self.detail: object = detail
+        self.timeout: float = timeout
+
+class WorkerCrashError(Exception):
+    """
+    Raised for a quarantined task. Computation of the task killed its worker too many times.
+    """
+
+    def __init__(self, attempts: int, cause: BaseException = None):
+        super().__init__(f'Worker process died {attempts} times while computing the task.')
+        self.attempts: int = attempts
+        self.__cause__ = cause
+
+class Watchdog(threading.Thread):
+    """
+    Watches the instance that is currently computed in a process worker. 
+    If the instance is not done in time, the watchdog reports it and kills the whole worker process.
+    """
+
+    def __init__(self, timeout: float, reports: multiprocessing.SimpleQueue):
+        super().__init__(daemon=True)
+        self._timeout: float = timeout
+        self._reports: multiprocessing.SimpleQueue = reports
+        self._condition: threading.Condition = threading.Condition()
+        self._deadline: float = None
+        self._watched: Tuple[int, object] = None
+
+    def start_watch(self, task_id: int, detail: object):
+        with self._condition:
+            self._deadline = time.monotonic() + self._timeout
+            self._watched = (task_id, detail)
+            self._condition.notify()
+
+    def stop_watch(self):
+        with self._condition:
+            self._deadline = None
+
+    def run(self):
+        with self._condition:
+            while True:
+                if self._deadline is None:
+                    self._condition.wait()
+                    continue
+
+                remaining: float = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+
+                # SimpleQueue writes synchronously, the report is sent before the process exits
+                task_id, detail = self._watched
+                self._reports.put((task_id, detail, self._timeout))
+                os._exit(1)
+
+_watchdog: Watchdog = None
+_current_task_id: int = None
+_worker_index: int = None
+
+def init_supervised_worker(reports: multiprocessing.SimpleQueue, worker_counter, timeout: float, initializer: Callable, initargs: Tuple):
+    """
+    Initializer of workers of SupervisedProcessPoolExecutor. Assigns the worker index, starts the watchdog and calls the user initializer.
+    """
+    global _watchdog, _worker_index
+
+    with worker_counter.get_lock():
+        _worker_index = worker_counter.value
+        worker_counter.value += 1
+
+    if timeout is not None:
+        _watchdog = Watchdog(timeout, reports)
+        _watchdog.start()
+
+    if initializer is not None:
+        initializer(*initargs)
+
+def get_worker_index() -> int:
+    """
+    Returns:
+        int -- Index of the current process worker in the order the workers were started. 
+        Workers of one pool have consecutive indices. None if the code does not run in a supervised process worker.
+    """
+    return _worker_index
+
+def run_supervised_task(task_id: int, fn: Callable, args: Tuple) -> object:
+    global _current_task_id
+
+    _current_task_id = task_id
+    return fn(*args)
+
+def start_watch(detail: object):
+    """
+    Starts measuring the time budget of one instance. Does nothing if the worker is not supervised or no timeout is set.
+    
+    Arguments:
+        detail {object} -- Identifies the instance. Given back in InstanceTimeoutError.
+    """
+    if _watchdog is not None:
+        _watchdog.start_watch(_current_task_id, detail)
+
+def stop_watch():
+    """
+    Stops measuring the time budget of the current instance.
+    """
+    if _watchdog is not None:
+        _watchdog.stop_watch()
+
+class _SupervisedTask(object):
+
+    def __init__(self, task_id: int, fn: Callable, args: Tuple):
+        self.task_id: int = task_id
+        self.fn: Callable = fn
+        self.args: Tuple = args
+        self.future: concurrent.futures.Future = concurrent.futures.Future()
+        self.inner: concurrent.futures.Future = None
+        self.crashes: int = 0
+
+class SupervisedProcessPoolExecutor(concurrent.futures.Executor):
+    """
+    Process pool that replaces its workers when one of them dies.
+
+    Instances that run longer than the timeout are reported by the watchdog of the worker, which then kills the worker.
+    Task of the instance fails with InstanceTimeoutError. The pool is rebuilt and all other unfinished tasks are submitted again.
+
+    If a worker dies without a report, e.g. it segfaulted or was killed by the OOM killer, the culprit is not known.
+    All unfinished tasks become suspects and are computed again one by one with no other task in the pool.
+    A suspect that kills the worker again is retried until it crashed max_attempts times. Then it is quarantined and fails with WorkerCrashError.
+    """
+
+    def __init__(self, max_workers: int, mp_context=None, initializer: Callable = None, initargs: Tuple = (), timeout: float = None, max_attempts: int = 2):
+        """
+        Arguments:
+            max_workers {int} -- Number of worker processes.
+        
+        Keyword Arguments:
+            mp_context -- Multiprocessing context used to start workers. (default: {None})
+            initializer {Callable} -- Function that is called once in every worker. (default: {None})
+            initargs {Tuple} -- Arguments of the initializer. (default: {()})
+            timeout {float} -- Time budget of one instance in seconds. None means no limit. (default: {None})
+            max_attempts {int} -- How many times can a task kill a worker before it is quarantined. (default: {2})
+        """
+        self._max_workers: int = max_workers
+        self._mp_context = mp_context or multiprocessing.get_context()
+        self._initializer: Callable = initializer
+        self._initargs: Tuple = initargs
+        self._timeout: float = timeout
+        self._max_attempts: int = max_attempts
+
+        self._lock: threading.RLock = threading.RLock()
+        self._reports: multiprocessing.SimpleQueue = self._mp_context.SimpleQueue()
+        self._worker_counter = self._mp_context.Value("i", 0)
+        self._next_task_id: int = 0
+        # Tasks submitted to the current pool
+        self._running: Dict[int, _SupervisedTask] = dict()
+        # Tasks that wait until all suspects are computed
+        self._waiting: Deque[_SupervisedTask] = collections.deque()
+        self._suspects: Deque[_SupervisedTask] = collections.deque()
+        self._isolated: _SupervisedTask = None
+        self._executor: concurrent.futures.ProcessPoolExecutor = self._create_pool()
+
+    def _create_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        return concurrent.futures.ProcessPoolExecutor(max_workers=self._max_workers, mp_context=self._mp_context, 
+            initializer=init_supervised_worker, initargs=(self._reports, self._worker_counter, self._timeout, self._initializer, self._initargs))
+
+    def submit(self, fn, *args, **kwargs) -> concurrent.futures.Future:
+        if len(kwargs) > 0:
+            fn = functools.partial(fn, **kwargs)
+
+        with self._lock:
+            task: _SupervisedTask = _SupervisedTask(self._next_task_id, fn, args)
+            self._next_task_id += 1
+
+            if self._isolated is None and len(self._suspects) == 0:
+                exception: BaseException = self._run_task(task)
+                if exception is not None:
+                    raise exception
+            else:
+                self._waiting.append(task)
+
+            return task.future
+
+    def _run_task(self, task: _SupervisedTask) -> BaseException:
+        """
+        Submits the task to the current pool. The task is running only if the pool accepted it.
+
+        Returns:
+            BaseException -- Error of the pool that made the task fail, e.g. arguments of workers that can not be pickled. None if the task runs.
+        """
+        try:
+            inner: concurrent.futures.Future = self._executor.submit(run_supervised_task, task.task_id, task.fn, task.args)
+        except concurrent.futures.process.BrokenProcessPool:
+            # The pool broke before its tasks failed, the task is handled by the restart
+            task.inner = None
+            self._running[task.task_id] = task
+            self._restart()
+            return None
+        except BaseException as exception:
+            # Otherwise shutdown would wait for the task forever
+            task.future.set_exception(exception)
+            return exception
+
+        task.inner = inner
+        self._running[task.task_id] = task
+        task.inner.add_done_callback(functools.partial(self._on_task_done, task))
+
+        return None
+
+    def _on_task_done(self, task: _SupervisedTask, inner: concurrent.futures.Future):
+        with self._lock:
+            if inner is not task.inner or task.future.done():
+                # Result of a task that was already submitted again
+                return
+
+            if inner.cancelled():
+                del self._running[task.task_id]
+                task.future.cancel()
+                return
+
+            exception: BaseException = inner.exception()
+            if isinstance(exception, concurrent.futures.process.BrokenProcessPool):
+                self._restart(exception)
+                return
+
+            del self._running[task.task_id]
+            if exception is not None:
+                task.future.set_exception(exception)
+            else:
+                task.future.set_result(inner.result())
+
+            if task is self._isolated:
+                self._isolated = None
+                self._schedule()
+
+    def _schedule(self):
+        """
+        Runs the next suspect when the pool is empty. Waiting tasks are submitted when there are no suspects left.
+        """
+        if self._isolated is not None:
+            return
+
+        if len(self._suspects) > 0:
+            if len(self._running) == 0:
+                self._isolated = self._suspects.popleft()
+                if self._run_task(self._isolated) is not None:
+                    self._isolated = None
+                    self._schedule()
+            return
+
+        while len(self._waiting) > 0:
+            self._run_task(self._waiting.popleft())
+
+    def _get_reports(self) -> Dict[int, Tuple[object, float]]:
+        reports: Dict[int, Tuple[object, float]] = dict()
+        while not self._reports.empty():
+            task_id, detail, timeout = self._reports.get()
+            reports[task_id] = (detail, timeout)
+
+        return reports
+
+    def _restart(self, cause: BaseException = None):
+        """
+        Replaces the broken pool with a new one and decides what happens with tasks that were lost with it.
+        """
+        old_executor: concurrent.futures.ProcessPoolExecutor = self._executor
+        for process in list((getattr(old_executor, "_processes", None) or dict()).values()):
+            process.kill()
+        old_executor.shutdown(wait=False)
+
+        reports: Dict[int, Tuple[object, float]] = self._get_reports()
+        self._executor = self._create_pool()
+
+        lost: List[_SupervisedTask] = list(self._running.values())
+        self._running.clear()
+        for task in lost:
+            # Late results of the broken pool are ignored
+            task.inner = None
+        isolated: _SupervisedTask = self._isolated
+        self._isolated = None
+
+        if len(reports) > 0:
+            # Workers were killed by watchdogs, the culprits are known
+            for task in lost:
+                if task.task_id in reports:
+                    task.future.set_exception(InstanceTimeoutError(*reports[task.task_id]))
+                elif task is isolated:
+                    self._suspects.appendleft(task)
+                else:
+                    self._run_task(task)
+        elif isolated is not None:
+            # The suspect was alone in the pool, it killed the worker
+            isolated.crashes += 1
+            if isolated.crashes >= self._max_attempts:
+                print(f'Task crashed the worker {isolated.crashes} times. It is quarantined.')
+                isolated.future.set_exception(WorkerCrashError(isolated.crashes, cause))
+            else:
+                self._suspects.appendleft(isolated)
+        else:
+            print(f'Worker process died. {len(lost)} unfinished tasks are computed again one by one.')
+            self._suspects.extend(lost)
+
+        self._schedule()
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        with self._lock:
+            if cancel_futures:
+                for task in itertools.chain(self._waiting, self._suspects):
+                    task.future.cancel()
+                self._waiting.clear()
+                self._suspects.clear()
+
+                # Tasks that did not start in the pool yet are cancelled before the pool is waited for
+                for task in list(self._running.values()):
+                    if task.inner is not None:
+                        task.inner.cancel()
+
+            unfinished: List[concurrent.futures.Future] = [task.future for task in itertools.chain(self._running.values(), self._waiting, self._suspects)]
+
+        if wait:
+            # Tasks can move to a new pool until they are finished
+            concurrent.futures.wait(unfinished)
+
+        with self._lock:
+            executor: concurrent.futures.ProcessPoolExecutor = self._executor
+        
+        if sys.version_info >= (3, 9):
+            executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+        else:
+            # Pools of older versions do not accept cancel_futures, pending tasks were cancelled above
+            executor.shutdown(wait=wait)
+
+class Executors(Enum):
+    """
+    Contains all executor backends available to concurrency runners.
+
+    Process backends use a start method of their name or the platform default.
+    Threads avoid pickling of instances and are fast for algorithms that release the GIL.
+    Inline executor computes everything in the main process.
+
+    Arguments:
+        Enum {str} -- Name of the backend.
+    """
+    PROCESS = "process"
+    PROCESS_FORK = "process-fork"
+    PROCESS_SPAWN = "process-spawn"
+    PROCESS_FORKSERVER = "process-forkserver"
+    THREAD = "thread"
+    INLINE = "inline"
+
+    def is_process(self) -> bool:
+        return self.value.startswith("process")
+
+    def get_start_method(self) -> str:
+        """
+        Returns:
+            str -- Multiprocessing start method of a process backend. None if the platform default is used.
+        """
+        if self == Executors.PROCESS or not self.is_process():
+            return None
+
+        return self.value.split("-")[1]
+
+def get_num_of_workers(context: AlgTesterContext) -> int:
+    """
+    Arguments:
+        context {AlgTesterContext} -- Current application context.
+
+    Returns:
+        int -- Number of workers of the executor. Defaults to the number of CPUs.
+    """
+    if context.jobs is not None:
+        return context.jobs
+
+    return os.cpu_count() or 1
+
+def create_executor(context: AlgTesterContext, initializer: Callable = None, initargs: Tuple = ()) -> concurrent.futures.Executor:
+    """
+    Creates an executor of the backend selected in the context.
+    Process backends are supervised, instance timeouts can be enforced only by them.
+
+    Arguments:
+        context {AlgTesterContext} -- Current application context.
+
+    Keyword Arguments:
+        initializer {Callable} -- Function that is called once in every worker. (default: {None})
+        initargs {Tuple} -- Arguments of the initializer. (default: {()})
+
+    Returns:
+        concurrent.futures.Executor -- Created executor.
+    """
+    backend: Executors = Executors[context.executor_name]
+
+    if not backend.is_process() and context.instance_timeout is not None:
+        print(f'Instance timeout is not enforced by the {backend.value} executor.')
+
+    if backend == Executors.INLINE:
+        return InlineExecutor(initializer=initializer, initargs=initargs)
+
+    if backend == Executors.THREAD:
+        return concurrent.futures.ThreadPoolExecutor(max_workers=get_num_of_workers(context), initializer=initializer, initargs=initargs)
+
+    mp_context = None
+    if backend.get_start_method() is not None:
+        mp_context = multiprocessing.get_context(backend.get_start_method())
+
+    return SupervisedProcessPoolExecutor(max_workers=get_num_of_workers(context), mp_context=mp_context, 
+        initializer=initializer, initargs=initargs, timeout=context.instance_timeout, max_attempts=context.max_crash_attempts)
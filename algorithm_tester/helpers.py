@@ -1,6 +1,9 @@
 import os
+import zlib
 import shutil
-from typing import List
+import fnmatch
+from enum import Enum
+from typing import Iterator, List, Tuple
 import time
 
 def create_path(path: str):
@@ -13,23 +16,103 @@ def create_path(path: str):
     if not os.path.isdir(path):
         os.makedirs(path)
 
-def get_input_files(path: str) -> List[str]:
+class ShardModes(Enum):
     """
-    Gets all files from the path.
+    What is partitioned between shards.
+
+    FILES -- Every input file belongs to exactly one shard.
+    INSTANCES -- Every instance belongs to exactly one shard. All shards read all input files.
+    """
+    FILES = "files"
+    INSTANCES = "instances"
+
+def is_in_shard(key: str, shard: Tuple[int, int]) -> bool:
+    """
+    Deterministically assigns keys to shards. The same key belongs to the same shard on every machine and in every run.
+    
+    Arguments:
+        key {str} -- Identifies a file or an instance.
+        shard {Tuple[int, int]} -- Index of the current shard and number of all shards. None if sharding is not used.
+    
+    Returns:
+        bool -- True if the key belongs to the current shard.
+    """
+    if shard is None:
+        return True
+
+    index, num_of_shards = shard
+    return zlib.crc32(key.encode()) % num_of_shards == index
+
+def _matches(relative_path: str, patterns: List[str]) -> bool:
+    name: str = relative_path.rsplit("/", 1)[-1]
+
+    return any(fnmatch.fnmatchcase(relative_path, pattern) or fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+
+def iter_input_files(path: str, include: List[str] = None, exclude: List[str] = None, recursive: bool = True, shard: Tuple[int, int] = None) -> Iterator[str]:
+    """
+    Lazily discovers input files. Directories are scanned only once and their entries are not sorted.
+    Glob patterns are matched against paths relative to the directory and against file names. A * also matches /.
     
     Arguments:
         path {str} -- Directory to get files from.
     
+    Keyword Arguments:
+        include {List[str]} -- Only files that match one of these glob patterns are used. All files if empty. (default: {None})
+        exclude {List[str]} -- Files and directories that match one of these glob patterns are skipped. (default: {None})
+        recursive {bool} -- True if subdirectories are scanned too. (default: {True})
+        shard {Tuple[int, int]} -- Only files of this shard are used. (default: {None})
+    
+    Yields:
+        str -- Path of an input file relative to the directory.
+    """
+    directories: List[str] = [""]
+
+    while len(directories) > 0:
+        relative_dir: str = directories.pop()
+
+        with os.scandir(os.path.join(path, relative_dir)) as entries:
+            for entry in entries:
+                relative_path: str = f'{relative_dir}{entry.name}'
+                if exclude and _matches(relative_path, exclude):
+                    continue
+
+                if entry.is_dir():
+                    if recursive:
+                        directories.append(f'{relative_path}/')
+                    continue
+
+                if include and not _matches(relative_path, include):
+                    continue
+
+                if is_in_shard(relative_path, shard):
+                    yield relative_path
+
+def get_input_files(path: str, include: List[str] = None, exclude: List[str] = None, recursive: bool = True, shard: Tuple[int, int] = None) -> List[str]:
+    """
+    Gets all input files from the path. Nested files keep their path relative to the directory.
+    
+    Arguments:
+        path {str} -- Directory to get files from.
+    
+    Keyword Arguments:
+        include {List[str]} -- Only files that match one of these glob patterns are used. All files if empty. (default: {None})
+        exclude {List[str]} -- Files and directories that match one of these glob patterns are skipped. (default: {None})
+        recursive {bool} -- True if subdirectories are scanned too. (default: {True})
+        shard {Tuple[int, int]} -- Only files of this shard are used. (default: {None})
+    
     Returns:
-        List[str] -- List of filenames.
+        List[str] -- Sorted list of paths relative to the directory.
     """
-    output = list()
+    return sorted(iter_input_files(path, include=include, exclude=exclude, recursive=recursive, shard=shard))
 
-    for root, _, files in os.walk(path):
-        for file in files:
-            output.append(file)
+def get_cache_dir() -> str:
+    """
+    Returns:
+        str -- Directory of files cached by the application in the user cache directory.
+    """
+    cache_dir: str = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
 
-    return output
+    return os.path.join(cache_dir, "algorithm_tester")
 
 def curr_time_millis() -> float:
     return round(time.time(), 3)
@@ -0,0 +1,367 @@
+import os
+import gc
+import sys
+import math
+import time
+import tracemalloc
+import statistics
+from enum import Enum
+from typing import Callable, Dict, List, Tuple
+from algorithm_tester_common.tester_dataclasses import AlgTesterContext, Algorithm, DynamicClickOption
+
+"""
+Contains logic of time measurements and columns the tester adds to results of algorithms.
+"""
+
+TIMING_COLUMNS: List[str] = ["elapsed_time_min", "elapsed_time_median", "elapsed_time_stddev"]
+NOISE_COLUMNS: List[str] = ["load_avg", "involuntary_switches", "noisy"]
+RESOURCE_COLUMNS: List[str] = ["cpu_user_time", "cpu_system_time", "max_rss", "voluntary_ctx_switches", "involuntary_ctx_switches"]
+MEMORY_COLUMNS: List[str] = ["peak_memory"]
+TIMEOUT_COLUMNS: List[str] = ["timed_out", "elapsed_time"]
+
+# Two-sided 95% quantiles of Student's t-distribution by degrees of freedom
+_T_QUANTILES: Dict[int, float] = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306, 9: 2.262, 10: 2.228,
+    12: 2.179, 15: 2.131, 20: 2.086, 25: 2.060, 30: 2.042, 40: 2.021, 60: 2.000, 120: 1.980
+}
+
+class TimingModes(Enum):
+    """
+    How elapsed time of an instance is measured.
+
+    FIXED -- The algorithm is repeated time_retries times and the mean time is reported.
+    ADAPTIVE -- After warmup runs the algorithm is repeated until the relative confidence interval of the mean
+    is below the target, the time budget of the instance runs out or max_repeats is reached.
+    Min, median and standard deviation are reported as well.
+    """
+    FIXED = "fixed"
+    ADAPTIVE = "adaptive"
+
+class ExtraColumnsAlgorithm(Algorithm):
+    """
+    Wraps an algorithm plugin and appends columns the tester computes to its columns.
+    Parsers write these columns without any change of algorithms.
+    """
+
+    def __init__(self, algorithm: Algorithm, extra_columns: List[str]):
+        self._algorithm: Algorithm = algorithm
+        self._extra_columns: List[str] = extra_columns
+
+    def __getattr__(self, name: str):
+        if name == "_algorithm":
+            # Not yet set while unpickling
+            raise AttributeError(name)
+
+        return getattr(self._algorithm, name)
+
+    def get_wrapped_algorithm(self) -> Algorithm:
+        return self._algorithm
+
+    def required_click_params(self) -> List[DynamicClickOption]:
+        return self._algorithm.required_click_params()
+
+    def get_columns(self, *args, **kwargs) -> List[str]:
+        columns: List[str] = list(self._algorithm.get_columns(*args, **kwargs))
+
+        return columns + [column for column in self._extra_columns if column not in columns]
+
+    def get_name(self) -> str:
+        return self._algorithm.get_name()
+
+    def get_version(self) -> str:
+        return self._algorithm.get_version()
+
+    def perform_algorithm(self, context: AlgTesterContext, parsed_data: Dict[str, object]) -> Dict[str, object]:
+        return self._algorithm.perform_algorithm(context, parsed_data)
+
+def get_extra_columns(context: AlgTesterContext) -> List[str]:
+    """
+    Arguments:
+        context {AlgTesterContext} -- Current application context.
+
+    Returns:
+        List[str] -- Columns the tester adds to results of every algorithm.
+    """
+    extra_columns: List[str] = list()
+
+    if context.check_time and TimingModes[context.timing_name] == TimingModes.ADAPTIVE:
+        extra_columns.extend(TIMING_COLUMNS)
+
+    if context.check_time and context.isolate:
+        extra_columns.extend(NOISE_COLUMNS)
+
+    if context.track_resources:
+        extra_columns.extend(RESOURCE_COLUMNS)
+
+    if context.track_memory:
+        extra_columns.extend(MEMORY_COLUMNS)
+
+    if context.instance_timeout is not None:
+        # Timed out instances are told apart from results by these columns
+        extra_columns.extend(TIMEOUT_COLUMNS)
+
+    return extra_columns
+
+def wrap_algorithm(context: AlgTesterContext, algorithm: Algorithm) -> Algorithm:
+    """
+    Arguments:
+        context {AlgTesterContext} -- Current application context.
+        algorithm {Algorithm} -- Algorithm plugin.
+
+    Returns:
+        Algorithm -- The algorithm whose columns contain extra columns of the tester. The same algorithm if there are none.
+    """
+    extra_columns: List[str] = get_extra_columns(context)
+    if len(extra_columns) == 0:
+        return algorithm
+
+    return ExtraColumnsAlgorithm(algorithm, extra_columns)
+
+def get_t_quantile(degrees_of_freedom: int) -> float:
+    """
+    Returns:
+        float -- Two-sided 95% quantile of Student's t-distribution. Uses the closest smaller tabulated value.
+    """
+    if degrees_of_freedom > 120:
+        return 1.960
+
+    return _T_QUANTILES[max(df for df in _T_QUANTILES if df <= degrees_of_freedom)]
+
+def get_relative_ci(times: List[float]) -> float:
+    """
+    Arguments:
+        times {List[float]} -- Measured times.
+
+    Returns:
+        float -- Half-width of the 95% confidence interval of the mean relative to the mean. Infinity if it cannot be computed.
+    """
+    if len(times) < 2:
+        return math.inf
+
+    mean: float = statistics.mean(times)
+    if mean <= 0:
+        return 0.0
+
+    half_width: float = get_t_quantile(len(times) - 1) * statistics.stdev(times) / math.sqrt(len(times))
+    return half_width / mean
+
+def measure_adaptive(context: AlgTesterContext, func: Callable[[], Dict[str, object]], min_repeats: int = 3) -> Tuple[List[float], Dict[str, object]]:
+    """
+    Repeats the function until its timing is stable or the time budget runs out.
+
+    Arguments:
+        context {AlgTesterContext} -- Current application context. Provides warmup_runs, target_ci, time_budget and max_repeats.
+        func {Callable[[], Dict[str, object]]} -- Measured computation.
+
+    Keyword Arguments:
+        min_repeats {int} -- Minimal number of measured runs before the confidence interval is checked. (default: {3})
+
+    Returns:
+        (List[float], Dict[str, object]) -- Seconds of every measured run and result of the last run.
+    """
+    for _ in range(context.warmup_runs):
+        func()
+
+    times: List[float] = list()
+    deadline: float = time.perf_counter() + context.time_budget/1000
+
+    while True:
+        start: float = time.perf_counter()
+        solution = func()
+        end: float = time.perf_counter()
+        times.append(end - start)
+
+        if len(times) >= context.max_repeats or end >= deadline:
+            break
+
+        if len(times) >= min_repeats and get_relative_ci(times) <= context.target_ci:
+            break
+
+    return (times, solution)
+
+def get_timing_stats(times: List[float]) -> Dict[str, float]:
+    """
+    Arguments:
+        times {List[float]} -- Seconds of measured runs.
+
+    Returns:
+        Dict[str, float] -- Mean as elapsed_time and timing columns. All values are in milliseconds.
+    """
+    to_millis = lambda value: round(value*1000, 10)
+
+    return {
+        "elapsed_time": to_millis(statistics.mean(times)),
+        "elapsed_time_min": to_millis(min(times)),
+        "elapsed_time_median": to_millis(statistics.median(times)),
+        "elapsed_time_stddev": to_millis(statistics.stdev(times)) if len(times) > 1 else 0.0
+    }
+
+def isolate_worker(worker_index: int = None):
+    """
+    Prepares the current process for isolated measurements. 
+    The process is pinned to a dedicated CPU chosen by the worker index and objects that already exist are frozen, 
+    so the garbage collector does not traverse them.
+    
+    Keyword Arguments:
+        worker_index {int} -- Index of the worker. Workers with consecutive indices get different CPUs. None if the process is not pinned. (default: {None})
+    """
+    if worker_index is not None and hasattr(os, "sched_setaffinity"):
+        cpus: List[int] = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {cpus[worker_index % len(cpus)]})
+
+    gc.collect()
+    gc.freeze()
+
+def get_rusage():
+    """
+    Returns:
+        resource.struct_rusage -- Resource usage of the current thread, or of the process if the platform cannot tell. 
+        None if not available at all.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    who = getattr(resource, "RUSAGE_THREAD", resource.RUSAGE_SELF)
+    return resource.getrusage(who)
+
+def is_rusage_per_thread() -> bool:
+    """
+    Returns:
+        bool -- True if get_rusage accounts only the current thread.
+    """
+    try:
+        import resource
+    except ImportError:
+        return False
+
+    return hasattr(resource, "RUSAGE_THREAD")
+
+def get_involuntary_switches() -> int:
+    """
+    Returns:
+        int -- Number of involuntary context switches of the current thread. None if not available.
+    """
+    usage = get_rusage()
+
+    return usage.ru_nivcsw if usage is not None else None
+
+class IsolatedMeasurement(object):
+    """
+    Context manager around a measured computation. 
+    Garbage collection is disabled inside it and noise of the system is recorded.
+
+    The measurement is noisy if the thread was preempted by the scheduler or if the load average exceeds the number of CPUs.
+    """
+
+    def __enter__(self):
+        self._gc_enabled: bool = gc.isenabled()
+        gc.collect()
+        gc.disable()
+
+        self.involuntary_switches: int = None
+        self._start_switches: int = get_involuntary_switches()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        end_switches: int = get_involuntary_switches()
+
+        if self._gc_enabled:
+            gc.enable()
+
+        if self._start_switches is not None and end_switches is not None:
+            self.involuntary_switches = end_switches - self._start_switches
+
+        return False
+
+    def get_noise_stats(self) -> Dict[str, object]:
+        """
+        Returns:
+            Dict[str, object] -- Values of noise columns.
+        """
+        load_avg: float = os.getloadavg()[0] if hasattr(os, "getloadavg") else None
+
+        noisy: bool = (self.involuntary_switches or 0) > 0
+        if load_avg is not None:
+            noisy = noisy or load_avg > (os.cpu_count() or 1)
+
+        return {
+            "load_avg": load_avg,
+            "involuntary_switches": self.involuntary_switches,
+            "noisy": noisy
+        }
+
+class ResourceUsage(object):
+    """
+    Context manager that accounts resources used by a computation.
+
+    CPU times and context switches are taken from getrusage of the current thread where the platform supports it.
+    max_rss is the peak resident set size of the whole process in KiB so far. 
+    peak_memory is the peak of memory allocated by Python during the computation in bytes, traced by tracemalloc. 
+    Tracing slows Python code down, so it is used only if memory is tracked. It is stopped on exit if it was started by the manager.
+    """
+
+    def __init__(self, track_memory: bool = False):
+        self._track_memory: bool = track_memory
+        self._start = None
+        self._end = None
+        self.peak_memory: int = None
+        self._started_tracing: bool = False
+
+    def __enter__(self):
+        if self._track_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            if not hasattr(tracemalloc, "reset_peak"):
+                # Python < 3.9 resets the peak only with traces
+                tracemalloc.clear_traces()
+            else:
+                tracemalloc.reset_peak()
+            self._start_memory: int = tracemalloc.get_traced_memory()[0]
+
+        self._start = get_rusage()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._end = get_rusage()
+
+        if self._track_memory:
+            self.peak_memory = max(0, tracemalloc.get_traced_memory()[1] - self._start_memory)
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+        return False
+
+    def get_resource_stats(self, runs: int = 1) -> Dict[str, object]:
+        """
+        Keyword Arguments:
+            runs {int} -- How many times the computation ran while it was accounted. (default: {1})
+
+        Returns:
+            Dict[str, object] -- Values of resource columns. CPU times are in milliseconds per run, context switches are counted over all runs.
+        """
+        stats: Dict[str, object] = dict()
+
+        if self._start is not None and self._end is not None:
+            max_rss: int = self._end.ru_maxrss
+            if sys.platform == "darwin":
+                # Reported in bytes
+                max_rss = max_rss // 1024
+
+            stats.update({
+                "cpu_user_time": round((self._end.ru_utime - self._start.ru_utime)*1000/runs, 10),
+                "cpu_system_time": round((self._end.ru_stime - self._start.ru_stime)*1000/runs, 10),
+                "max_rss": max_rss,
+                "voluntary_ctx_switches": self._end.ru_nvcsw - self._start.ru_nvcsw,
+                "involuntary_ctx_switches": self._end.ru_nivcsw - self._start.ru_nivcsw
+            })
+
+        if self._track_memory:
+            stats["peak_memory"] = self.peak_memory
+
+        return stats
@@ -1,85 +1,257 @@
-import pkg_resources
 import sys, inspect, os
-from typing import Dict, List, Set
+import json
+import importlib
+from typing import Dict, List, Set, Tuple
 from configparser import ConfigParser
 from algorithm_tester_common.tester_dataclasses import Algorithm, Parser, Communicator, DynamicClickOption
+from algorithm_tester.helpers import get_cache_dir
 
 """
 This module should be used to automatically retrieve plugins (Algorithm, Parser and Communicators classes) from setup.py entrypoints.
 
+Plugins are discovered lazily. Names, modules and classes of all plugins are cached in a manifest in the user cache directory,
+so plugin packages are imported and plugins are instantiated only when they are used.
 """
 
-__discovered_plugins = {
-    entry_point.name: entry_point.load() for entry_point in pkg_resources.iter_entry_points('algorithm_tester.plugins')
+_ENTRY_POINTS_GROUP: str = 'algorithm_tester.plugins'
+
+# Entrypoint name: (type of plugins, class the plugins must be subclass of)
+_PLUGIN_KEYS: Dict[str, Tuple[str, type]] = {
+    "algorithms": ("algorithms", Algorithm),
+    "parsers": ("parsers", Parser),
+    "communicators": ("communicators", Communicator),
+    "communicators_internal": ("communicators", Communicator)
 }
 
+def get_manifest_path() -> str:
+    """
+    Returns:
+        str -- Path to the cached manifest of plugins.
+    """
+    return os.path.join(get_cache_dir(), "plugins_manifest.json")
+
+def iter_entry_points() -> List[object]:
+    """
+    importlib.metadata is imported only when plugins are discovered, it scans metadata of all installed distributions.
+
+    Returns:
+        List[object] -- All entrypoints of the plugins group.
+    """
+    if sys.version_info >= (3, 8):
+        import importlib.metadata as metadata
+    else:
+        import importlib_metadata as metadata
+
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        return list(entry_points.select(group=_ENTRY_POINTS_GROUP))
+
+    return list(entry_points.get(_ENTRY_POINTS_GROUP, list()))
+
 def get_subclasses(package, parent_class: type) -> List[type]:
     """
     Returns only plugin classes - classes that are provided in the package and are subclasses of the specified parent class.
-    
+
     Args:
         package ([type]): Inspected package
         parent_class (type): Class the plugin must be subclass of.
-    
+
     Returns:
         List[type]: All found plugin classes.
     """
     predicate = lambda member: inspect.isclass(member) and issubclass(member, parent_class) and member.__name__ != parent_class.__name__
-    
-    # clsmembers = inspect.getmembers(sys.modules[name], predicate=predicate)
-    return [plugin() for plugin in package.__plugins__ if predicate(plugin)]
 
-def get_plugins(key: str, parent_class: type) -> List[type]:
-    """[summary]
-    
+    return [plugin for plugin in package.__plugins__ if predicate(plugin)]
+
+def get_files_signature(paths: List[str]) -> Dict[str, int]:
+    """
+    Arguments:
+        paths {List[str]} -- Paths to files or directories.
+
+    Returns:
+        Dict[str, int] -- Modification times of existing paths. Directories of sys.path change when distributions are installed or removed.
+    """
+    signature: Dict[str, int] = dict()
+    for path in paths:
+        try:
+            signature[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+
+    return signature
+
+def get_search_path_signature() -> Dict[str, int]:
+    """
+    Returns:
+        Dict[str, int] -- Modification times of directories of sys.path. The working directory is left out, 
+            python adds it as "" or as its absolute path, so the manifest would be rebuilt in every directory and whenever a file in it changes.
+    """
+    cwd: str = os.getcwd()
+    paths: List[str] = [path for path in sys.path if os.path.isabs(path) and os.path.normpath(path) != cwd]
+
+    return get_files_signature(paths)
+
+def load_manifest(path: str) -> Dict[str, object]:
+    """
     Arguments:
-        key {str} -- Type of plugin the plugin.
-        parent_class {type} -- Class the plugin must be subclass of.
-    
+        path {str} -- Path to the manifest file.
+
+    Returns:
+        Dict[str, object] -- The cached manifest. None if it does not exist or it is outdated.
+    """
+    try:
+        with open(path, "r") as manifest_file:
+            manifest: Dict[str, object] = json.load(manifest_file)
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get("slack_config") != os.environ.get("slack_config") or manifest.get("search_path") != get_search_path_signature():
+        return None
+
+    # Plugin modules that were edited in place, e.g. in development installations
+    files: Dict[str, int] = manifest.get("files", dict())
+    if get_files_signature(list(files.keys())) != files:
+        return None
+
+    return manifest
+
+def save_manifest(path: str, manifest: Dict[str, object]):
+    temp_path: str = f'{path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, "w") as manifest_file:
+            json.dump(manifest, manifest_file)
+
+        os.replace(temp_path, path)
+    except OSError as e:
+        print(f'Plugins manifest was not cached: {e}')
+
+def discover_plugins() -> Tuple[Dict[str, object], Dict[str, Dict[str, object]]]:
+    """
+    Loads all entrypoints and instantiates all plugins, once per changed installation.
+
     Returns:
-        List[type] -- List of plugin classes of the required parent class that were provided using entrypoints.
+        Tuple[Dict[str, object], Dict[str, Dict[str, object]]] -- A new manifest and instances of plugins under their type and name.
     """
-    package_algorithms = __discovered_plugins.get(key)
+    search_path: Dict[str, int] = get_search_path_signature()
+    packages: List[Tuple[str, object]] = [(entry_point.name, entry_point.load()) for entry_point in iter_entry_points() if entry_point.name in _PLUGIN_KEYS]
 
-    if package_algorithms is None:
-        return list()
+    # Entrypoint packages may provide the Slack configuration when they are loaded
+    slack_config: str = os.environ.get("slack_config")
+    if slack_config is not None:
+        load_slack_config()
 
-    subclasses = get_subclasses(package_algorithms, parent_class)
-    return subclasses
+    plugins: Dict[str, Dict[str, List[str]]] = {plugins_type: dict() for plugins_type, _ in _PLUGIN_KEYS.values()}
+    instances: Dict[str, Dict[str, object]] = {plugins_type: dict() for plugins_type, _ in _PLUGIN_KEYS.values()}
+    files: List[str] = list()
+    for key, package in packages:
+        if key == "communicators_internal" and slack_config is None:
+            continue
+
+        plugins_type, parent_class = _PLUGIN_KEYS[key]
+        files.append(inspect.getfile(package))
+        for plugin_class in get_subclasses(package, parent_class):
+            plugin = plugin_class()
+            plugins[plugins_type][plugin.get_name()] = [plugin_class.__module__, plugin_class.__qualname__, key]
+            instances[plugins_type][plugin.get_name()] = plugin
+            files.append(inspect.getfile(plugin_class))
+
+    manifest: Dict[str, object] = {
+        "slack_config": slack_config,
+        "search_path": search_path,
+        "files": get_files_signature(files),
+        "plugins": plugins
+    }
+
+    return manifest, instances
+
+def load_slack_config():
+    """
+    Adds Slack config data to environment vars.
+
+    Requires slack_config environment variable which contains a path to a valid slack configuration file.
+    """
+    config_parser: ConfigParser = ConfigParser()
+    with open(os.environ["slack_config"]) as config_file:
+        config_parser.read_file(config_file)
+
+    os.environ["slack_access_token"] = config_parser["auth"]["access_token"]
+    os.environ["slack_channel_id"] = config_parser["channel"]["id"]
+    os.environ["slack_bot_username"] = config_parser["channel"]["bot_username"]
 
 class Plugins():
     """
-    Contains all found plugin classes.
+    Contains all found plugins.
+
+    Plugins are kept in registries keyed by their names. A plugin is instantiated when it is requested for the first time.
+    Internal communicators (Slack) are available only if slack_config environment variable is provided.
     """
 
-    def __init__(self):
-        self.__algorithms: List[Algorithm] = get_plugins("algorithms", parent_class=Algorithm)
-        self.__parsers: List[Parser] = get_plugins("parsers", parent_class=Parser)
-        self.__communicators: List[Communicator] = get_plugins("communicators", parent_class=Communicator)
+    def __init__(self, manifest_path: str = None):
+        """
+        Keyword Arguments:
+            manifest_path {str} -- Path to the cached manifest of plugins. (default: {get_manifest_path()})
+        """
+        self.__manifest_path: str = manifest_path
+        self.__manifest: Dict[str, Dict[str, List[str]]] = None
+        self.__instances: Dict[str, Dict[str, object]] = {plugins_type: dict() for plugins_type, _ in _PLUGIN_KEYS.values()}
+        self.__slack_config_loaded: bool = False
+
+    def __get_manifest(self) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Returns:
+            Dict[str, Dict[str, List[str]]] -- [module, class name, entrypoint name] of all plugins under their type and name.
+        """
+        if self.__manifest is not None:
+            return self.__manifest
+
+        manifest_path: str = self.__manifest_path or get_manifest_path()
+        manifest: Dict[str, object] = load_manifest(manifest_path)
+        if manifest is None:
+            manifest, instances = discover_plugins()
+            save_manifest(manifest_path, manifest)
 
-        # Internal communicators
-        self.__add_slack_communicator()
+            # Plugins were instantiated during the discovery
+            for plugins_type, plugins in instances.items():
+                self.__instances[plugins_type].update(plugins)
+            self.__slack_config_loaded = manifest["slack_config"] is not None
 
-    def __add_slack_communicator(self):
+        self.__manifest = manifest["plugins"]
+        return self.__manifest
+
+    def __get_plugin(self, plugins_type: str, name: str) -> object:
         """
-        Adds Slack communicator to other communicators if slack_config environment variable is provided.
+        Arguments:
+            plugins_type {str} -- Type of the plugin.
+            name {str} -- Name of the plugin.
+
+        Raises:
+            KeyError: The plugin does not exist.
 
-        Requires slack_config environment variable which contains a path to a valid slack configuration file.
+        Returns:
+            object -- Instance of the plugin.
         """
-        if os.environ.get("slack_config") is None:
-            return
-        
-        config_parser: ConfigParser = ConfigParser()
-        with open(os.environ["slack_config"]) as config_file:
-            config_parser.read_file(config_file)
-        
-        # Add slack config data to environment vars
-        os.environ["slack_access_token"] = config_parser["auth"]["access_token"]
-        os.environ["slack_channel_id"] = config_parser["channel"]["id"]
-        os.environ["slack_bot_username"] = config_parser["channel"]["bot_username"]
+        registry: Dict[str, object] = self.__instances[plugins_type]
+
+        if name not in registry:
+            module_name, class_name, key = self.__get_manifest()[plugins_type][name]
+            if key == "communicators_internal" and not self.__slack_config_loaded:
+                load_slack_config()
+                self.__slack_config_loaded = True
+
+            registry[name] = getattr(importlib.import_module(module_name), class_name)()
+
+        return registry[name]
 
-        self.__communicators.extend(get_plugins("communicators_internal", parent_class=Communicator))
-        print
+    def __get_plugins(self, plugins_type: str, with_names: List[str] = None) -> List[object]:
+        names: List[str] = self.__get_names(plugins_type)
+        if with_names is not None:
+            names = [name for name in names if name in with_names]
+
+        return [self.__get_plugin(plugins_type, name) for name in names]
+
+    def __get_names(self, plugins_type: str) -> List[str]:
+        return list(self.__get_manifest()[plugins_type].keys())
 
     #################################################################################################
     #  ALGORITHMS                                                                                   #
@@ -87,55 +259,50 @@ class Plugins():
 
     def get_dynamic_options(self) -> List[DynamicClickOption]:
         """
-        
+
         Returns:
             List[DynamicClickOption]: All dynamic options that are required by certain algorithms.
         """
         options: Set[DynamicClickOption] = set("")
-        for alg in self.__algorithms:
+        for alg in self.get_algorithms():
             params: List[DynamicClickOption] = alg.required_click_params()
-            
+
             if params is not None:
                 options.update(params)
-        
+
         return list(options)
 
     def get_algorithms(self, with_names: List[str] = None) -> List[Algorithm]:
         """
         Get instances of multiple algorithms.
-        
+
         Args:
             with_names (List[str], optional): Names of required algorithms. Defaults to None.
-        
+
         Returns:
             List[Algorithm]: Instances of required algorithms.
         """
-        if with_names is None:
-            return self.__algorithms
-        
-        # Filter algorithms that match the given names
-
-        return [alg for alg in self.__algorithms if alg.get_name() in with_names]
+        return self.__get_plugins("algorithms", with_names)
 
     def get_algorithm(self, name: str) -> Algorithm:
         """
         Get an instance of an algorithm by name.
-        
+
         Args:
             name (str): Name of the required algorithm.
-        
+
         Returns:
             Algorithm: Instance of the required algorithm.
         """
-        return [alg for alg in self.__algorithms if alg.get_name() == name][0]
-    
+        return self.__get_plugin("algorithms", name)
+
     def get_algorithm_names(self) -> List[str]:
         """
-        
+
         Returns:
             List[str]: Names of all available algorithms.
         """
-        return [alg.get_name() for alg in self.__algorithms]
+        return self.__get_names("algorithms")
 
     #################################################################################################
     #  PARSERS                                                                                      #
@@ -143,39 +310,34 @@ class Plugins():
 
     def get_parser(self, name: str) -> Parser:
         """
-        
+
         Args:
             name (str): Name of the required parser.
-        
+
         Returns:
             Parser: Instance of the required parser.
         """
-        return [parser for parser in self.__parsers if parser.get_name() == name][0]
-    
+        return self.__get_plugin("parsers", name)
+
     def get_parser_names(self) -> List[str]:
         """
-        
+
         Returns:
             List[str]: Get names of all available parsers.
         """
-        return [parser.get_name() for parser in self.__parsers]
+        return self.__get_names("parsers")
 
     def get_parsers(self, with_names: List[str] = None) -> List[Parser]:
         """
         Get instances of multiple parsers.
-        
+
         Args:
             with_names (List[str], optional): Names of required parsers. Defaults to None.
-        
+
         Returns:
             List[Parser]: Instances of required algorithms.
         """
-        if with_names is None:
-            return self.__parsers
-        
-        # Filter algorithms that match the given names
-
-        return [parser for parser in self.__parsers if parser.get_name() in with_names]
+        return self.__get_plugins("parsers", with_names)
 
     #################################################################################################
     #  COMMUNICATORS                                                                                #
@@ -184,38 +346,33 @@ class Plugins():
     def get_communicators(self, with_names: List[str] = None) -> List[Communicator]:
         """
         Get instances of multiple communicators.
-        
+
         Args:
             with_names (List[str], optional): Names of required communicators. Defaults to None.
-        
+
         Returns:
             List[Communicator]: Instances of required communicators.
         """
-        if with_names is None:
-            return self.__communicators
-        
-        # Filter communicators that match the given names
-
-        return [comm for comm in self.__communicators if comm.get_name() in with_names]
+        return self.__get_plugins("communicators", with_names)
 
     def get_communicator(self, name: str) -> Communicator:
         """
         Get an instance of an communicator by name.
-        
+
         Args:
             name (str): Name of the required communicator.
-        
+
         Returns:
             Communicator: Instance of the required communicator.
         """
-        return [comm for comm in self.__communicators if comm.get_name() == name][0]
-    
+        return self.__get_plugin("communicators", name)
+
     def get_communicator_names(self) -> List[str]:
         """
-        
+
         Returns:
             List[str]: Names of all available communicators.
         """
-        return [comm.get_name() for comm in self.__communicators]
+        return self.__get_names("communicators")
 
-plugins: Plugins = Plugins()
\ No newline at end of file
+plugins: Plugins = Plugins()
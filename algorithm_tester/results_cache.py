@@ -0,0 +1,360 @@
+import os
+import copy
+import time
+import pickle
+import sqlite3
+import hashlib
+import collections
+from typing import Dict, List
+from algorithm_tester_common.tester_dataclasses import AlgTesterContext, Algorithm, Parser, DynamicClickOption
+from algorithm_tester.helpers import get_cache_dir
+
+"""
+Contains the content-addressed cache of results, that is shared by all runs and output directories,
+and the cache of duplicate instances of the current run.
+"""
+
+# Keys that runners add to parsed instances, they are not part of the instance content
+RUNNER_KEYS: List[str] = ["output_filename", "algorithm_name", "algorithm"]
+
+def get_results_cache_path() -> str:
+    """
+    Returns:
+        str -- Path to the database with cached results in the user cache directory.
+    """
+    return os.path.join(get_cache_dir(), "results_cache.sqlite")
+
+def get_instance_content(context: AlgTesterContext, parser: Parser, instance_data: Dict[str, object]) -> Dict[str, object]:
+    """
+    Arguments:
+        context {AlgTesterContext} -- Current application context.
+        parser {Parser} -- Used parser.
+        instance_data {Dict[str, object]} -- Instance data prepared by a runner.
+
+    Returns:
+        Dict[str, object] -- Instance data as the parser created it, without identifier keys, data added by runners and extra options.
+    """
+    excluded: List[str] = RUNNER_KEYS + parser.get_identifier_keys()
+
+    return {key: value for key, value in instance_data.items() if key not in excluded and key not in context.extra_options}
+
+def get_instance_values(context: AlgTesterContext, parser: Parser, instance_data: Dict[str, object]) -> Dict[str, object]:
+    """
+    Returns:
+        Dict[str, object] -- Values that are specific for the instance and are not a part of its content. They are copied to solutions of other instances.
+    """
+    content: Dict[str, object] = get_instance_content(context, parser, instance_data)
+
+    return {key: value for key, value in instance_data.items() if key not in content}
+
+def get_relevant_options(context: AlgTesterContext, algorithm: Algorithm) -> Dict[str, object]:
+    """
+    Returns:
+        Dict[str, object] -- Extra options the algorithm requires and their values.
+    """
+    params: List[DynamicClickOption] = algorithm.required_click_params() or list()
+
+    return {param.name: context.extra_options.get(param.name) for param in params}
+
+def get_solution_key(context: AlgTesterContext, parser: Parser, algorithm: Algorithm, instance_data: Dict[str, object]) -> str:
+    """
+    Arguments:
+        context {AlgTesterContext} -- Current application context.
+        parser {Parser} -- Used parser. Provides fingerprints of instances.
+        algorithm {Algorithm} -- Used algorithm.
+        instance_data {Dict[str, object]} -- Instance data prepared by a runner. It must not be modified by the algorithm yet.
+
+    Returns:
+        str -- Digest of the instance content, the parser, the algorithm name, the algorithm version and extra options the algorithm requires.
+    """
+    fingerprint: str = parser.get_instance_fingerprint(get_instance_content(context, parser, instance_data))
+    options: List[str] = [f'{name}={value!r}' for name, value in sorted(get_relevant_options(context, algorithm).items())]
+    parts: List[str] = [parser.get_name(), algorithm.get_name(), str(algorithm.get_version()), ",".join(options), fingerprint]
+
+    return hashlib.blake2b("\0".join(parts).encode(), digest_size=20).hexdigest()
+
+def dump_solution(solution: Dict[str, object]) -> bytes:
+    """
+    Returns:
+        bytes -- Pickled solution without its algorithm. None if it cannot be pickled.
+    """
+    try:
+        return pickle.dumps({name: value for name, value in solution.items() if name != "algorithm"}, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        print(f'Solution was not cached: {e}')
+        return None
+
+def load_solution(context: AlgTesterContext, parser: Parser, data: bytes, algorithm: Algorithm, instance_data: Dict[str, object]) -> Dict[str, object]:
+    """
+    Returns:
+        Dict[str, object] -- Unpickled solution with identifiers, the output file, algorithm and extra options of the instance.
+    """
+    solution: Dict[str, object] = pickle.loads(data)
+    solution.update(get_instance_values(context, parser, instance_data))
+    solution["algorithm"] = algorithm
+
+    return solution
+
+def is_result_measured(context: AlgTesterContext) -> bool:
+    """
+    Returns:
+        bool -- True if results contain measurements of the current run, so they must not come from the cache.
+    """
+    return context.check_time or context.track_resources or context.track_memory
+
+def create_results_cache(context: AlgTesterContext, parser: Parser, path: str = None) -> 'ResultsCache':
+    """
+    Opens the results cache if the context enables it.
+
+    Arguments:
+        context {AlgTesterContext} -- Current application context.
+        parser {Parser} -- Used parser.
+
+    Keyword Arguments:
+        path {str} -- Path to the database. (default: {get_results_cache_path()})
+
+    Returns:
+        ResultsCache -- The opened cache. None if results are not cached.
+    """
+    if not context.result_cache:
+        return None
+
+    if is_result_measured(context):
+        print("Results cache is bypassed, results of this run are measured.")
+        return None
+
+    if context.parse_in_workers:
+        print("Results cache is not used, instances are parsed by workers.")
+        return None
+
+    results_cache: ResultsCache = ResultsCache(path or get_results_cache_path(), parser, max_size=context.result_cache_size*1024*1024)
+    try:
+        results_cache.open()
+    except (OSError, sqlite3.Error) as e:
+        print(f'Results cache could not be opened: {e}')
+        return None
+
+    return results_cache
+
+def create_duplicates_cache(context: AlgTesterContext, parser: Parser) -> 'DuplicatesCache':
+    """
+    Arguments:
+        context {AlgTesterContext} -- Current application context.
+        parser {Parser} -- Used parser.
+
+    Returns:
+        DuplicatesCache -- Cache of duplicate instances. None if duplicates are not removed.
+    """
+    if not context.dedup:
+        return None
+
+    if is_result_measured(context):
+        print("Duplicate instances are computed, results of this run are measured.")
+        return None
+
+    if context.parse_in_workers:
+        print("Duplicate instances are computed, instances are parsed by workers.")
+        return None
+
+    return DuplicatesCache(parser)
+
+class ResultsCache(object):
+    """
+    SQLite database of solutions. A solution is stored under a digest of the instance content, the parser, the algorithm name,
+    the algorithm version and extra options the algorithm requires.
+
+    Least recently used solutions are evicted when the database is bigger than its maximal size.
+    Writes are committed in batches. The cache is used only by the main process, cached solutions are not sent to workers.
+    """
+
+    COMMIT_ENTRIES: int = 256
+
+    def __init__(self, path: str, parser: Parser, max_size: int = 1024*1024*1024):
+        """
+        Arguments:
+            path {str} -- Path to the database.
+            parser {Parser} -- Used parser. Provides fingerprints of instances.
+
+        Keyword Arguments:
+            max_size {int} -- Maximal size of all cached solutions in bytes. (default: {1 GiB})
+        """
+        self._path: str = path
+        self._parser: Parser = parser
+        self._max_size: int = max_size
+        self._size: int = 0
+        self._uncommitted: int = 0
+        # Keys of solutions that were used since the last commit
+        self._used_keys: List[str] = list()
+        self._connection: sqlite3.Connection = None
+
+    def open(self):
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        self._connection = sqlite3.connect(self._path, timeout=30.0)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, solution BLOB NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+        self._connection.commit()
+
+        self._size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if self._size > self._max_size:
+            # The maximal size was decreased since the last run
+            self.evict()
+
+    def get_key(self, context: AlgTesterContext, algorithm: Algorithm, instance_data: Dict[str, object]) -> str:
+        """
+        Arguments:
+            context {AlgTesterContext} -- Current application context.
+            algorithm {Algorithm} -- Used algorithm.
+            instance_data {Dict[str, object]} -- Instance data prepared by a runner. It must not be modified by the algorithm yet.
+
+        Returns:
+            str -- Key of the solution in the cache.
+        """
+        return get_solution_key(context, self._parser, algorithm, instance_data)
+
+    def get_solution(self, context: AlgTesterContext, key: str, algorithm: Algorithm, instance_data: Dict[str, object]) -> Dict[str, object]:
+        """
+        Arguments:
+            context {AlgTesterContext} -- Current application context.
+            key {str} -- Key of the solution.
+            algorithm {Algorithm} -- Used algorithm.
+            instance_data {Dict[str, object]} -- Instance data prepared by a runner.
+
+        Returns:
+            Dict[str, object] -- Cached solution with identifiers, the output file, algorithm and extra options of the instance. None if it is not cached.
+        """
+        row = self._connection.execute("SELECT solution FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        self._used_keys.append(key)
+        self._count_write()
+
+        return load_solution(context, self._parser, row[0], algorithm, instance_data)
+
+    def put_solution(self, key: str, solution: Dict[str, object]):
+        """
+        Stores a solution. It must be stored before it is written, parsers may modify it.
+
+        Arguments:
+            key {str} -- Key of the solution.
+            solution {Dict[str, object]} -- Computed solution.
+        """
+        data: bytes = dump_solution(solution)
+        if data is None or len(data) > self._max_size:
+            return
+
+        replaced = self._connection.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+        self._connection.execute("INSERT OR REPLACE INTO results (key, solution, size, last_used) VALUES (?, ?, ?, ?)", (key, data, len(data), time.time()))
+        self._size += len(data) - (replaced[0] if replaced is not None else 0)
+        self._count_write()
+
+        if self._size > self._max_size:
+            self.evict()
+
+    def evict(self):
+        """
+        Removes least recently used solutions until the cache takes at most 90 % of its maximal size.
+        """
+        # Recently used solutions are not evicted, other runs may use the same database
+        self.commit()
+        self._size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        target_size: int = int(self._max_size*0.9)
+        evicted: List[str] = list()
+
+        for key, size in self._connection.execute("SELECT key, size FROM results ORDER BY last_used"):
+            if self._size <= target_size:
+                break
+            evicted.append(key)
+            self._size -= size
+
+        self._connection.executemany("DELETE FROM results WHERE key = ?", [(key,) for key in evicted])
+        self.commit()
+
+    def _count_write(self):
+        self._uncommitted += 1
+
+        if self._uncommitted >= self.COMMIT_ENTRIES:
+            self.commit()
+
+    def commit(self):
+        if self._connection is not None:
+            used_time: float = time.time()
+            self._connection.executemany("UPDATE results SET last_used = ? WHERE key = ?", [(used_time, key) for key in self._used_keys])
+            self._connection.commit()
+        self._used_keys = list()
+        self._uncommitted = 0
+
+    def close(self):
+        if self._connection is None:
+            return
+
+        self.commit()
+        self._connection.close()
+        self._connection = None
+
+class DuplicatesCache(object):
+    """
+    Solutions computed in the current run, kept in memory under the same keys as in the results cache.
+    Instances with the same content are computed once for every algorithm, other instances get copies of the solution.
+
+    Only MAX_ENTRIES most recently used solutions are kept.
+    """
+
+    MAX_ENTRIES: int = 4096
+
+    def __init__(self, parser: Parser, max_entries: int = None):
+        """
+        Arguments:
+            parser {Parser} -- Used parser. Provides fingerprints of instances.
+
+        Keyword Arguments:
+            max_entries {int} -- Maximal number of kept solutions. (default: {MAX_ENTRIES})
+        """
+        self._parser: Parser = parser
+        self._max_entries: int = max_entries or self.MAX_ENTRIES
+        self._solutions: Dict[str, bytes] = collections.OrderedDict()
+
+    def get_key(self, context: AlgTesterContext, algorithm: Algorithm, instance_data: Dict[str, object]) -> str:
+        return get_solution_key(context, self._parser, algorithm, instance_data)
+
+    def get_solution(self, context: AlgTesterContext, key: str, algorithm: Algorithm, instance_data: Dict[str, object]) -> Dict[str, object]:
+        """
+        Returns:
+            Dict[str, object] -- Copy of the solution with identifiers, the output file, algorithm and extra options of the instance. None if it is not kept.
+        """
+        data: bytes = self._solutions.get(key)
+        if data is None:
+            return None
+
+        self._solutions.move_to_end(key)
+
+        return load_solution(context, self._parser, data, algorithm, instance_data)
+
+    def put_solution(self, key: str, solution: Dict[str, object]):
+        data: bytes = dump_solution(solution)
+        if data is None:
+            return
+
+        self._solutions[key] = data
+        self._solutions.move_to_end(key)
+        while len(self._solutions) > self._max_entries:
+            self._solutions.popitem(last=False)
+
+    def copy_solution(self, context: AlgTesterContext, solution: Dict[str, object], algorithm: Algorithm, instance_data: Dict[str, object]) -> Dict[str, object]:
+        """
+        Arguments:
+            context {AlgTesterContext} -- Current application context.
+            solution {Dict[str, object]} -- Solution of an instance with the same content.
+            algorithm {Algorithm} -- Used algorithm.
+            instance_data {Dict[str, object]} -- Instance data prepared by a runner.
+
+        Returns:
+            Dict[str, object] -- Copy of the solution with identifiers, the output file and extra options of the instance.
+        """
+        solution_copy: Dict[str, object] = copy.deepcopy({name: value for name, value in solution.items() if name != "algorithm"})
+        solution_copy.update(get_instance_values(context, self._parser, instance_data))
+        solution_copy["algorithm"] = algorithm
+
+        return solution_copy
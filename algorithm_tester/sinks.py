@@ -0,0 +1,546 @@
+import os
+import ast
+import sys
+import math
+import struct
+import sqlite3
+from array import array
+from enum import Enum
+from typing import IO, Dict, List, Tuple
+from algorithm_tester_common.tester_dataclasses import AlgTesterContext, ResultSink, LogFsyncPolicy
+from algorithm_tester.compression import strip_compression_suffix
+
+"""
+Contains built-in result sinks. They store results in formats that are loaded for analysis without parsing text.
+"""
+
+try:
+    import numpy
+except ImportError:
+    # Columns are loaded into arrays of the array module
+    numpy = None
+
+_INT64_MIN: int = -2**63
+_INT64_MAX: int = 2**63 - 1
+
+_NPY_MAGIC: bytes = b"\x93NUMPY\x01\x00"
+# Headers have a fixed size, so the shape can be rewritten in place when values are appended
+_NPY_HEADER_SIZE: int = 128
+# Flags of float columns that mark values which were integers
+_INTS_DESCR: str = "|i1"
+
+class OutputSinks(Enum):
+    """
+    Contains all sinks of results.
+
+    TEXT -- Results are written into text output files by Parser.write_results_batch.
+    COLUMNAR -- Every column is stored in a NumPy .npy file in a directory named after the output file.
+    Integers and floats are stored as int64 and float64 arrays, other values as UTF-8 strings with an array of their end offsets.
+    Missing values are NaN in numeric columns and None in string columns.
+    SQLITE -- Results are stored in the results table of a SQLite database named after the output file.
+    """
+    TEXT = "text"
+    COLUMNAR = "columnar"
+    SQLITE = "sqlite"
+
+    def get_suffix(self) -> str:
+        """
+        Returns:
+            str -- Suffix that replaces the extension of output files.
+        """
+        return {OutputSinks.COLUMNAR: ".columns", OutputSinks.SQLITE: ".sqlite"}.get(self, "")
+
+def create_sink(context: AlgTesterContext, output_filename: str, columns: List[str]) -> ResultSink:
+    """
+    Arguments:
+        context {AlgTesterContext} -- Current application context.
+        output_filename {str} -- Name of the output file in the output directory.
+        columns {List[str]} -- Columns of the algorithm.
+
+    Returns:
+        ResultSink -- Opened sink of the output file. Results of previous runs are kept.
+    """
+    sink: OutputSinks = OutputSinks[context.output_sink_name]
+    path: str = f'{context.output_dir}/{os.path.splitext(strip_compression_suffix(output_filename))[0]}{sink.get_suffix()}'
+    sync: bool = LogFsyncPolicy[context.log_fsync] != LogFsyncPolicy.NONE
+
+    if sink == OutputSinks.COLUMNAR:
+        return ColumnarSink(path, columns, sync=sync)
+
+    return SQLiteSink(path, columns, sync=sync)
+
+def get_value_kind(value: object) -> str:
+    """
+    Returns:
+        str -- The narrowest column kind the value can be stored in. Missing values are stored as NaN until strings are stored in the column.
+    """
+    if isinstance(value, int) and _INT64_MIN <= value <= _INT64_MAX:
+        return "int"
+    if value is None or isinstance(value, float):
+        return "float"
+
+    return "str"
+
+def is_missing_value(value: object) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+def get_npy_header(descr: str, length: int) -> bytes:
+    header: str = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': ({length},), }}"
+    header = header.ljust(_NPY_HEADER_SIZE - len(_NPY_MAGIC) - 3) + "\n"
+
+    return _NPY_MAGIC + struct.pack("<H", len(header)) + header.encode("latin1")
+
+def read_npy_header(npy_file: IO) -> Tuple[str, int]:
+    """
+    Arguments:
+        npy_file {IO} -- .npy file written by a columnar sink, opened in binary mode.
+
+    Returns:
+        (str, int) -- Type of values and number of committed values.
+    """
+    npy_file.seek(0)
+    data: bytes = npy_file.read(_NPY_HEADER_SIZE)
+    if len(data) < _NPY_HEADER_SIZE or not data.startswith(_NPY_MAGIC):
+        raise ValueError(f'{npy_file.name} is not a .npy file of a columnar sink.')
+
+    header_length: int = struct.unpack("<H", data[8:10])[0]
+    header: Dict[str, object] = ast.literal_eval(data[10:10 + header_length].decode("latin1"))
+
+    return (header["descr"], header["shape"][0])
+
+def read_npy_values(npy_file: IO, typecode: str, start: int, end: int) -> array:
+    """
+    Returns:
+        array -- Values of the .npy file in range [start, end).
+    """
+    values: array = array(typecode)
+    npy_file.seek(_NPY_HEADER_SIZE + start*values.itemsize)
+    values.frombytes(npy_file.read((end - start)*values.itemsize))
+    if sys.byteorder == "big":
+        values.byteswap()
+
+    return values
+
+def write_npy_values(npy_file: IO, values: array):
+    """
+    Appends values at the end of the .npy file. They are little-endian as the header says.
+    """
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+
+    npy_file.seek(0, os.SEEK_END)
+    npy_file.write(values.tobytes())
+
+class ColumnFile(object):
+    """
+    One column of a columnar sink.
+
+    Integers and floats are stored in <column>.npy. Strings are stored in <column>.utf8, their end offsets in <column>.offsets.npy.
+    The end offset of a missing string is stored bitwise inverted, so it is negative. Float columns flag values that were integers
+    in <column>.ints.npy. The shape in the .npy header is the number of committed values, values after it are discarded
+    when the column is opened again.
+    If a value does not fit the current kind of the column, the column is converted to a wider kind: int -> float -> str.
+    Values are converted from the values that were written, so integers are stored as "1" even if the column was a float column.
+    """
+
+    # Kind: (.npy descr, array typecode)
+    KINDS: Dict[str, Tuple[str, str]] = {
+        "int": ("<i8", "q"),
+        "float": ("<f8", "d"),
+        "str": ("<i8", "q")
+    }
+
+    def __init__(self, directory: str, name: str):
+        """
+        Arguments:
+            directory {str} -- Directory of the columnar sink.
+            name {str} -- Name of the column.
+        """
+        self._base_path: str = os.path.join(directory, name.replace(os.sep, "_"))
+        self.kind: str = None
+        self.length: int = 0
+        self._npy_file: IO = None
+        self._data_file: IO = None
+        self._ints_file: IO = None
+        # End offset of the last string in the data file
+        self._data_offset: int = 0
+
+    def _get_npy_path(self, kind: str) -> str:
+        return f'{self._base_path}.offsets.npy' if kind == "str" else f'{self._base_path}.npy'
+
+    def _get_paths(self, kind: str) -> List[str]:
+        """
+        Returns:
+            List[str] -- Paths to all files of the column if it is of the kind.
+        """
+        if kind == "str":
+            return [self._get_npy_path(kind), f'{self._base_path}.utf8']
+        if kind == "float":
+            return [self._get_npy_path(kind), f'{self._base_path}.ints.npy']
+
+        return [self._get_npy_path(kind)]
+
+    def _open_files(self, kind: str, mode: str):
+        self.kind = kind
+        paths: List[str] = self._get_paths(kind)
+        self._npy_file = open(paths[0], mode)
+        if kind == "str":
+            self._data_file = open(paths[1], mode)
+        elif kind == "float":
+            self._ints_file = open(paths[1], mode)
+
+    def _close_files(self):
+        for column_file in (self._npy_file, self._data_file, self._ints_file):
+            if column_file is not None:
+                column_file.close()
+        self._npy_file = None
+        self._data_file = None
+        self._ints_file = None
+
+    def open(self, read_only: bool = False) -> int:
+        """
+        Opens files of the column if they exist.
+
+        Keyword Arguments:
+            read_only {bool} -- True if the column is only read, e. g. while a run appends values to it. (default: {False})
+
+        Returns:
+            int -- Number of committed values. None if the column does not exist yet.
+        """
+        for kind in ("str", "int"):
+            if not os.path.exists(self._get_npy_path(kind)):
+                continue
+
+            if kind != "str":
+                # Integers and floats share the path, the header tells them apart
+                with open(self._get_npy_path(kind), "rb") as npy_file:
+                    descr, _ = read_npy_header(npy_file)
+                kind = "int" if descr == self.KINDS["int"][0] else "float"
+
+            self._open_files(kind, "rb" if read_only else "r+b")
+            _, length = read_npy_header(self._npy_file)
+            self._set_length(length)
+
+            return length
+
+        return None
+
+    def _set_length(self, length: int):
+        self.length = length
+        if self.kind == "str":
+            offset: int = read_npy_values(self._npy_file, "q", length - 1, length)[0] if length > 0 else 0
+            self._data_offset = offset if offset >= 0 else ~offset
+
+    def truncate(self, length: int):
+        """
+        Discards values after the first length values, e. g. uncommitted values of the last run.
+        """
+        self._set_length(length)
+        self._npy_file.truncate(_NPY_HEADER_SIZE + length*8)
+        if self.kind == "str":
+            self._data_file.truncate(self._data_offset)
+        elif self.kind == "float":
+            self._ints_file.truncate(_NPY_HEADER_SIZE + length)
+
+    def read_values(self) -> List[object]:
+        """
+        Returns:
+            List[object] -- All values of the column. Missing strings are None.
+        """
+        if self.kind != "str":
+            return read_npy_values(self._npy_file, self.KINDS[self.kind][1], 0, self.length).tolist()
+
+        offsets: array = read_npy_values(self._npy_file, "q", 0, self.length)
+        self._data_file.seek(0)
+        data: bytes = self._data_file.read(self._data_offset)
+
+        values: List[str] = list()
+        start: int = 0
+        for end in offsets:
+            if end < 0:
+                values.append(None)
+            else:
+                values.append(data[start:end].decode("utf-8"))
+                start = end
+
+        return values
+
+    def _read_written_values(self) -> List[object]:
+        """
+        Returns:
+            List[object] -- All values of the column as they were written. Missing values are None.
+        """
+        values: List[object] = self.read_values()
+        if self.kind != "float":
+            return values
+
+        ints: array = read_npy_values(self._ints_file, "b", 0, self.length)
+
+        return [None if math.isnan(value) else (int(value) if is_int else value) for value, is_int in zip(values, ints)]
+
+    def convert(self, kind: str):
+        """
+        Stores all values of the column again in a wider kind.
+        """
+        values: List[object] = self._read_written_values() if self.kind is not None else list()
+        old_paths: List[str] = self._get_paths(self.kind) if self.kind is not None else list()
+        self._close_files()
+        for path in old_paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+        self._open_files(kind, "w+b")
+        self._npy_file.write(get_npy_header(self.KINDS[kind][0], 0))
+        if self._ints_file is not None:
+            self._ints_file.write(get_npy_header(_INTS_DESCR, 0))
+        self.length = 0
+        self._data_offset = 0
+        self.append(values)
+
+    def append(self, values: List[object]):
+        """
+        Writes values at the end of the column. They are committed by commit.
+        """
+        if len(values) == 0:
+            return
+
+        kinds: List[str] = list(self.KINDS.keys())
+        kind: str = max((get_value_kind(value) for value in values), key=kinds.index)
+        if self.kind is None or kinds.index(kind) > kinds.index(self.kind):
+            self.convert(kind)
+
+        if self.kind == "str":
+            encoded: List[bytes] = list()
+            offsets: array = array("q")
+            for value in values:
+                if is_missing_value(value):
+                    offsets.append(~self._data_offset)
+                    continue
+
+                encoded.append(str(value).encode("utf-8"))
+                self._data_offset += len(encoded[-1])
+                offsets.append(self._data_offset)
+
+            self._data_file.seek(0, os.SEEK_END)
+            self._data_file.write(b"".join(encoded))
+            write_npy_values(self._npy_file, offsets)
+        elif self.kind == "float":
+            write_npy_values(self._npy_file, array("d", [math.nan if value is None else value for value in values]))
+            write_npy_values(self._ints_file, array("b", [isinstance(value, int) for value in values]))
+        else:
+            write_npy_values(self._npy_file, array("q", values))
+
+        self.length += len(values)
+
+    def commit(self, sync: bool = False):
+        """
+        Writes the number of values into the header, so all values are persisted.
+
+        Keyword Arguments:
+            sync {bool} -- True if files of the column are fsynced. (default: {False})
+        """
+        if self.kind is None:
+            # No values were written yet
+            return
+
+        if self._data_file is not None:
+            self._data_file.flush()
+            if sync:
+                os.fsync(self._data_file.fileno())
+
+        # The header of the values is written last, values are committed by it
+        if self._ints_file is not None:
+            self._write_header(self._ints_file, _INTS_DESCR, sync)
+        self._write_header(self._npy_file, self.KINDS[self.kind][0], sync)
+
+    def _write_header(self, npy_file: IO, descr: str, sync: bool):
+        npy_file.seek(0)
+        npy_file.write(get_npy_header(descr, self.length))
+        npy_file.flush()
+        if sync:
+            os.fsync(npy_file.fileno())
+
+    def close(self):
+        self._close_files()
+
+class ColumnarSink(ResultSink):
+    """
+    Stores every column of results in its own .npy file in a directory, see ColumnFile.
+    Columns are loaded by load_results, numeric columns are memory-mapped if NumPy is available.
+    """
+
+    def __init__(self, path: str, columns: List[str], sync: bool = False):
+        """
+        Arguments:
+            path {str} -- Path to the directory of the sink.
+            columns {List[str]} -- Columns of the algorithm.
+
+        Keyword Arguments:
+            sync {bool} -- True if all files are fsynced when the sink is flushed. (default: {False})
+        """
+        os.makedirs(path, exist_ok=True)
+        self._path: str = path
+        self._sync: bool = sync
+        self._columns: Dict[str, ColumnFile] = {column: ColumnFile(path, column) for column in columns}
+        self._directory_fd: int = os.open(path, os.O_RDONLY)
+
+        lengths: Dict[str, int] = {column: column_file.open() for column, column_file in self._columns.items()}
+        committed: List[int] = [length for length in lengths.values() if length is not None]
+
+        # Columns differ in length if the last run stopped while they were committed
+        length: int = min(committed, default=0)
+        for column, column_file in self._columns.items():
+            if lengths[column] is None:
+                # New column of the algorithm
+                column_file.append([None]*length)
+            else:
+                column_file.truncate(length)
+
+    @property
+    def name(self) -> str:
+        return self._path
+
+    @property
+    def closed(self) -> bool:
+        return self._directory_fd is None
+
+    def write_results_batch(self, rows: List[Dict[str, object]]):
+        for column, column_file in self._columns.items():
+            column_file.append([data.get(column) for data in rows])
+
+    def flush(self):
+        for column_file in self._columns.values():
+            column_file.commit(self._sync)
+
+    def fileno(self) -> int:
+        return self._directory_fd
+
+    def close(self):
+        if self.closed:
+            return
+
+        try:
+            self.flush()
+        finally:
+            for column_file in self._columns.values():
+                column_file.close()
+            os.close(self._directory_fd)
+            self._directory_fd = None
+
+def quote_identifier(name: str) -> str:
+    return '"{}"'.format(name.replace('"', '""'))
+
+def get_sql_value(value: object) -> object:
+    """
+    Returns:
+        object -- The value as it is stored by SQLite. Values of other than basic types are stored as strings.
+    """
+    if value is None or isinstance(value, (float, str)) or (isinstance(value, int) and _INT64_MIN <= value <= _INT64_MAX):
+        return value
+
+    return str(value)
+
+class SQLiteSink(ResultSink):
+    """
+    Stores results in the results table of a SQLite database. Every column of the algorithm is a column of the table.
+    Written results are inserted in one transaction that is committed when the sink is flushed.
+    """
+
+    def __init__(self, path: str, columns: List[str], sync: bool = False):
+        """
+        Arguments:
+            path {str} -- Path to the database.
+            columns {List[str]} -- Columns of the algorithm.
+
+        Keyword Arguments:
+            sync {bool} -- True if every commit is fsynced. (default: {False})
+        """
+        self._path: str = path
+        self._columns: List[str] = list(columns)
+        # Runners write results from one thread at a time, but not always from the thread that opened the sink
+        self._connection: sqlite3.Connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(f'PRAGMA synchronous={"FULL" if sync else "NORMAL"}')
+        self._connection.execute(f'CREATE TABLE IF NOT EXISTS results ({", ".join(quote_identifier(column) for column in self._columns)})')
+
+        # Columns that were added to the algorithm since the last run
+        existing: List[str] = [row[1] for row in self._connection.execute("PRAGMA table_info(results)")]
+        for column in self._columns:
+            if column not in existing:
+                self._connection.execute(f'ALTER TABLE results ADD COLUMN {quote_identifier(column)}')
+        self._connection.commit()
+
+        self._insert: str = 'INSERT INTO results ({}) VALUES ({})'.format(", ".join(quote_identifier(column) for column in self._columns), ", ".join("?"*len(self._columns)))
+        self._fd: int = os.open(path, os.O_RDONLY)
+
+    @property
+    def name(self) -> str:
+        return self._path
+
+    @property
+    def closed(self) -> bool:
+        return self._connection is None
+
+    def write_results_batch(self, rows: List[Dict[str, object]]):
+        self._connection.executemany(self._insert, [tuple(get_sql_value(data.get(column)) for column in self._columns) for data in rows])
+
+    def flush(self):
+        self._connection.commit()
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def close(self):
+        if self.closed:
+            return
+
+        try:
+            self.flush()
+        finally:
+            self._connection.close()
+            self._connection = None
+            os.close(self._fd)
+
+def load_results(path: str) -> Dict[str, object]:
+    """
+    Loads results stored by a sink for analysis.
+
+    Numeric columns of a columnar sink are memory-mapped NumPy arrays if NumPy is available, arrays of the array module otherwise.
+    Strings are lists of str and None, results of a SQLite sink are lists of values.
+
+    Arguments:
+        path {str} -- Directory of a columnar sink or a SQLite database of a sink.
+
+    Returns:
+        Dict[str, object] -- Values of all results under their columns.
+    """
+    if not os.path.isdir(path):
+        connection: sqlite3.Connection = sqlite3.connect(path)
+        try:
+            cursor: sqlite3.Cursor = connection.execute("SELECT * FROM results")
+            columns: List[str] = [description[0] for description in cursor.description]
+            rows: List[Tuple[object]] = cursor.fetchall()
+        finally:
+            connection.close()
+
+        return {column: [row[index] for row in rows] for index, column in enumerate(columns)}
+
+    results: Dict[str, object] = dict()
+    for filename in sorted(os.listdir(path)):
+        if not filename.endswith(".npy") or filename.endswith(".ints.npy"):
+            continue
+
+        name: str = filename[:-len(".offsets.npy")] if filename.endswith(".offsets.npy") else filename[:-len(".npy")]
+        column_file: ColumnFile = ColumnFile(path, name)
+        column_file.open(read_only=True)
+        try:
+            if column_file.kind == "str" or numpy is None:
+                values: object = column_file.read_values()
+                results[name] = values if column_file.kind == "str" else array(ColumnFile.KINDS[column_file.kind][1], values)
+            else:
+                results[name] = numpy.load(os.path.join(path, filename), mmap_mode="r")
+        finally:
+            column_file.close()
+
+    return results
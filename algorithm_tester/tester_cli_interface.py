@@ -1,25 +1,40 @@
 import click
 import time
-from typing import List
+from typing import List, Tuple
 from algorithm_tester.plugins import plugins
 from algorithm_tester.tester_logic import run_tester
-from algorithm_tester.decorators import docstring_parameters, use_dynamic_options, dynamic_help
-from algorithm_tester.validators import validate_algorithms, validate_parser, validate_extra_options, validate_concurrency_runner, validate_communicators
-from algorithm_tester.concurrency_runners import Runners, Runner
+from algorithm_tester.decorators import docstring_parameters, use_dynamic_options, dynamic_help, DynamicHelpCommand
+from algorithm_tester.validators import validate_algorithms, validate_parser, validate_extra_options, validate_communicators, validate_chunk_size, validate_shard, validate_enum_name, validate_executor_options, validate_parse_in_workers
+from algorithm_tester.concurrency_runners import Runners, Runner, SchedulingPolicies
+from algorithm_tester.executors import Executors
+from algorithm_tester.measurements import TimingModes
+from algorithm_tester.transports import Transports
+from algorithm_tester.helpers import ShardModes
+from algorithm_tester.sinks import OutputSinks
+from algorithm_tester.compression import Compressions
+from algorithm_tester_common.tester_dataclasses import LogFsyncPolicy
 
 """
 Click CLI interface for the application.
 """
 
 
-@click.command(name='my-cmd', context_settings=dict(
+@click.command(name='my-cmd', cls=DynamicHelpCommand, context_settings=dict(
     ignore_unknown_options=True,
     allow_extra_args=True,
 ))
-@click.option("-s", "--algorithms", callback=validate_algorithms, required=True, default=",".join(plugins.get_algorithm_names()), show_default=True, help="CSV string of names of available algorithms.")
-@click.option("-r", "--concurrency-runner", callback=validate_concurrency_runner, required=True, default=f'{Runners.BASE.name}', show_default=True, help="Concurrency mode the programme should use to compute results.")
+@click.option("-s", "--algorithms", callback=validate_algorithms, required=True, default=lambda: ",".join(plugins.get_algorithm_names()), show_default="all available algorithms", help="CSV string of names of available algorithms.")
+@click.option("-r", "--concurrency-runner", callback=validate_enum_name(Runners), required=True, default=f'{Runners.BASE.name}', show_default=True, help="Concurrency mode the programme should use to compute results.")
 @click.option("--check-time", type=bool, default=False, help="Should the result also check elapsed time.")
 @click.option("--time-retries", type=int, default=1, help="How many times should we retry if elapsed time is checked.")
+@click.option("--timing", callback=validate_enum_name(TimingModes), default=TimingModes.FIXED.value, show_default=True, help=f'How elapsed time is measured if check-time is set. One of [{", ".join([m.value for m in TimingModes])}].')
+@click.option("--warmup", "warmup_runs", type=click.IntRange(min=0), default=1, show_default=True, help="How many unmeasured runs precede measured runs in the adaptive timing mode.")
+@click.option("--target-ci", type=click.FloatRange(min=0.0), default=0.05, show_default=True, help="Adaptive timing stops when the 95% confidence interval of the mean is narrower than this fraction of the mean.")
+@click.option("--time-budget", type=click.FloatRange(min=0.0), default=1000.0, show_default=True, help="How many milliseconds can adaptive timing spend on measured runs of one instance.")
+@click.option("--max-repeats", type=click.IntRange(min=1), default=100, show_default=True, help="Maximal number of measured runs of one instance in the adaptive timing mode.")
+@click.option("--isolate", is_flag=True, help="If set then workers are pinned to dedicated CPUs, garbage collection is disabled during measurements and load and involuntary context switches are recorded for every instance. Not available with the thread executor.")
+@click.option("--track-resources", is_flag=True, help="If set then user and system CPU time, peak RSS and context switches of every instance are added to results.")
+@click.option("--track-memory", is_flag=True, help="If set then peak memory allocated by every instance is traced by tracemalloc and added to results. Slows the computation down. Not available with more than one thread worker.")
 @click.option("-p", "--parser", type=str, callback=validate_parser, required=True, help="Name of the parser that is used to parse input files.")
 @click.option("-c", "--communicators", type=str, callback=validate_communicators, required=False, show_default=True, help="CSV string of names of available communication interfaces.")
 @click.option("-n", "--max-num", type=int, required=False, help="If set then the run_tester uses only (0, max-num] of input files.")
@@ -27,10 +42,40 @@ Click CLI interface for the application.
 @click.option("-t", "--min-communicator-delay", type=float, default=5.0, help="How many seconds there at least must be between two communicator messages.")
 @click.option("--input-dir", type=str, required=True, help="Path to directory with input files.")
 @click.option("--output-dir", type=str, required=True, help="Path to directory where output files are to be stored.")
+@click.option("--include", multiple=True, help="Glob pattern of input files that are used, e.g. '*.dat'. Can be repeated. All files are used by default.")
+@click.option("--exclude", multiple=True, help="Glob pattern of input files and directories that are skipped. Can be repeated.")
+@click.option("--recursive/--no-recursive", default=True, show_default=True, help="Search subdirectories of the input directory for input files.")
+@click.option("--shard", callback=validate_shard, required=False, help="Compute only shard k of N shards of the dataset, given as k/N with 0 <= k < N. Shards are assigned deterministically, so N runs compute the whole dataset without any coordination.")
+@click.option("--shard-by", callback=validate_enum_name(ShardModes), default=ShardModes.FILES.value, show_default=True, help=f'What is partitioned between shards. One of [{", ".join([m.value for m in ShardModes])}].')
+@click.option("--output-sink", callback=validate_enum_name(OutputSinks), default=OutputSinks.TEXT.value, show_default=True, help=f'How results are stored. One of [{", ".join([s.value for s in OutputSinks])}]. Columnar and SQLite sinks store columns of algorithms in binary files named after output files, they are loaded by algorithm_tester.sinks.load_results.')
+@click.option("--output-compression", callback=validate_enum_name(Compressions), default=Compressions.NONE.value, show_default=True, help=f'Compression of text output files. One of [{", ".join([c.value for c in Compressions])}]. Its suffix is appended to names of output files. Input and output files whose names end with .gz, .bz2 or .xz are always compressed. Output files stay appendable when a run is resumed. Bzip2 and xz write results in streams of at least 1 MiB, instances are logged as done only after that.')
+@click.option("--log-commit-entries", type=click.IntRange(min=1), required=False, help="How many done instances are buffered before they are written to the instances log. Output files are flushed at every commit. Defaults to --write-batch-size.")
+@click.option("--log-commit-interval", type=click.FloatRange(min=0.0), required=False, help="How many milliseconds can pass before buffered instances are written to the instances log. Defaults to --write-batch-interval.")
+@click.option("-e", "--executor", callback=validate_enum_name(Executors), default=Executors.PROCESS.value, show_default=True, help=f'Executor backend used by concurrency runners. One of [{", ".join([e.value for e in Executors])}].')
+@click.option("-j", "--jobs", type=click.IntRange(min=1), required=False, help="Number of workers used by concurrency runners. Defaults to the number of CPUs.")
+@click.option("--schedule", callback=validate_enum_name(SchedulingPolicies), default=SchedulingPolicies.FIFO.value, show_default=True, help=f'Order in which concurrency runners submit instances. One of [{", ".join([p.value for p in SchedulingPolicies])}].')
+@click.option("--lookahead", type=click.IntRange(min=1), default=256, show_default=True, help="How many parsed instances can the scheduling policy reorder at once.")
+@click.option("--instance-timeout", type=click.FloatRange(min=0.0, min_open=True), required=False, help="How many seconds can computation of one instance take. The worker is killed and the instance is recorded as timed out. Only process executors enforce it.")
+@click.option("--max-crash-attempts", type=click.IntRange(min=1), default=2, show_default=True, help="How many times can an instance kill a worker of a process executor before it is quarantined and counted as failed.")
+@click.option("--transport", callback=validate_enum_name(Transports), default=Transports.PICKLE.value, show_default=True, help=f'How instance data is sent to process workers. One of [{", ".join([t.value for t in Transports])}].')
+@click.option("--parse-in-workers", is_flag=True, help="Workers of concurrency runners parse byte ranges of input files themselves, the main process only writes results. Parsers must implement split_input_file to get more than one range per file. Only the FILES and INSTANCES runners parse in workers.")
+@click.option("--max-in-flight", type=click.IntRange(min=1), required=False, help="How many tasks can concurrency runners submit at once. Defaults to 4 tasks per CPU.")
+@click.option("--chunk-size", callback=validate_chunk_size, default="1", show_default=True, help="How many instances concurrency runners send to a worker in one task. Use 'auto' to choose the size automatically.")
+@click.option("--write-batch-size", type=click.IntRange(min=1), default=256, show_default=True, help="How many results are buffered before they are written to an output file. Buffered results are always written before their instances are logged as done.")
+@click.option("--write-batch-interval", type=click.FloatRange(min=0.0), default=1000.0, show_default=True, help="How many milliseconds can results stay buffered before they are written to an output file.")
+@click.option("--count-in-background", is_flag=True, help="Instances are counted while the computation already runs, so it starts immediately. Counts are cached either way in algorithm_tester/instances_counts.dat of the user cache directory, i.e. $XDG_CACHE_HOME or ~/.cache.")
+@click.option("--result-cache", is_flag=True, help="Solutions are cached in the user cache directory by content of instances, algorithms, their versions and extra options. Cached solutions are written without being computed again, also in other output directories or forced runs. Bypassed if time, resources or memory are measured.")
+@click.option("--result-cache-size", type=click.IntRange(min=1), default=1024, show_default=True, help="Maximal size of the results cache in megabytes. Least recently used solutions are evicted.")
+@click.option("--dedup", is_flag=True, help="Instances with the same content, e.g. in different files or with different IDs, are computed once for every algorithm. Their solutions are written for every instance with its own identifier and output file. Bypassed if time, resources or memory are measured.")
+@click.option("--log-fsync", callback=validate_enum_name(LogFsyncPolicy), default=LogFsyncPolicy.NONE.name, show_default=True, help="When should the instances log and output files be fsynced. One of [none, batch, always].")
 @click.argument('extra-options', callback=validate_extra_options, nargs=-1, type=click.UNPROCESSED)
-@dynamic_help(plugins.get_algorithms(), plugins.get_parsers(), plugins.get_communicators())
-def run_tester_cli_interface(algorithms: List[str], concurrency_runner: str, check_time: bool, time_retries: int, parser: str, communicators: List[str], max_num: int, is_forced: bool, min_communicator_delay: float, input_dir, output_dir, extra_options):
-    run_tester(algorithms, concurrency_runner, check_time, time_retries, parser, communicators, max_num, is_forced, min_communicator_delay, input_dir, output_dir, extra_options)
+@dynamic_help(plugins)
+def run_tester_cli_interface(algorithms: List[str], concurrency_runner: str, check_time: bool, time_retries: int, parser: str, communicators: List[str], max_num: int, is_forced: bool, min_communicator_delay: float, input_dir, output_dir, 
+        extra_options, **options):
+    validate_executor_options(concurrency_runner, options["executor"], options["jobs"], options["isolate"], options["track_resources"], options["track_memory"])
+    validate_parse_in_workers(concurrency_runner, options["parse_in_workers"])
+
+    run_tester(algorithms, concurrency_runner, check_time, time_retries, parser, communicators, max_num, is_forced, min_communicator_delay, input_dir, output_dir, extra_options, **options)
 
 def main(prog_name: str):
     run_tester_cli_interface(prog_name=prog_name)   # pylint: disable=no-value-for-parameter,unexpected-keyword-arg
\ No newline at end of file
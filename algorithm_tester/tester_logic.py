@@ -2,35 +2,90 @@ import os
 import timeit
 import time
 import shutil
-from typing import Dict, List, IO
-from algorithm_tester_common.tester_dataclasses import AlgTesterContext, Algorithm, Parser, InstancesLogger
+import threading
+from typing import Dict, List, IO, Tuple
+from algorithm_tester_common.tester_dataclasses import AlgTesterContext, Algorithm, Parser, InstancesLogger, LogFsyncPolicy
 from algorithm_tester.plugins import plugins
 from algorithm_tester.concurrency_runners import Runner, Runners
+from algorithm_tester.results_cache import ResultsCache, DuplicatesCache, create_results_cache, create_duplicates_cache
+from algorithm_tester.counting import InstancesCountsCache, count_instances_in_files, get_counts_cache_path
 import algorithm_tester.helpers as helpers
+from algorithm_tester.helpers import ShardModes
 
 """
 Contains main logic of the application.
 """
 
-def count_instances(context: AlgTesterContext, input_files: List[str]):
+def count_instances(context: AlgTesterContext, input_files: List[str], parallel: bool = True):
     """
     Count instances of all instance files and stores the value in context.
+
+    Counts are cached in a sidecar file in the user cache directory. Only new or changed files are counted, concurrently if possible.
     
     Arguments:
         context {AlgTesterContext} -- Used context.
         input_files {List[str]} -- List of all input files.
+
+    Keyword Arguments:
+        parallel {bool} -- False if all files are counted in the current thread. (default: {True})
     """
 
     parser: Parser = plugins.get_parser(context.parser_name)
-    context.num_of_instances = 0
+    cache: InstancesCountsCache = InstancesCountsCache(get_counts_cache_path())
+    cache.load()
+
+    num_of_instances: int = 0
+    uncached: List[Tuple[str, os.stat_result]] = list()
     for input_file in input_files:
-        with open(f'{context.input_dir}/{input_file}') as instance_file:
-            context.num_of_instances += parser.get_num_of_instances(context, instance_file)
-            instance_file.seek(0)
+        input_file_path: str = os.path.abspath(f'{context.input_dir}/{input_file}')
+        stat: os.stat_result = os.stat(input_file_path)
+        count: int = cache.get_count(parser.get_name(), input_file_path, stat)
+
+        if count is None:
+            uncached.append((input_file_path, stat))
+        else:
+            num_of_instances += count
+
+    counts: List[int] = count_instances_in_files(context, parser, [input_file_path for input_file_path, _ in uncached], parallel=parallel)
+    for (input_file_path, stat), count in zip(uncached, counts):
+        cache.set_count(parser.get_name(), input_file_path, stat, count)
+        num_of_instances += count
+
+    cache.save()
+
+    if context.shard is not None and ShardModes[context.shard_by_name] == ShardModes.INSTANCES:
+        # Instances are spread evenly between shards, the count is only estimated
+        num_of_instances = -(-num_of_instances // context.shard[1])
+
+    # Set at once, the count can be read by communicators while it is computed in the background
+    context.num_of_instances = num_of_instances * len(context.algorithm_names)
+
+def start_counting_instances(context: AlgTesterContext, input_files: List[str]) -> threading.Thread:
+    """
+    Counts instances in a background thread, so the computation can start immediately.
+    Number of instances in the context is None until the count is done. Files are counted in the background thread only,
+    so no processes are started while the computation runs.
     
-    context.num_of_instances *= len(context.algorithm_names)
+    Arguments:
+        context {AlgTesterContext} -- Used context.
+        input_files {List[str]} -- List of all input files.
+    
+    Returns:
+        threading.Thread -- The started thread.
+    """
+    def count():
+        try:
+            count_instances(context, input_files, parallel=False)
+        except Exception as e:
+            print(f'Instances could not be counted: {e}')
 
-def run_tester(algorithms: List[str], concurrency_runner: str, check_time: bool, time_retries: int, parser: str, communicators: List[str], max_num: int, is_forced: True, min_communicator_delay: float, input_dir, output_dir, extra_options):
+    thread: threading.Thread = threading.Thread(target=count, daemon=True)
+    thread.start()
+
+    return thread
+
+def run_tester(algorithms: List[str], concurrency_runner: str, check_time: bool, time_retries: int, parser: str, communicators: List[str], max_num: int, is_forced: True, min_communicator_delay: float, input_dir, output_dir, extra_options,
+        **options):
     """
     Get all data provided by click CLI interface. Run the whole programme.
     
@@ -46,35 +101,49 @@ def run_tester(algorithms: List[str], concurrency_runner: str, check_time: bool,
         input_dir {[type]} -- Directory of all files with instances.
         output_dir {[type]} -- Directory where the programme will store output files.
         extra_options {[type]} -- Other options that algorithms need.
+
+    Keyword Arguments:
+        options -- Optional settings of the run, they are passed to AlgTesterContext.
     """
 
     runner: Runner = Runners[concurrency_runner].value
-    input_files: List[str] = helpers.get_input_files(input_dir)
     context: AlgTesterContext = AlgTesterContext(
         algorithms=algorithms, parser=parser, communicators=communicators, concurrency_runner=concurrency_runner,
         max_num=max_num, check_time=check_time, time_retries=time_retries, min_communicator_delay=min_communicator_delay,
         extra_options=extra_options, is_forced = is_forced,
-        input_dir=input_dir, output_dir=output_dir
+        input_dir=input_dir, output_dir=output_dir, **options
         )
 
+    files_shard: Tuple[int, int] = context.shard if ShardModes[context.shard_by_name] == ShardModes.FILES else None
+    input_files: List[str] = helpers.get_input_files(input_dir, include=context.include, exclude=context.exclude, recursive=context.recursive, shard=files_shard)
+
     # Count number of instances
-    count_instances(context, input_files)
+    if context.count_in_background:
+        start_counting_instances(context, input_files)
+    else:
+        count_instances(context, input_files)
 
     # Prepare instances logger
-    instances_logger = InstancesLogger(context.output_dir, context.is_forced)
+    instances_logger = InstancesLogger(context.output_dir, context.is_forced, 
+        commit_entries=context.log_commit_entries, commit_interval=context.log_commit_interval, fsync_policy=LogFsyncPolicy[context.log_fsync])
 
     helpers.create_path(output_dir)
         
     context.start_time = helpers.curr_time_millis()
     start = time.perf_counter()
 
+    results_cache: ResultsCache = create_results_cache(context, plugins.get_parser(context.parser_name))
+    duplicates_cache: DuplicatesCache = create_duplicates_cache(context, plugins.get_parser(context.parser_name))
+
     try:
-        runner.init(instances_logger)
+        runner.init(instances_logger, results_cache, duplicates_cache)
         runner.compute_results(context, input_files)
     except Exception as e:
         print(f'Exception occured in tester_logic: {e}')
     finally:
         instances_logger.close_log()
+        if results_cache is not None:
+            results_cache.close()
 
     finish = time.perf_counter()
     print(f'Finished task in {round(finish - start, 2)} second(s)')
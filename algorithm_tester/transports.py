@@ -0,0 +1,303 @@
+import itertools
+import collections
+from array import array
+from enum import Enum
+from typing import Dict, Iterator, List, Tuple
+
+"""
+Contains transports that concurrency runners use to send instance data to process workers.
+"""
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    # Python < 3.8
+    shared_memory = None
+
+_INT64_MIN: int = -2**63
+_INT64_MAX: int = 2**63 - 1
+
+# Size of shared memory segments of a pool in bytes. Chunks that do not fit get a segment of their own size.
+SEGMENT_SIZE: int = 16*1024*1024
+
+# How many most recently used segments stay attached in a worker between chunks
+MAX_ATTACHED: int = 4
+
+class Transports(Enum):
+    """
+    Contains all transports of instance data.
+
+    PICKLE -- Instance data is pickled into every task.
+    SHARED_MEMORY -- Fields that are lists of integer tuples, e.g. things of knapsack instances, are placed into shared memory
+    segments that are reused by all chunks of a computation. Tasks contain only the name of the segment and offsets.
+    Used only by process executors. It pays off for instances with thousands of tuples, smaller instances are faster pickled.
+    """
+    PICKLE = "pickle"
+    SHARED_MEMORY = "shared-memory"
+
+# Attached segments from the least recently used
+_attached: Dict[str, object] = collections.OrderedDict()
+
+def _get_buffer(name: str) -> memoryview:
+    """
+    Returns:
+        memoryview -- Buffer of the shared memory segment. The segment is attached only once in every process.
+    """
+    segment = _attached.get(name)
+    if segment is None:
+        segment = shared_memory.SharedMemory(name=name)
+        _attached[name] = segment
+    _attached.move_to_end(name)
+
+    return segment.buf
+
+def release_attached(keep: int = 0):
+    """
+    Detaches shared memory segments attached by the current process, except the most recently used ones.
+    Segments that are still referenced by the computation stay attached until the next release.
+
+    Keyword Arguments:
+        keep {int} -- How many most recently used segments stay attached. (default: {0})
+    """
+    for name, segment in list(_attached.items())[:max(len(_attached) - keep, 0)]:
+        try:
+            segment.close()
+        except BufferError:
+            continue
+
+        del _attached[name]
+
+class SharedTuples(object):
+    """
+    Read-only sequence of integer tuples stored in a shared memory segment. Supports len, iteration, indexing and comparison with lists.
+    Pickling sends only the reference to the segment. Every access reads the segment again, so workers replace it by a list
+    before algorithms run, see load_shared_values.
+    """
+
+    def __init__(self, name: str, offset: int, rows: int, columns: int):
+        """
+        Arguments:
+            name {str} -- Name of the shared memory segment.
+            offset {int} -- Index of the first integer in the segment.
+            rows {int} -- Number of tuples.
+            columns {int} -- Length of every tuple.
+        """
+        self._name: str = name
+        self._offset: int = offset
+        self._rows: int = rows
+        self._columns: int = columns
+
+    def __reduce__(self):
+        return (SharedTuples, (self._name, self._offset, self._rows, self._columns))
+
+    def _get_values(self, start: int, stop: int) -> List[int]:
+        with _get_buffer(self._name).cast("q") as values:
+            return values[self._offset + start*self._columns:self._offset + stop*self._columns].tolist()
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def __iter__(self) -> Iterator[Tuple[int, ...]]:
+        values = iter(self._get_values(0, self._rows))
+        return zip(*[values]*self._columns)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+
+        if index < 0:
+            index += self._rows
+        if not 0 <= index < self._rows:
+            raise IndexError("SharedTuples index out of range")
+
+        return tuple(self._get_values(index, index + 1))
+
+    def __eq__(self, other) -> bool:
+        return list(self) == other
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+def load_shared_values(instance_data: Dict[str, object]) -> Dict[str, Tuple[SharedTuples, List[Tuple[int, ...]]]]:
+    """
+    Replaces all SharedTuples of instance data by lists of tuples, which are read from the segment at once.
+
+    Arguments:
+        instance_data {Dict[str, object]} -- Instance data received by a worker. Modified in place.
+
+    Returns:
+        Dict[str, Tuple[SharedTuples, List[Tuple[int, ...]]]] -- Replaced values and their lists by fields.
+    """
+    loaded: Dict[str, Tuple[SharedTuples, List[Tuple[int, ...]]]] = dict()
+    for field, value in instance_data.items():
+        if isinstance(value, SharedTuples):
+            loaded[field] = (value, list(value))
+
+    for field, (_, values) in loaded.items():
+        instance_data[field] = values
+
+    return loaded
+
+def unload_shared_values(result: object, loaded: Dict[str, Tuple[SharedTuples, List[Tuple[int, ...]]]]):
+    """
+    Puts SharedTuples back into a solution in place of lists made by load_shared_values, so they are not pickled with the solution.
+
+    Arguments:
+        result {object} -- Solution or exception of an instance.
+        loaded {Dict[str, Tuple[SharedTuples, List[Tuple[int, ...]]]]} -- Values replaced by load_shared_values.
+    """
+    if not isinstance(result, dict):
+        return
+
+    for field, (shared, values) in loaded.items():
+        if result.get(field) is values:
+            result[field] = shared
+
+def get_tuples_width(value: object) -> int:
+    """
+    Arguments:
+        value {object} -- Value of an instance field.
+
+    Returns:
+        int -- Length of tuples if the value is a non-empty list of integer tuples of the same length which fit into 64 bits. 0 otherwise.
+    """
+    if not isinstance(value, list) or len(value) == 0 or not isinstance(value[0], tuple):
+        return 0
+
+    width: int = len(value[0])
+    for item in value:
+        if not isinstance(item, tuple) or len(item) != width:
+            return 0
+
+        for number in item:
+            if type(number) is not int or not _INT64_MIN <= number <= _INT64_MAX:
+                return 0
+
+    return width
+
+class SharedMemoryPool(object):
+    """
+    Shared memory segments that chunks of one computation are placed into. Created by the parent process.
+
+    Chunks are placed one after another into the first segment with enough free space. A segment is reused from its start
+    once all chunks placed into it are freed, so workers attach every segment only once. All segments are unlinked when the pool is closed.
+    """
+
+    def __init__(self, segment_size: int = SEGMENT_SIZE):
+        """
+        Keyword Arguments:
+            segment_size {int} -- Size of new segments in bytes. (default: {SEGMENT_SIZE})
+        """
+        self._segment_size: int = segment_size
+        self._segments: List[object] = list()
+        # Number of used integers and of chunks that were not freed yet of every segment
+        self._used: List[int] = list()
+        self._chunks: List[int] = list()
+
+    def allocate(self, size: int) -> Tuple[int, int]:
+        """
+        Arguments:
+            size {int} -- Number of 64-bit integers of the chunk.
+
+        Returns:
+            (int, int) -- Index of the segment and index of the first integer of the chunk in it.
+        """
+        for index, segment in enumerate(self._segments):
+            if self._chunks[index] == 0:
+                self._used[index] = 0
+
+            if self._used[index] + size <= segment.size // 8:
+                offset: int = self._used[index]
+                self._used[index] += size
+                self._chunks[index] += 1
+
+                return (index, offset)
+
+        self._segments.append(shared_memory.SharedMemory(create=True, size=max(size*8, self._segment_size)))
+        self._used.append(size)
+        self._chunks.append(1)
+
+        return (len(self._segments) - 1, 0)
+
+    def get_segment(self, index: int):
+        """
+        Returns:
+            shared_memory.SharedMemory -- Segment of the pool.
+        """
+        return self._segments[index]
+
+    def free(self, index: int):
+        """
+        Frees a chunk placed into the segment.
+        """
+        self._chunks[index] -= 1
+
+    def close(self):
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+
+        self._segments = list()
+        self._used = list()
+        self._chunks = list()
+
+class SharedChunk(object):
+    """
+    List of tuples fields of one chunk of instances placed into a segment of a shared memory pool.
+    Created by the parent process, which closes it when the chunk is done.
+    """
+
+    def __init__(self, instances_data: List[Dict[str, object]], pool: SharedMemoryPool):
+        """
+        Arguments:
+            instances_data {List[Dict[str, object]]} -- Instance data of the chunk. Not modified.
+            pool {SharedMemoryPool} -- Pool of the computation.
+        """
+        self._pool: SharedMemoryPool = pool
+        self._segment_index: int = None
+        # (Index of instance, field, width) of every placed field
+        self._fields: List[Tuple[int, str, int]] = list()
+
+        size: int = 0
+        for index, data in enumerate(instances_data):
+            for field, value in data.items():
+                width: int = get_tuples_width(value)
+                if width > 0:
+                    self._fields.append((index, field, width))
+                    size += len(value)*width
+
+        self.instances_data: List[Dict[str, object]] = list(instances_data)
+        if size == 0:
+            return
+
+        self._segment_index, offset = pool.allocate(size)
+        segment = pool.get_segment(self._segment_index)
+        with segment.buf.cast("q") as values:
+            for index, field, width in self._fields:
+                value: List[Tuple[int, ...]] = instances_data[index][field]
+                values[offset:offset + len(value)*width] = array("q", itertools.chain.from_iterable(value))
+
+                if self.instances_data[index] is instances_data[index]:
+                    self.instances_data[index] = dict(instances_data[index])
+                self.instances_data[index][field] = SharedTuples(segment.name, offset, len(value), width)
+                offset += len(value)*width
+
+    def restore_results(self, results: List[object], instances_data: List[Dict[str, object]]):
+        """
+        Puts original values back into solutions, so solutions do not refer to the segment.
+
+        Arguments:
+            results {List[object]} -- Solutions or exceptions of instances of the chunk.
+            instances_data {List[Dict[str, object]]} -- Original instance data of the chunk.
+        """
+        for index, field, _ in self._fields:
+            result = results[index]
+            if isinstance(result, dict) and isinstance(result.get(field), SharedTuples):
+                result[field] = instances_data[index][field]
+
+    def close(self):
+        if self._segment_index is None:
+            return
+
+        self._pool.free(self._segment_index)
+        self._segment_index = None
@@ -1,9 +1,17 @@
+import os
 import click
 import itertools
-from typing import Dict, List, Tuple
-from algorithm_tester_common.tester_dataclasses import DynamicClickOption
+from enum import Enum
+from typing import Callable, Dict, List, Tuple, Type
+from algorithm_tester_common.tester_dataclasses import DynamicClickOption, LogFsyncPolicy
 from algorithm_tester.plugins import plugins
-from algorithm_tester.concurrency_runners import Runners, Runner
+from algorithm_tester.concurrency_runners import Runners, Runner, SchedulingPolicies
+from algorithm_tester.executors import Executors
+from algorithm_tester.measurements import TimingModes, is_rusage_per_thread
+from algorithm_tester.transports import Transports
+from algorithm_tester.helpers import ShardModes
+from algorithm_tester.sinks import OutputSinks
+from algorithm_tester.compression import Compressions
 
 """
 Click CLI validators.
@@ -43,27 +51,77 @@ def validate_communicators(self, ctx, value: str) -> List[str]:
     except:
         raise click.BadParameter(value)
 
-def validate_concurrency_runner(self, ctx, value: str) -> str:
+def validate_enum_name(enum_cls: Type[Enum]) -> Callable[[object, object, str], str]:
     """
-    Validate concurrency runner name.
+    Creates a validator of names of members of an enum. Members can be also given by their string values.
+
+    Args:
+        enum_cls (Type[Enum]): Enum whose member names are accepted, e. g. Executors.
+
+    Returns:
+        Callable[[object, object, str], str]: Click callback which returns the name of the member or raises click.BadParameter.
+    """
+    def validate(self, ctx, value: str) -> str:
+        try:
+            for member in enum_cls:
+                if value.casefold() == member.name.casefold() or (isinstance(member.value, str) and value.casefold() == member.value.casefold()):
+                    return member.name
+        except AttributeError:
+            pass
+
+        raise click.BadParameter(value)
+
+    return validate
+
+def validate_shard(self, ctx, value: str) -> Tuple[int, int]:
+    """
+    Validate shard of the dataset computed by this run.
     
     Args:
         ctx: Click context
-        value (str): Name of a concurrency runner.
+        value (str): Shard in a form of k/N where N is the number of shards and 0 <= k < N.
     
     Raises:
-        click.BadParameter: Provided name is not a concurrency runner name.
+        click.BadParameter: Provided value is not a valid shard.
     
     Returns:
-        str: Concurrency runner name.
+        Tuple[int, int]: Index of the shard and number of all shards. None if no shard was provided.
     """
+    if value is None:
+        return None
+
     try:
-        current_runner = [runner for runner in Runners if runner.name.casefold() == value.casefold()]
+        index, num_of_shards = [int(part) for part in value.split("/")]
+        if num_of_shards <= 0 or not 0 <= index < num_of_shards:
+            raise click.BadParameter(value)
 
-        if len(current_runner) <= 0:
+        return (index, num_of_shards)
+    except:
+        raise click.BadParameter(value)
+
+def validate_chunk_size(self, ctx, value: str) -> int:
+    """
+    Validate size of chunks sent to workers.
+    
+    Args:
+        ctx: Click context
+        value (str): Positive integer or 'auto'.
+    
+    Raises:
+        click.BadParameter: Provided value is not a positive integer nor 'auto'.
+    
+    Returns:
+        int: Chunk size. 0 if the size should be chosen automatically.
+    """
+    try:
+        if value.casefold() == "auto":
+            return 0
+
+        chunk_size: int = int(value)
+        if chunk_size <= 0:
             raise click.BadParameter(value)
 
-        return current_runner[0].name
+        return chunk_size
     except:
         raise click.BadParameter(value)
 
@@ -131,6 +189,10 @@ def validate_extra_options(self, ctx, value: List[str]) -> Dict[str, object]:
 
     try:
         output: Dict[str, object] = dict()
+        if len(value) == 0:
+            # Algorithms are not instantiated just to validate no options
+            return output
+
         dynamic_options: List[DynamicClickOption] = plugins.get_dynamic_options()
         # option_names: List[str] = [option.short_opt for option in dynamic_options]
         # option_names.extend([option.long_opt for option in dynamic_options])
@@ -168,4 +230,50 @@ def validate_extra_options(self, ctx, value: List[str]) -> Dict[str, object]:
 
         return output
     except:
-        raise click.BadParameter(value)
\ No newline at end of file
+        raise click.BadParameter(value)
+def validate_executor_options(concurrency_runner: str, executor: str, jobs: int, isolate: bool, track_resources: bool, track_memory: bool):
+    """
+    Validates options that cannot be combined with the executor of concurrency runners.
+    Measurements that are global to the process are wrong if several thread workers measure at once.
+
+    Args:
+        concurrency_runner (str): Validated concurrency runner name.
+        executor (str): Validated executor backend name.
+        jobs (int): Number of workers. None means the number of CPUs.
+        isolate (bool): True if measurements are isolated.
+        track_resources (bool): True if resource columns are added.
+        track_memory (bool): True if memory is traced.
+
+    Raises:
+        click.BadParameter: Provided options cannot be combined.
+    """
+    if Runners[concurrency_runner] == Runners.BASE:
+        # Instances are computed one by one in the main process
+        return
+
+    if isolate and Executors[executor] == Executors.THREAD:
+        # Garbage collection is disabled for the whole process, workers would enable it during measurements of others
+        raise click.BadParameter("Measurements can be isolated only in process workers or in the main process. Use a process or inline executor.", param_hint="--isolate")
+
+    shared_process: bool = Executors[executor] == Executors.THREAD and (jobs if jobs is not None else os.cpu_count() or 1) > 1
+
+    if shared_process and track_memory:
+        raise click.BadParameter("tracemalloc traces the whole process, so memory can not be tracked by several thread workers. Use a process executor or --jobs 1.", param_hint="--track-memory")
+
+    if shared_process and track_resources and not is_rusage_per_thread():
+        raise click.BadParameter("Resources are accounted for the whole process on this platform, so they can not be tracked by several thread workers. Use a process executor or --jobs 1.", param_hint="--track-resources")
+
+def validate_parse_in_workers(concurrency_runner: str, parse_in_workers: bool):
+    """
+    Validates that the concurrency runner lets its workers parse input files.
+    The base runner has no workers and the pipeline runner parses instances in its reader stage.
+
+    Args:
+        concurrency_runner (str): Validated concurrency runner name.
+        parse_in_workers (bool): True if workers should parse byte ranges of input files.
+
+    Raises:
+        click.BadParameter: The concurrency runner parses instances in the main process.
+    """
+    if parse_in_workers and Runners[concurrency_runner] in (Runners.BASE, Runners.PIPELINE):
+        raise click.BadParameter(f"Instances are parsed in the main process by the {concurrency_runner} runner. Use the {Runners.FILES.name} or {Runners.INSTANCES.name} runner.", param_hint="--parse-in-workers")
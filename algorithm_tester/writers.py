@@ -0,0 +1,98 @@
+import time
+from typing import IO, Dict, List
+from algorithm_tester_common.tester_dataclasses import Parser
+
+"""
+Contains buffered writing of results into output files.
+"""
+
+class BufferedResultsWriter(object):
+    """
+    Wraps an opened output file or a ResultSink. Results are buffered and written by Parser.write_results_batch or by the sink
+    when the batch is full, when batch_interval milliseconds passed since the last write or when the writer is flushed or closed.
+
+    The writer behaves like a file for InstancesLogger, which flushes it before done instances are written to the log.
+    Results are thus always in the output file before their instances are logged as done.
+    """
+
+    def __init__(self, output_file: IO, parser: Parser, batch_size: int = 256, batch_interval: float = 1000.0):
+        """
+        Arguments:
+            output_file {IO} -- Opened output file or ResultSink.
+            parser {Parser} -- Parser that writes results into the output file. None if the output file is a ResultSink.
+
+        Keyword Arguments:
+            batch_size {int} -- Maximal number of buffered results. (default: {256})
+            batch_interval {float} -- How many milliseconds can results stay in the buffer. (default: {1000.0})
+        """
+        self._output_file: IO = output_file
+        self._parser: Parser = parser
+        self._batch_size: int = max(batch_size, 1)
+        self._batch_interval: float = batch_interval
+        self._rows: List[Dict[str, object]] = list()
+        self._last_write_time: float = time.monotonic()
+
+    @property
+    def name(self) -> str:
+        return self._output_file.name
+
+    @property
+    def closed(self) -> bool:
+        return self._output_file.closed
+
+    @property
+    def unwritten_size(self) -> int:
+        """
+        Returns:
+            int -- Size of flushed results that the output file keeps unwritten, see CompressedOutputFile.
+        """
+        return getattr(self._output_file, "unwritten_size", 0)
+
+    def fileno(self) -> int:
+        return self._output_file.fileno()
+
+    def write_result(self, data: Dict[str, object]):
+        """
+        Buffers result data of an instance. The batch is written if it is full or old enough.
+
+        Arguments:
+            data {Dict[str, object]} -- Result data from an algorithm.
+        """
+        self._rows.append(data)
+
+        if len(self._rows) >= self._batch_size or (time.monotonic() - self._last_write_time)*1000 >= self._batch_interval:
+            self.write_batch()
+
+    def write_batch(self):
+        """
+        Writes all buffered results into the output file without flushing it.
+        """
+        self._last_write_time = time.monotonic()
+
+        if len(self._rows) > 0:
+            if self._parser is None:
+                self._output_file.write_results_batch(self._rows)
+            else:
+                self._parser.write_results_batch(self._output_file, self._rows)
+            self._rows = list()
+
+    def flush(self):
+        self.write_batch()
+        self._output_file.flush()
+
+    def close(self):
+        if self._output_file.closed:
+            return
+
+        try:
+            self.write_batch()
+        finally:
+            self._output_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+        return False
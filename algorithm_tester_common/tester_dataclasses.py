@@ -1,7 +1,10 @@
 import os
 import shutil
+import time
+import hashlib
+from array import array
 from dataclasses import dataclass
-from typing import List, Tuple, Dict, IO
+from typing import List, Tuple, Dict, IO, Set
 from enum import Enum
 
 class AlgTesterContext():
@@ -9,7 +12,55 @@ class AlgTesterContext():
     Contains all options and arguments given to the application.
     """
 
-    def __init__(self, algorithms: List[str], parser: str, concurrency_runner: str, communicators: List[str], check_time: bool, time_retries: int, max_num: int, is_forced: bool, extra_options: Dict[str, object], min_communicator_delay: float, input_dir, output_dir):
+    def __init__(self, algorithms: List[str], parser: str, concurrency_runner: str, communicators: List[str], check_time: bool, time_retries: int, max_num: int, is_forced: bool, extra_options: Dict[str, object], min_communicator_delay: float, input_dir, output_dir,
+            log_commit_entries: int = None, log_commit_interval: float = None, log_fsync: str = "NONE", max_in_flight: int = None, chunk_size: int = 1,
+            executor: str = "PROCESS", jobs: int = None, schedule: str = "FIFO", lookahead: int = 256,
+            instance_timeout: float = None, max_crash_attempts: int = 2, timing: str = "FIXED", warmup_runs: int = 1, target_ci: float = 0.05, time_budget: float = 1000.0,
+            max_repeats: int = 100, isolate: bool = False, track_resources: bool = False, track_memory: bool = False,
+            transport: str = "PICKLE", parse_in_workers: bool = False,
+            write_batch_size: int = 256, write_batch_interval: float = 1000.0, count_in_background: bool = False,
+            include: List[str] = None, exclude: List[str] = None, recursive: bool = True, shard: Tuple[int, int] = None, shard_by: str = "FILES",
+            result_cache: bool = False, result_cache_size: int = 1024, dedup: bool = False, output_sink: str = "TEXT",
+            output_compression: str = "NONE"):
+        """
+        Positional arguments are described by run_tester.
+
+        Keyword Arguments:
+            log_commit_entries {int} -- How many done instances are buffered before they are written to the instances log. Defaults to write_batch_size.
+            log_commit_interval {float} -- How many milliseconds can pass before buffered instances are written to the instances log. Defaults to write_batch_interval.
+            log_fsync {str} -- Name of the LogFsyncPolicy used by the instances log.
+            max_in_flight {int} -- How many tasks can concurrency runners submit at once. None means 4 tasks per CPU.
+            chunk_size {int} -- How many instances are sent to a worker in one task. 0 means the size is chosen automatically.
+            executor {str} -- Name of the executor backend used by concurrency runners.
+            jobs {int} -- Number of workers of the executor. None means the number of CPUs.
+            schedule {str} -- Name of the scheduling policy used by concurrency runners.
+            lookahead {int} -- How many instances can the scheduling policy reorder at once.
+            instance_timeout {float} -- How many seconds can computation of one instance take. Enforced only by process executors. None means no limit.
+            max_crash_attempts {int} -- How many times can an instance kill a worker of a process executor before it is quarantined.
+            timing {str} -- Name of the timing mode used if check_time is True.
+            warmup_runs {int} -- How many unmeasured runs precede measured runs in the adaptive timing mode.
+            target_ci {float} -- Adaptive timing stops when the 95% confidence interval of the mean is narrower than this fraction of the mean.
+            time_budget {float} -- How many milliseconds can adaptive timing spend on measured runs of one instance.
+            max_repeats {int} -- Maximal number of measured runs of one instance in the adaptive timing mode.
+            isolate {bool} -- True if workers are pinned to CPUs, garbage collection is disabled during measurements and their noise is recorded.
+            track_resources {bool} -- True if CPU times, peak RSS and context switches of every instance are added to results.
+            track_memory {bool} -- True if peak memory allocated by every instance is traced by tracemalloc and added to results.
+            transport {str} -- Name of the transport used to send instance data to process workers.
+            parse_in_workers {bool} -- True if workers of concurrency runners parse byte ranges of input files themselves.
+            write_batch_size {int} -- How many results are buffered before they are written to an output file.
+            write_batch_interval {float} -- How many milliseconds can results stay buffered before they are written to an output file.
+            count_in_background {bool} -- True if instances are counted while the computation already runs. Progress total is unknown meanwhile.
+            include {List[str]} -- Glob patterns of input files that are used. All files are used if empty.
+            exclude {List[str]} -- Glob patterns of input files and directories that are skipped.
+            recursive {bool} -- True if subdirectories of the input directory are searched for input files.
+            shard {Tuple[int, int]} -- Index of the shard this run computes and number of all shards. None if the dataset is not sharded.
+            shard_by {str} -- Name of the ShardModes member that tells whether files or instances are sharded.
+            result_cache {bool} -- True if solutions are cached across runs and output directories. Bypassed if results are measured.
+            result_cache_size {int} -- Maximal size of the results cache in megabytes.
+            dedup {bool} -- True if instances with the same content are computed once for every algorithm. Bypassed if results are measured.
+            output_sink {str} -- Name of the OutputSinks member that stores results.
+            output_compression {str} -- Name of the Compressions member used for output files whose names have no compression suffix.
+        """
         self.algorithm_names: List[str] = algorithms
         self.parser_name: str = parser
         self.communicator_names: List[str] = communicators
@@ -22,6 +73,41 @@ class AlgTesterContext():
         self.input_dir: str = input_dir
         self.output_dir: str = output_dir
         self.min_time_between_communications: float = min_communicator_delay
+        # The log is committed with batches of results by default, every commit flushes output files
+        self.log_commit_entries: int = write_batch_size if log_commit_entries is None else log_commit_entries
+        self.log_commit_interval: float = write_batch_interval if log_commit_interval is None else log_commit_interval
+        self.log_fsync: str = log_fsync
+        self.max_in_flight: int = max_in_flight
+        self.chunk_size: int = chunk_size
+        self.executor_name: str = executor
+        self.jobs: int = jobs
+        self.schedule_name: str = schedule
+        self.lookahead: int = lookahead
+        self.instance_timeout: float = instance_timeout
+        self.max_crash_attempts: int = max_crash_attempts
+        self.timing_name: str = timing
+        self.warmup_runs: int = warmup_runs
+        self.target_ci: float = target_ci
+        self.time_budget: float = time_budget
+        self.max_repeats: int = max_repeats
+        self.isolate: bool = isolate
+        self.track_resources: bool = track_resources
+        self.track_memory: bool = track_memory
+        self.transport_name: str = transport
+        self.parse_in_workers: bool = parse_in_workers
+        self.write_batch_size: int = write_batch_size
+        self.write_batch_interval: float = write_batch_interval
+        self.count_in_background: bool = count_in_background
+        self.include: List[str] = list(include or ())
+        self.exclude: List[str] = list(exclude or ())
+        self.recursive: bool = recursive
+        self.shard: Tuple[int, int] = shard
+        self.shard_by_name: str = shard_by
+        self.result_cache: bool = result_cache
+        self.result_cache_size: int = result_cache_size
+        self.dedup: bool = dedup
+        self.output_sink_name: str = output_sink
+        self.output_compression_name: str = output_compression
         
         self.start_time: int = None
         self.num_of_instances: int = None
@@ -37,6 +123,7 @@ class AlgTesterContext():
             "check_time": self.check_time,
             "time_retries": self.time_retries,
             "max_files_to_check": self.max_files_to_check,
+            "executor_name": self.executor_name,
             "input_dir": self.input_dir,
             "output_dir": self.output_dir
         }
@@ -78,17 +165,126 @@ class DynamicClickOption():
             return self.__key() == other.__key()
         return NotImplemented
 
+class InstancesIndex():
+    """
+    A compact set of instance identifiers.
+
+    Identifiers are not stored directly. Each one is reduced to its 64-bit BLAKE2b digest which is kept
+    in an open-addressing hash table backed by a single array of unsigned 64-bit integers.
+    Membership checks are O(1) and every stored identifier costs at most 16 bytes no matter how long it is.
+
+    Two different identifiers share a digest with probability of roughly n^2 / 2^65 for n stored identifiers.
+    """
+
+    _EMPTY: int = 0
+    _MIN_CAPACITY: int = 16
+
+    def __init__(self):
+        self._size: int = 0
+        self._slots: array = array("Q", bytes(8 * self._MIN_CAPACITY))
+
+    @staticmethod
+    def get_digest(instance_identifier: str) -> int:
+        """
+        Arguments:
+            instance_identifier {str} -- Complete identifier of an instance.
+        
+        Returns:
+            int -- Non-zero 64-bit digest of the identifier.
+        """
+        digest: int = int.from_bytes(hashlib.blake2b(instance_identifier.encode(), digest_size=8).digest(), "little")
+
+        # Zero marks an empty slot
+        return digest or 1
+
+    def _find_slot(self, slots: array, digest: int) -> int:
+        mask: int = len(slots) - 1
+        index: int = digest & mask
+
+        while slots[index] != self._EMPTY and slots[index] != digest:
+            index = (index + 1) & mask
+
+        return index
+
+    def _grow(self):
+        old_slots: array = self._slots
+        self._slots = array("Q", bytes(16 * len(old_slots)))
+
+        for digest in old_slots:
+            if digest != self._EMPTY:
+                self._slots[self._find_slot(self._slots, digest)] = digest
+
+    def add(self, instance_identifier: str):
+        digest: int = self.get_digest(instance_identifier)
+        index: int = self._find_slot(self._slots, digest)
+
+        if self._slots[index] == digest:
+            return
+
+        self._slots[index] = digest
+        self._size += 1
+
+        # Keep load factor at most 1/2
+        if 2 * self._size > len(self._slots):
+            self._grow()
+
+    def __contains__(self, instance_identifier: str) -> bool:
+        digest: int = self.get_digest(instance_identifier)
+
+        return self._slots[self._find_slot(self._slots, digest)] == digest
+
+    def __len__(self) -> int:
+        return self._size
+
+class LogFsyncPolicy(Enum):
+    """
+    When should InstancesLogger force its writes to the disk using fsync.
+
+    NONE -- Never, data is only flushed to the operating system.
+    BATCH -- Once per group commit.
+    ALWAYS -- After every logged instance. Group commits are disabled.
+    """
+    NONE = "none"
+    BATCH = "batch"
+    ALWAYS = "always"
+
 class InstancesLogger():
     """
     Class that persists created instances in a log that can be later used to resume computation without deleting old results.
+
+    Identifiers are written in group commits. They are buffered and written to the log after commit_entries of them are gathered,
+    after commit_interval milliseconds (if non-zero) passed since the last commit or when the log is closed.
+    Output files that contain results of the buffered instances are flushed before the log so the log never marks
+    an instance as done before its result is written. Instances of an output file that keeps results unwritten after
+    the flush (see unwritten_size of compressed output files) stay buffered, instances of other output files are written.
+
+    It also keeps checkpoints - byte offsets in input files up to which all instances are done for an algorithm.
+    Checkpoints are persisted together with the log so they never get ahead of it.
     """
 
-    def __init__(self, output_dir: str, is_forced: bool):
+    def __init__(self, output_dir: str, is_forced: bool, commit_entries: int = 1, commit_interval: float = 0.0, fsync_policy: LogFsyncPolicy = LogFsyncPolicy.NONE):
         self._output_dir: str = output_dir
-        self._loaded_instances: Dict[str, List[str]] = dict()
+        self._loaded_instances: Dict[str, InstancesIndex] = dict()
+        self._num_of_logged_instances: int = 0
         self._instance_log: IO = None
         self._instances_log_filename: str = ".instances_log.dat"
 
+        self._fsync_policy: LogFsyncPolicy = fsync_policy
+        self._commit_entries: int = 1 if fsync_policy == LogFsyncPolicy.ALWAYS else max(commit_entries, 1)
+        self._commit_interval: float = commit_interval
+        self._last_commit_time: float = time.monotonic()
+        # Buffered identifiers in the order they were done, with their sequence numbers and output files
+        self._pending_identifiers: List[Tuple[int, str, IO]] = list()
+        self._next_sequence: int = 0
+        # Identifiers that stayed buffered because their output files keep results unwritten
+        self._deferred_entries: int = 0
+
+        self._checkpoints_filename: str = ".instances_checkpoints.dat"
+        self._checkpoints: Dict[Tuple[str, str], Tuple[int, int]] = dict()
+        # Checkpoints with the sequence number of the next identifier when they moved
+        self._pending_checkpoints: Dict[Tuple[str, str], Tuple[int, int, int]] = dict()
+        self._checkpoints_file: IO = None
+
         if is_forced:
             # Remove instance files if forced = True
             if os.path.isdir(output_dir):
@@ -96,54 +292,177 @@ class InstancesLogger():
         else:
             # Read already created instances from log
             self.load_instances()
+            self.load_checkpoints()
 
     def load_instances(self):
         """
         Loads identifiers of all done instances.
+
+        The log is read in a single streaming pass, only digests of the identifiers are kept in memory.
         """
         filepath: str = f'{self._output_dir}/{self._instances_log_filename}'
         if not os.path.isfile(filepath):
             return
         
         with open(filepath, "r") as instances_log:
-            instance_identifier: str = instances_log.readline()
+            for instance_identifier in instances_log:
+                instance_identifier = instance_identifier.strip()
+                if instance_identifier == "":
+                    continue
 
-            while instance_identifier is not None and instance_identifier != "":
-                split = instance_identifier.split(" ")
-                algorithm_name: str = split[0]
+                algorithm_name: str = instance_identifier.split(" ", 1)[0]
                 
                 if algorithm_name not in self._loaded_instances:
-                    self._loaded_instances[algorithm_name] = list()
+                    self._loaded_instances[algorithm_name] = InstancesIndex()
                 
-                self._loaded_instances[algorithm_name].append(instance_identifier.strip())
-
-                instance_identifier: str = instances_log.readline()
+                self._loaded_instances[algorithm_name].add(instance_identifier)
+                self._num_of_logged_instances += 1
     
-    def get_num_of_done_instances(self) -> int:
-        cnt: int = 0
-        for _, instances in self._loaded_instances.items():
-            cnt += len(instances)
+    def load_checkpoints(self):
+        """
+        Loads checkpoints of all input files. 
         
-        return cnt
+        The checkpoints file is append-only so only the last checkpoint of each input file and algorithm is valid.
+        The file is compacted after it is loaded.
+        """
+        filepath: str = f'{self._output_dir}/{self._checkpoints_filename}'
+        if not os.path.isfile(filepath):
+            return
+
+        with open(filepath, "r") as checkpoints_file:
+            for line in checkpoints_file:
+                split = line.rstrip("\n").split(" ", 3)
+                if len(split) != 4:
+                    # Unfinished line
+                    continue
+
+                algorithm_name, offset, file_size, input_file_key = split
+                self._checkpoints[(algorithm_name, input_file_key)] = (int(offset), int(file_size))
+
+        with open(f'{filepath}.tmp', "w") as checkpoints_file:
+            for (algorithm_name, input_file_key), (offset, file_size) in self._checkpoints.items():
+                checkpoints_file.write(f'{algorithm_name} {offset} {file_size} {input_file_key}\n')
+        os.replace(f'{filepath}.tmp', filepath)
+
+    def get_checkpoint(self, algorithm_name: str, input_file_key: str, file_size: int) -> int:
+        """
+        Arguments:
+            algorithm_name {str} -- Name of the used algorithm.
+            input_file_key {str} -- Identifies the input file.
+            file_size {int} -- Current size of the input file. Checkpoints of files with different size are not valid.
+        
+        Returns:
+            int -- Offset in the input file up to which all instances are done.
+        """
+        offset, checkpoint_file_size = self._checkpoints.get((algorithm_name, input_file_key), (0, file_size))
+
+        if checkpoint_file_size != file_size:
+            return 0
+
+        return offset
+
+    def write_checkpoint(self, algorithm_name: str, input_file_key: str, file_size: int, offset: int):
+        """
+        Moves a checkpoint of the input file. All instances before the offset must already be written to the log.
+        The checkpoint is persisted with the first group commit that writes all identifiers buffered before it.
+        
+        Arguments:
+            algorithm_name {str} -- Name of the used algorithm.
+            input_file_key {str} -- Identifies the input file.
+            file_size {int} -- Current size of the input file.
+            offset {int} -- Offset in the input file up to which all instances are done.
+        """
+        self._checkpoints[(algorithm_name, input_file_key)] = (offset, file_size)
+        self._pending_checkpoints[(algorithm_name, input_file_key)] = (offset, file_size, self._next_sequence)
+
+    def get_num_of_done_instances(self) -> int:
+        return self._num_of_logged_instances
+
+    def get_done_instances(self) -> Dict[str, InstancesIndex]:
+        """
+        Returns:
+            Dict[str, InstancesIndex] -- Snapshot of identifiers of instances that were done before the computation started, under algorithm names.
+            Workers use it to skip done instances they parse.
+        """
+        return dict(self._loaded_instances)
     
     def is_instance_already_done(self, instance_identifier: str) -> bool:
-        algorithm_name: str = instance_identifier.split(" ")[0]
+        algorithm_name: str = instance_identifier.split(" ", 1)[0]
 
         if algorithm_name in self._loaded_instances:
             return instance_identifier in self._loaded_instances[algorithm_name]
 
         return False
 
-    def write_instance_to_log(self, instance_identifier: str):
-        if self._instance_log is None:
-            self._instance_log = open(f'{self._output_dir}/{self._instances_log_filename}', 'a')
+    def write_instance_to_log(self, instance_identifier: str, output_file: IO = None):
+        """
+        Marks the instance as done. The identifier is persisted with the next group commit.
+        
+        Arguments:
+            instance_identifier {str} -- Complete identifier of the done instance.
         
-        self._instance_log.write(f'{instance_identifier}\n')
-        self._instance_log.flush()
+        Keyword Arguments:
+            output_file {IO} -- Output file the result of the instance was written to. It is flushed before the log. (default: {None})
+        """
+        self._pending_identifiers.append((self._next_sequence, instance_identifier, output_file))
+        self._next_sequence += 1
+
+        interval_passed: bool = self._commit_interval > 0 and (time.monotonic() - self._last_commit_time) * 1000 >= self._commit_interval
+        if len(self._pending_identifiers) >= self._deferred_entries + self._commit_entries or interval_passed:
+            self.commit()
+
+    def _sync_file(self, file: IO):
+        file.flush()
+        if self._fsync_policy != LogFsyncPolicy.NONE:
+            os.fsync(file.fileno())
+
+    def commit(self):
+        """
+        Writes all buffered identifiers to the log.
+        
+        Output files of these instances are flushed first. Instances of output files that keep results unwritten after the flush
+        stay buffered until the next commit_entries instances are done or commit_interval passes.
+        Checkpoints are written once all identifiers buffered before them are written.
+        """
+        self._last_commit_time = time.monotonic()
+
+        if len(self._pending_identifiers) > 0:
+            output_files: Dict[int, IO] = {id(output_file): output_file for _, _, output_file in self._pending_identifiers if output_file is not None}
+            for output_file in output_files.values():
+                if not output_file.closed:
+                    self._sync_file(output_file)
+
+            unwritten: Set[int] = {key for key, output_file in output_files.items() if not output_file.closed and getattr(output_file, "unwritten_size", 0) > 0}
+            written: List[str] = [instance_identifier for _, instance_identifier, output_file in self._pending_identifiers if id(output_file) not in unwritten]
+            self._pending_identifiers = [entry for entry in self._pending_identifiers if id(entry[2]) in unwritten]
+            self._deferred_entries = len(self._pending_identifiers)
+
+            if len(written) > 0:
+                if self._instance_log is None:
+                    self._instance_log = open(f'{self._output_dir}/{self._instances_log_filename}', 'a')
+
+                self._instance_log.write("".join(f'{instance_identifier}\n' for instance_identifier in written))
+                self._sync_file(self._instance_log)
+
+        # Checkpoints must not get ahead of the log
+        first_pending: int = self._pending_identifiers[0][0] if len(self._pending_identifiers) > 0 else self._next_sequence
+        checkpoints: Dict[Tuple[str, str], Tuple[int, int, int]] = {key: checkpoint for key, checkpoint in self._pending_checkpoints.items() if checkpoint[2] <= first_pending}
+
+        if len(checkpoints) > 0:
+            if self._checkpoints_file is None:
+                self._checkpoints_file = open(f'{self._output_dir}/{self._checkpoints_filename}', 'a')
+
+            for (algorithm_name, input_file_key), (offset, file_size, _) in checkpoints.items():
+                self._checkpoints_file.write(f'{algorithm_name} {offset} {file_size} {input_file_key}\n')
+                del self._pending_checkpoints[(algorithm_name, input_file_key)]
+            self._sync_file(self._checkpoints_file)
     
     def close_log(self):
-        if self._instance_log is not None and not self._instance_log.closed:
-            self._instance_log.close()
+        self.commit()
+
+        for file in [self._instance_log, self._checkpoints_file]:
+            if file is not None and not file.closed:
+                file.close()
 
 class Algorithm(object):
     """
@@ -176,6 +495,16 @@ class Algorithm(object):
         """
         pass
     
+    def get_version(self) -> str:
+        """
+        Version of the implementation. Cached results are used only by the same version of the algorithm,
+        so it should be changed whenever results of the algorithm change. Optional.
+        
+        Returns:
+            str: Version of the algorithm or None.
+        """
+        return None
+
     def perform_algorithm(self, context: AlgTesterContext, parsed_data: Dict[str, object]) -> Dict[str, object]:
         """
         Main method of the class. Receives instance data from a parser and creates results.
@@ -264,6 +593,33 @@ class Parser(object):
         """
         return f'{algorithm.get_name()} {self.get_instance_identifier(instance_data)}'
 
+    def get_identifier_keys(self) -> List[str]:
+        """
+        Returns keys of instance data that only identify an instance, e. g. its ID. They are not a part of the content of the instance,
+        so instances that differ only in them share their solutions.
+        
+        Returns:
+            List[str] -- Keys of identifying values. Defaults to ["id"].
+        """
+        return ["id"]
+
+    def get_instance_fingerprint(self, instance_data: Dict[str, object]) -> str:
+        """
+        Returns a digest of the content of an instance. Instances with the same content must have the same fingerprint.
+        Used as a part of keys of the results cache and of duplicate instances.
+        
+        By default it is a digest of repr of the instance data, parsers can override it, e. g. to hash the instance line.
+        
+        Arguments:
+            instance_data {Dict[str, object]} -- Data of the instance as it was returned by get_next_instance, without identifier keys.
+        
+        Returns:
+            str -- Fingerprint of the instance.
+        """
+        content: str = repr(sorted(instance_data.items(), key=lambda item: item[0]))
+
+        return hashlib.blake2b(content.encode(), digest_size=20).hexdigest()
+
     def get_num_of_instances(self, context: AlgTesterContext, input_file: IO) -> int:
         """
         Returns number of instances contained in that particular file.
@@ -277,6 +633,61 @@ class Parser(object):
         """
         pass
 
+    def get_instance_cost(self, instance_data: Dict[str, object]) -> float:
+        """
+        Estimates how expensive it is to compute a solution of the instance, e. g. number of its items.
+        Used by concurrency runners to compute the most expensive instances first. Optional.
+        
+        Arguments:
+            instance_data {Dict[str, object]} -- Parsed data of the instance.
+        
+        Returns:
+            float -- Estimated cost of the instance or None if it is unknown.
+        """
+        return None
+
+    def split_input_file(self, input_file: IO, start: int, num_of_ranges: int) -> List[Tuple[int, int]]:
+        """
+        Splits the rest of an input file into byte ranges that can be parsed independently. 
+        Used when workers of concurrency runners parse instances themselves. Optional.
+
+        Every range must start at the beginning of an instance. An instance belongs to the range in which it starts,
+        get_next_instance is called while the position in the file is before the end of the range.
+        
+        Arguments:
+            input_file {IO} -- The opened input file. Its position must not be changed.
+            start {int} -- Offset in the input file where the first range starts.
+            num_of_ranges {int} -- Desired number of ranges.
+        
+        Returns:
+            List[Tuple[int, int]] -- Start and end offsets of ranges. By default the rest of the file is a single range.
+        """
+        return [(start, os.fstat(input_file.fileno()).st_size)]
+
+    def _split_by_lines(self, input_file: IO, start: int, num_of_ranges: int) -> List[Tuple[int, int]]:
+        """
+        Splits the rest of an input file into ranges of roughly the same size at line boundaries.
+        Parsers of formats with one instance on every line can use it in split_input_file.
+        """
+        file_size: int = os.fstat(input_file.fileno()).st_size
+        step: int = max(1, (file_size - start) // max(num_of_ranges, 1))
+        boundaries: List[int] = [start]
+
+        with open(input_file.name, "rb") as binary_file:
+            for index in range(1, num_of_ranges):
+                binary_file.seek(max(start + index*step - 1, boundaries[-1]))
+                binary_file.readline()
+                boundary: int = binary_file.tell()
+
+                if boundary >= file_size:
+                    break
+                if boundary > boundaries[-1]:
+                    boundaries.append(boundary)
+
+        boundaries.append(file_size)
+
+        return [(range_start, range_end) for range_start, range_end in zip(boundaries, boundaries[1:]) if range_start < range_end]
+
     def get_next_instance(self, input_file: IO) -> Dict[str, object]:
         """
         Parses next instance from an input file and returns it.
@@ -296,6 +707,70 @@ class Parser(object):
         """
         pass
 
+    def write_results_batch(self, output_file: IO, rows: List[Dict[str, object]]):
+        """
+        Write result data of multiple instances to an output file. Optional.
+
+        Runners buffer results and write them in batches. The output file should not be flushed here, 
+        runners flush it before instances are written to the instances log.
+        By default write_result_to_file is called for every row.
+        
+        Arguments:
+            output_file {IO} -- Opened output file.
+            rows {List[Dict[str, object]]} -- Result data of instances in the order they were computed.
+        """
+        for data in rows:
+            self.write_result_to_file(output_file, data)
+
+class ResultSink(object):
+    """
+    Interface for result sinks. A sink stores results of one output file in its own format instead of text lines written by the parser,
+    e. g. in binary columns or in a database. Values are stored under columns of the algorithm.
+
+    Runners buffer results and write them in batches. A sink behaves like a file for InstancesLogger,
+    results written before flush must be persisted when it returns. Results of previous runs are kept, new results are appended.
+    """
+
+    @property
+    def name(self) -> str:
+        """
+        Returns:
+            str -- Path of the output file or directory.
+        """
+        pass
+
+    @property
+    def closed(self) -> bool:
+        pass
+
+    def write_results_batch(self, rows: List[Dict[str, object]]):
+        """
+        Write result data of multiple instances. They need not be persisted until the sink is flushed.
+        
+        Arguments:
+            rows {List[Dict[str, object]]} -- Result data of instances in the order they were computed.
+        """
+        pass
+
+    def flush(self):
+        """
+        Persists all written results.
+        """
+        pass
+
+    def fileno(self) -> int:
+        """
+        Returns:
+            int -- File descriptor that is fsynced after the sink is flushed if the fsync policy requires it.
+        """
+        pass
+
+    def close(self):
+        """
+        Flushes the sink and closes it.
+        """
+        pass
+
 class Communicator:
 
     def get_name(self) -> str:
@@ -1,5 +1,4 @@
 import os
-from slack import WebClient
 from typing import Dict
 from datetime import datetime
 from algorithm_tester_common.tester_dataclasses import Communicator
@@ -13,6 +12,9 @@ class SlackCommunicator(Communicator):
     """
     
     def __init__(self):
+        # Imported only when the communicator is used, the Slack client is slow to import
+        from slack import WebClient
+
         self.slack_web_client = WebClient(token=os.environ['slack_access_token'])
         self.main_msg_ts: str = None
         self.file_id: str = None
@@ -49,7 +51,9 @@ class SlackCommunicator(Communicator):
         """
         output_filename: str = last_solution.get("output_filename")
         print(f'Output file: {context.output_dir}/{output_filename}')
-        print(f'Instances [done/failed]: [{num_of_instances_done}/{num_of_instances_failed}]/{context.num_of_instances}')
+        # Instances may still be counted in the background
+        num_of_instances: str = str(context.num_of_instances) if context.num_of_instances is not None else "?"
+        print(f'Instances [done/failed]: [{num_of_instances_done}/{num_of_instances_failed}]/{num_of_instances}')
 
         # Create a zip file of the results directory in the same parent directory
         zip_dir_path: str = self._create_zip_file(context.output_dir)
@@ -57,8 +61,10 @@ class SlackCommunicator(Communicator):
         # Prepare messages
         start_time = datetime.fromtimestamp(context.start_time)
         timestr: str = f'Computation started: {start_time.strftime("%d.%m.%Y %H:%M:%S")}'
-        progress_str: str = f'Progress: [{num_of_instances_done}/{num_of_instances_failed}]/{context.num_of_instances} instances [done/failed].'
-        percent_str: str = f'{(num_of_instances_done + num_of_instances_failed)*100 // context.num_of_instances}% of work done.'
+        progress_str: str = f'Progress: [{num_of_instances_done}/{num_of_instances_failed}]/{num_of_instances} instances [done/failed].'
+        percent_str: str = "Total number of instances is not known yet."
+        if context.num_of_instances:
+            percent_str = f'{(num_of_instances_done + num_of_instances_failed)*100 // context.num_of_instances}% of work done.'
         main_message = {
             "username": os.environ['slack_bot_username'],
             "channel": os.environ['slack_channel_id'],
@@ -28,7 +28,7 @@ setup(
     long_description=long_description,
     keywords="algorithms,tester,budikpet, cli",
     setup_requires=['pytest-runner'],
-    install_requires=['Click', 'slackclient'],
+    install_requires=['Click', 'slackclient', 'importlib_metadata; python_version < "3.8"'],
     tests_require=['pytest==5.0.1', 'flexmock'],
     
     # All these 'dev' packages can then be installed by 'pip install .[dev]'
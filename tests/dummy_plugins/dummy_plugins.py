@@ -1,6 +1,6 @@
 import time
 import random
-from typing import List, Dict, IO
+from typing import List, Dict, IO, Tuple
 from algorithm_tester_common.tester_dataclasses import Algorithm, Parser, Communicator, AlgTesterContext, DynamicClickOption
 
 class DummyAlgorithm(Algorithm):
@@ -70,6 +70,12 @@ class DummyParser(Parser):
 
         return index + 1
 
+    def get_instance_cost(self, instance_data: Dict[str, object]) -> float:
+        return instance_data["item_count"]
+
+    def split_input_file(self, input_file: IO, start: int, num_of_ranges: int) -> List[Tuple[int, int]]:
+        return self._split_by_lines(input_file, start, num_of_ranges)
+
     def get_next_instance(self, input_file: IO) -> Dict[str, object]:
         instance: str = input_file.readline()
 
@@ -90,7 +96,7 @@ class DummyParser(Parser):
 
         return parsed_data
 
-    def write_result_to_file(self, output_file: IO, data: Dict[str, object]):
+    def _get_result_line(self, data: Dict[str, object]) -> str:
         columns: List[str] = data["algorithm"].get_columns()
 
         if data.get("things") is not None:
@@ -98,6 +104,10 @@ class DummyParser(Parser):
         
         output_data = [data.get(column) for column in columns]
         
-        output: str = f'{" ".join(map(str, output_data))}'
-        output_file.write(f'{output}\n')
-        output_file.flush()
\ No newline at end of file
+        return f'{" ".join(map(str, output_data))}\n'
+
+    def write_result_to_file(self, output_file: IO, data: Dict[str, object]):
+        output_file.write(self._get_result_line(data))
+
+    def write_results_batch(self, output_file: IO, rows: List[Dict[str, object]]):
+        output_file.write("".join([self._get_result_line(data) for data in rows]))
\ No newline at end of file
@@ -1,6 +1,6 @@
 import pytest
 from flexmock import flexmock
-from typing import List, Dict, IO
+from typing import List, Dict, IO, Tuple
 from algorithm_tester_common.tester_dataclasses import AlgTesterContext, Algorithm, Parser
 
 def create_dummy_context(algorithms: List[str] = list(), parser: Parser = "DummyParser", communicators: List[str] = list()) -> AlgTesterContext:
@@ -69,6 +69,9 @@ def create_dummy_parser(name: str = "DummyParser", write_result: bool = False):
 
             return index + 1
 
+        def split_input_file(self, input_file: IO, start: int, num_of_ranges: int) -> List[Tuple[int, int]]:
+            return self._split_by_lines(input_file, start, num_of_ranges)
+
         def get_next_instance(self, input_file: IO) -> Dict[str, object]:
             instance: str = input_file.readline()
 
@@ -100,6 +103,5 @@ def create_dummy_parser(name: str = "DummyParser", write_result: bool = False):
                 
                 output: str = f'{" ".join(map(str, output_data))}'
                 output_file.write(f'{output}\n')
-                output_file.flush()
 
     return DummyParser()
\ No newline at end of file
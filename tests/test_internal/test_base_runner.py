@@ -194,4 +194,60 @@ def test_compute_results(is_change_forced: bool):
     _runner.init(instances_logger)
     _runner.compute_results(base_context, input_files)
 
-    print
\ No newline at end of file
+    print
+def _failing_once_perform(context: AlgTesterContext, parsed_data: Dict[str, object]) -> Dict[str, object]:
+    if parsed_data["id"] == 250 and context.is_forced:
+        raise Exception("Dummy exception")
+
+    return parsed_data
+
+def test_run_tester_for_file_algorithm_checkpoint(tmpdir):
+    parser = create_dummy_parser()
+    algorithm = create_dummy_algorithm(perform_func=_failing_once_perform)
+    base_context: AlgTesterContext = create_dummy_context(algorithms=[algorithm.get_name()], parser=parser.get_name())
+    base_context.output_dir = tmpdir.strpath
+    notification_vars = {"last_comm_time": 0, "instances_done": 0, "instances_failed": 0}
+
+    instances_logger: InstancesLogger = InstancesLogger(base_context.output_dir, base_context.is_forced)
+    create_path(base_context.output_dir)
+    _runner.init(instances_logger)
+
+    with open(f'{base_context.input_dir}/4_inst.dat', "r") as input_file:
+        _runner.run_tester_for_file_algorithm(base_context, parser, algorithm, [], input_file, notification_vars)
+    instances_logger.close_log()
+
+    assert notification_vars["instances_failed"] == 1
+    assert notification_vars["instances_done"] == 499
+
+    # Resume, only the failed instance and instances after it are parsed again
+    base_context.is_forced = False
+    instances_logger = InstancesLogger(base_context.output_dir, base_context.is_forced)
+    _runner.init(instances_logger)
+
+    parsed_ids: List[int] = list()
+    get_next_instance = parser.get_next_instance
+    def _tracking_get_next_instance(input_file: IO) -> Dict[str, object]:
+        instance = get_next_instance(input_file)
+        if instance is not None:
+            parsed_ids.append(instance["id"])
+        return instance
+    flexmock(parser).should_receive("get_next_instance").replace_with(_tracking_get_next_instance)
+
+    with open(f'{base_context.input_dir}/4_inst.dat', "r") as input_file:
+        _runner.run_tester_for_file_algorithm(base_context, parser, algorithm, [], input_file, notification_vars)
+    instances_logger.close_log()
+
+    assert parsed_ids[0] == 250
+    assert len(parsed_ids) == 251
+    assert notification_vars["instances_done"] == 500
+
+    # Everything is done, nothing is parsed
+    instances_logger = InstancesLogger(base_context.output_dir, base_context.is_forced)
+    _runner.init(instances_logger)
+    parsed_ids.clear()
+
+    with open(f'{base_context.input_dir}/4_inst.dat', "r") as input_file:
+        _runner.run_tester_for_file_algorithm(base_context, parser, algorithm, [], input_file, notification_vars)
+    instances_logger.close_log()
+
+    assert len(parsed_ids) == 0
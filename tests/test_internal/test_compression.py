@@ -0,0 +1,223 @@
+import os
+import bz2
+import gzip
+import lzma
+import pytest
+from flexmock import flexmock
+from typing import IO, List
+from algorithm_tester import compression as compression_module
+from algorithm_tester.compression import Compressions, CompressedOutputFile, get_output_path, open_input_file, open_output, recover_output_file
+from algorithm_tester.concurrency_runners import Runner, Runners
+from algorithm_tester.plugins import Plugins
+from algorithm_tester.helpers import create_path
+from algorithm_tester_common.tester_dataclasses import AlgTesterContext, InstancesLogger
+from tests.test_internal.fixtures import create_dummy_context, create_dummy_algorithm, create_dummy_parser
+
+_OPENERS = {Compressions.GZIP: gzip.open, Compressions.BZ2: bz2.open, Compressions.XZ: lzma.open}
+
+def _read_compressed(path: str, compression: Compressions) -> str:
+    with _OPENERS[compression](path, "rt") as compressed_file:
+        return compressed_file.read()
+
+@pytest.mark.parametrize('compression', (Compressions.GZIP, Compressions.BZ2, Compressions.XZ))
+def test_open_input_file(tmpdir, compression: Compressions):
+    lines: List[str] = [f'{index} line\n' for index in range(100)]
+    path: str = f'{tmpdir.strpath}/input.dat{compression.get_suffix()}'
+    with _OPENERS[compression](path, "wt") as compressed_file:
+        compressed_file.writelines(lines)
+
+    with open_input_file(path) as input_file:
+        assert input_file.name == path
+        assert os.fstat(input_file.fileno()).st_size == os.path.getsize(path)
+
+        input_file.readline()
+        offset: int = input_file.tell()
+        assert input_file.readlines() == lines[1:]
+
+        # Offsets are positions in the decompressed stream
+        input_file.seek(offset)
+        assert input_file.readline() == lines[1]
+
+def test_get_output_path():
+    assert get_output_path("out.dat", Compressions.NONE) == ("out.dat", Compressions.NONE)
+    assert get_output_path("out.dat", Compressions.XZ) == ("out.dat.xz", Compressions.XZ)
+    assert get_output_path("out.dat.gz", Compressions.NONE) == ("out.dat.gz", Compressions.GZIP)
+    assert get_output_path("out.dat.gz", Compressions.XZ) == ("out.dat.gz", Compressions.GZIP)
+
+@pytest.mark.parametrize('compression', (Compressions.GZIP, Compressions.BZ2, Compressions.XZ))
+def test_compressed_output_file(tmpdir, monkeypatch, compression: Compressions):
+    # Every flush writes a new stream
+    monkeypatch.setattr(compression_module, "MIN_STREAM_SIZE", 1)
+    path: str = f'{tmpdir.strpath}/output.dat{compression.get_suffix()}'
+
+    output_file: IO = open_output(path, compression)
+    output_file.write("1 first\n")
+    output_file.flush()
+    output_file.write("2 second\n")
+    output_file.close()
+    assert output_file.closed
+    assert _read_compressed(path, compression) == "1 first\n2 second\n"
+
+    # The run is interrupted after a flush, the last stream is not finished
+    output_file = CompressedOutputFile(path, compression)
+    output_file.write("3 third\n")
+    output_file.flush()
+    output_file.write("4 fourth\n")
+    output_file._output_file.close()
+    if compression != Compressions.GZIP:
+        with open(path, "ab") as torn_file:
+            torn_file.write(bz2.compress(b"5 torn\n")[:-10] if compression == Compressions.BZ2 else lzma.compress(b"5 torn\n")[:-10])
+
+    # Torn streams are removed, their instances were not logged
+    output_file = open_output(path, compression)
+    output_file.write("6 sixth\n")
+    output_file.close()
+    assert _read_compressed(path, compression) == "1 first\n2 second\n3 third\n6 sixth\n"
+
+@pytest.mark.parametrize('compression', (Compressions.BZ2, Compressions.XZ))
+def test_compressed_output_file_min_stream_size(tmpdir, monkeypatch, compression: Compressions):
+    monkeypatch.setattr(compression_module, "MIN_STREAM_SIZE", 16)
+    path: str = f'{tmpdir.strpath}/output.dat{compression.get_suffix()}'
+    output_dir: str = tmpdir.mkdir("output").strpath
+    instances_logger: InstancesLogger = InstancesLogger(output_dir, False, commit_entries=1)
+
+    # Flushes below the minimal stream size do not write a stream and the log waits for it
+    output_file: CompressedOutputFile = open_output(path, compression)
+    output_file.write("1 first\n")
+    instances_logger.write_instance_to_log("alg 1", output_file)
+    assert output_file.unwritten_size == 8
+    assert os.path.getsize(path) == 0
+    assert not os.path.exists(f'{output_dir}/.instances_log.dat')
+
+    output_file.write("2 second\n")
+    instances_logger.write_instance_to_log("alg 2", output_file)
+    assert output_file.unwritten_size == 0
+    with open(f'{output_dir}/.instances_log.dat') as instances_log:
+        assert instances_log.read() == "alg 1\nalg 2\n"
+
+    # Text of closed files is written
+    output_file.write("3 third\n")
+    instances_logger.write_instance_to_log("alg 3", output_file)
+    output_file.close()
+    instances_logger.close_log()
+    assert _read_compressed(path, compression) == "1 first\n2 second\n3 third\n"
+    with open(f'{output_dir}/.instances_log.dat') as instances_log:
+        assert instances_log.read() == "alg 1\nalg 2\nalg 3\n"
+
+    # Only a single stream was written before the file was closed
+    with open(path, "rb") as compressed_file:
+        data: bytes = compressed_file.read()
+    decompressor = bz2.BZ2Decompressor() if compression == Compressions.BZ2 else lzma.LZMADecompressor()
+    assert decompressor.decompress(data) == b"1 first\n2 second\n"
+
+def test_compressed_output_files_logged_per_file(tmpdir, monkeypatch):
+    monkeypatch.setattr(compression_module, "MIN_STREAM_SIZE", 16)
+    output_dir: str = tmpdir.mkdir("output").strpath
+    instances_logger: InstancesLogger = InstancesLogger(output_dir, False, commit_entries=2)
+    small_file: CompressedOutputFile = open_output(f'{tmpdir.strpath}/small.dat.bz2', Compressions.BZ2)
+    large_file: CompressedOutputFile = open_output(f'{tmpdir.strpath}/large.dat.bz2', Compressions.BZ2)
+
+    for index in range(1, 3):
+        large_file.write(f'{index} large result line\n')
+        instances_logger.write_instance_to_log(f'alg {index}', large_file)
+    instances_logger.write_checkpoint("alg", "large.dat", 100, 50)
+
+    small_file.write("3 small\n")
+    instances_logger.write_instance_to_log("alg 3", small_file)
+    instances_logger.write_checkpoint("alg", "small.dat", 100, 10)
+
+    large_file.write("4 large result line\n")
+    instances_logger.write_instance_to_log("alg 4", large_file)
+
+    # Instances of the large file are logged although the small file keeps its results unwritten
+    with open(f'{output_dir}/.instances_log.dat') as instances_log:
+        assert instances_log.read() == "alg 1\nalg 2\nalg 4\n"
+
+    # Checkpoints wait for instances that were buffered before them
+    with open(f'{output_dir}/.instances_checkpoints.dat') as checkpoints_file:
+        assert checkpoints_file.read() == "alg 50 100 large.dat\n"
+
+    small_file.close()
+    large_file.close()
+    instances_logger.close_log()
+    with open(f'{output_dir}/.instances_log.dat') as instances_log:
+        assert instances_log.read() == "alg 1\nalg 2\nalg 4\nalg 3\n"
+    with open(f'{output_dir}/.instances_checkpoints.dat') as checkpoints_file:
+        assert checkpoints_file.read() == "alg 50 100 large.dat\nalg 10 100 small.dat\n"
+
+def test_recover_output_file(tmpdir):
+    path: str = f'{tmpdir.strpath}/output.dat.gz'
+    complete: bytes = gzip.compress(b"1 first\n")
+    with open(path, "wb") as output_file:
+        output_file.write(complete + gzip.compress(b"2 second\n3 thi")[:-8] + b"\x00"*16)
+
+    # Complete lines of the torn member are returned, the member is removed
+    assert recover_output_file(path, Compressions.GZIP) == b"2 second\n"
+    assert os.path.getsize(path) == len(complete)
+
+    assert recover_output_file(path, Compressions.GZIP) == b""
+    assert recover_output_file(f'{tmpdir.strpath}/missing.dat.gz', Compressions.GZIP) == b""
+
+@pytest.mark.parametrize('compression', (Compressions.GZIP, Compressions.BZ2, Compressions.XZ))
+def test_recover_output_file_from_last_stream(tmpdir, monkeypatch, compression: Compressions):
+    path: str = f'{tmpdir.strpath}/output.dat{compression.get_suffix()}'
+    compress = {Compressions.GZIP: gzip.compress, Compressions.BZ2: bz2.compress, Compressions.XZ: lzma.compress}[compression]
+    complete: bytes = b"".join(compress(f'{index} complete\n'.encode()*1000) for index in range(5))
+    torn_lines: bytes = b"".join(f'{index} torn line\n'.encode() for index in range(20000))
+    with open(path, "wb") as output_file:
+        output_file.write(complete + compress(torn_lines)[:-50] + b"\x00"*16)
+
+    starts: List[int] = list()
+    find_incomplete_stream = compression_module._find_incomplete_stream
+    def recorded_find_incomplete_stream(output_file, compression, start=0):
+        starts.append(start)
+        return find_incomplete_stream(output_file, compression, start)
+    monkeypatch.setattr(compression_module, "_find_incomplete_stream", recorded_find_incomplete_stream)
+
+    # Streams before the last complete one are not decompressed
+    recovered: bytes = recover_output_file(path, compression)
+    assert min(starts) > len(complete)//2
+    assert os.path.getsize(path) == len(complete)
+
+    # Lines of gzip members decompressed before the error are kept, torn bzip2 and xz streams were never logged
+    if compression == Compressions.GZIP:
+        assert len(recovered) > 0 and torn_lines.startswith(recovered) and recovered.endswith(b"\n")
+    else:
+        assert recovered == b""
+
+@pytest.mark.parametrize('runner_name, parse_in_workers', [("BASE", False), ("FILES", False), ("INSTANCES", False), ("PIPELINE", False), ("FILES", True), ("INSTANCES", True)])
+def test_compute_results_compressed(tmpdir, runner_name: str, parse_in_workers: bool):
+    parser = create_dummy_parser(write_result=True)
+    algorithm = create_dummy_algorithm()
+    base_context: AlgTesterContext = create_dummy_context(algorithms=[algorithm.get_name()], parser=parser.get_name())
+    input_files: List[str] = sorted(os.listdir(base_context.input_dir))
+
+    # Input files are compressed with gzip, their output files keep the suffix
+    expected: List[str] = list()
+    input_dir: str = tmpdir.mkdir("input").strpath
+    for input_filename in input_files:
+        with open(f'{base_context.input_dir}/{input_filename}', "rb") as input_file, gzip.open(f'{input_dir}/{input_filename}.gz', "wb") as compressed_file:
+            lines: List[bytes] = input_file.readlines()
+            compressed_file.writelines(lines)
+        expected.append(sorted(f'{line.split()[0].decode()} {algorithm.get_name()}\n' for line in lines))
+
+    base_context.input_dir = input_dir
+    base_context.output_dir = f'{tmpdir.strpath}/output'
+    base_context.executor_name = "THREAD"
+    base_context.parse_in_workers = parse_in_workers
+    base_context.output_compression_name = "XZ"
+
+    flexmock(Plugins)
+    Plugins.should_receive("get_parser").and_return(parser)
+    Plugins.should_receive("get_algorithm").with_args(algorithm.get_name()).and_return(algorithm)
+
+    instances_logger: InstancesLogger = InstancesLogger(base_context.output_dir, base_context.is_forced)
+    create_path(base_context.output_dir)
+    runner: Runner = Runners[runner_name].value
+    runner.init(instances_logger)
+    runner.compute_results(base_context, sorted(os.listdir(input_dir)))
+    instances_logger.close_log()
+
+    for input_filename, expected_lines in zip(input_files, expected):
+        output_path: str = f'{base_context.output_dir}/{input_filename.replace(".dat", f"_{algorithm.get_name()}_sol.dat")}.gz'
+        assert sorted(_read_compressed(output_path, Compressions.GZIP).splitlines(keepends=True)) == expected_lines
@@ -1,10 +1,17 @@
+import os
+import time
+import itertools
+import multiprocessing
+import concurrent.futures
 import pytest
 from flexmock import flexmock
 from algorithm_tester.concurrency_runners import Runner, Runners
 import algorithm_tester.concurrency_runners as concurrency_runners
-from algorithm_tester_common.tester_dataclasses import Algorithm, AlgTesterContext
+from algorithm_tester_common.tester_dataclasses import Algorithm, AlgTesterContext, InstancesIndex
+from typing import Dict
 from algorithm_tester.helpers import curr_time_millis
-from tests.test_internal.fixtures import create_dummy_context, create_dummy_algorithm
+from algorithm_tester.executors import SupervisedProcessPoolExecutor, WorkerCrashError
+from tests.test_internal.fixtures import create_dummy_context, create_dummy_algorithm, create_dummy_parser
 
 def test_create_columns_description_file(tmpdir):
     base_context = create_dummy_context()
@@ -25,4 +32,222 @@ def test_create_columns_description_file(tmpdir):
     assert line is not None
     assert ' '.join(algorithm.get_columns()) == line
 
-    print
\ No newline at end of file
+    print
+def test_checkpoint_tracker():
+    tracker = concurrency_runners.CheckpointTracker("DummyAlgorithm", "4_inst.dat", 1000, 0)
+    tickets = [tracker.register(end_offset) for end_offset in (10, 20, 30, 40)]
+
+    assert not tracker.complete(tickets[1])
+    assert tracker.offset == 0
+
+    assert tracker.complete(tickets[0])
+    assert tracker.offset == 20
+
+    # A failed instance blocks the checkpoint
+    assert not tracker.complete(tickets[3])
+    assert tracker.offset == 20
+
+    print
+
+@pytest.mark.parametrize('max_in_flight', (1, 3))
+def test_submit_bounded(max_in_flight: int):
+    num_of_tasks: int = 20
+    submitted = list()
+    
+    def _tasks():
+        for i in range(num_of_tasks):
+            submitted.append(i)
+            yield (i, lambda x: x*2, (i,))
+
+    done = list()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        for key, future in concurrency_runners.submit_bounded(executor, _tasks(), max_in_flight):
+            # Tasks are taken only when there is space for them
+            assert len(submitted) - len(done) <= max_in_flight
+            assert future.result() == key*2
+            done.append(key)
+
+    assert sorted(done) == list(range(num_of_tasks))
+
+def test_chunk_sizer():
+    fixed_sizer = concurrency_runners.ChunkSizer(3)
+    chunks = list(fixed_sizer.get_chunks((i, None, None) for i in range(10)))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+
+    fixed_sizer.record(3, 10.0)
+    assert fixed_sizer.get_chunk_size() == 3
+
+    auto_sizer = concurrency_runners.ChunkSizer(0)
+    assert auto_sizer.get_chunk_size() == 1
+
+    # Tiny instances are batched, slow instances are sent one by one
+    auto_sizer.record(1, auto_sizer.TARGET_CHUNK_TIME / 100)
+    assert auto_sizer.get_chunk_size() == 100
+
+    for _ in range(50):
+        auto_sizer.record(10, 10*auto_sizer.TARGET_CHUNK_TIME)
+    assert auto_sizer.get_chunk_size() == 1
+
+def _failing_func(context: AlgTesterContext, parsed_data: Dict[str, object]) -> Dict[str, object]:
+    raise Exception("Dummy exception")
+
+def test_solve_in_chunks():
+    base_context = create_dummy_context()
+    base_context.chunk_size = 4
+    algorithm = create_dummy_algorithm()
+    failing_algorithm = create_dummy_algorithm(name="AlgFailure", perform_func=_failing_func)
+    items = [(i, failing_algorithm if i % 5 == 0 else algorithm, {"id": i, "algorithm_name": algorithm.get_name()}) for i in range(20)]
+
+    runner = concurrency_runners.BaseRunner()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2, initializer=concurrency_runners.init_worker, initargs=(base_context, [algorithm, failing_algorithm])) as executor:
+        results = dict(runner.solve_in_chunks(base_context, executor, items))
+
+    assert sorted(results.keys()) == list(range(20))
+    for key, result in results.items():
+        if key % 5 == 0:
+            assert isinstance(result, Exception)
+        else:
+            assert result["id"] == key
+            assert result["algorithm"] is algorithm
+
+def _hanging_func(context: AlgTesterContext, parsed_data: Dict[str, object]) -> Dict[str, object]:
+    if parsed_data["id"] == 7:
+        time.sleep(60)
+
+    return parsed_data
+
+def test_solve_in_chunks_timeout():
+    base_context = create_dummy_context()
+    base_context.chunk_size = 4
+    base_context.instance_timeout = 0.5
+    algorithm = create_dummy_algorithm(perform_func=_hanging_func)
+    items = [(i, algorithm, {"id": i, "algorithm_name": algorithm.get_name()}) for i in range(12)]
+
+    runner = concurrency_runners.BaseRunner()
+    with SupervisedProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("fork"), initializer=concurrency_runners.init_worker, 
+            initargs=(base_context, [algorithm]), timeout=base_context.instance_timeout) as executor:
+        results = dict(runner.solve_in_chunks(base_context, executor, items))
+
+    assert sorted(results.keys()) == list(range(12))
+    for key, result in results.items():
+        assert result["id"] == key
+        assert result["algorithm"] is algorithm
+        assert result.get("timed_out", False) == (key == 7)
+
+    assert results[7]["elapsed_time"] == 500
+
+def _crashing_func(context: AlgTesterContext, parsed_data: Dict[str, object]) -> Dict[str, object]:
+    if parsed_data["id"] == 5:
+        os._exit(1)
+
+    return parsed_data
+
+def test_solve_in_chunks_crash():
+    base_context = create_dummy_context()
+    base_context.chunk_size = 4
+    algorithm = create_dummy_algorithm(perform_func=_crashing_func)
+    items = [(i, algorithm, {"id": i, "algorithm_name": algorithm.get_name()}) for i in range(12)]
+
+    runner = concurrency_runners.BaseRunner()
+    with SupervisedProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("fork"), initializer=concurrency_runners.init_worker, 
+            initargs=(base_context, [algorithm]), max_attempts=1) as executor:
+        results = dict(runner.solve_in_chunks(base_context, executor, items))
+
+    assert sorted(results.keys()) == list(range(12))
+    for key, result in results.items():
+        if key == 5:
+            assert isinstance(result, WorkerCrashError)
+        else:
+            assert result["id"] == key
+
+@pytest.mark.parametrize('num_of_ranges', (1, 3, 8, 1000))
+def test_split_input_file(num_of_ranges: int):
+    parser = create_dummy_parser()
+    input_path: str = "tests/test_internal/fixtures/data/10_inst.dat"
+    file_size: int = os.path.getsize(input_path)
+
+    with open(input_path, "rb") as binary_file:
+        line_starts = set(itertools.accumulate(len(line) for line in binary_file))
+    line_starts.add(0)
+
+    with open(input_path, "r") as input_file:
+        # Ranges start after the first instance
+        input_file.readline()
+        start: int = input_file.tell()
+        ranges = parser.split_input_file(input_file, start, num_of_ranges)
+
+    assert 1 <= len(ranges) <= num_of_ranges
+    assert ranges[0][0] == start
+    assert ranges[-1][1] == file_size
+    for (_, prev_end), (next_start, _) in zip(ranges, ranges[1:]):
+        assert prev_end == next_start
+        assert next_start in line_starts
+
+def _get_ranges(input_path: str, algorithm: Algorithm, num_of_ranges: int):
+    parser = create_dummy_parser()
+
+    with open(input_path, "r") as input_file:
+        for key, (start, end) in enumerate(parser.split_input_file(input_file, 0, num_of_ranges)):
+            yield (key, input_path, start, end, algorithm)
+
+def test_solve_ranges_timeout():
+    base_context = create_dummy_context()
+    base_context.instance_timeout = 0.5
+    parser = create_dummy_parser()
+    algorithm = create_dummy_algorithm(perform_func=_hanging_func)
+    input_path: str = "tests/test_internal/fixtures/data/10_inst.dat"
+
+    runner = concurrency_runners.BaseRunner()
+    with SupervisedProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("fork"), initializer=concurrency_runners.init_worker, 
+            initargs=(base_context, [algorithm], parser), timeout=base_context.instance_timeout) as executor:
+        ranges = list(runner.solve_ranges(base_context, executor, parser, _get_ranges(input_path, algorithm, 8)))
+
+    results = {result["id"]: result for _, range_results, _ in ranges for result in range_results}
+    assert sorted(results.keys()) == list(range(1, 501))
+    for key, result in results.items():
+        assert result["algorithm"] is algorithm
+        assert result.get("timed_out", False) == (key == 7)
+
+    # Every range is reported as completed exactly once
+    assert sorted(key for key, _, completed in ranges if completed) == list(range(8))
+
+def test_solve_ranges_crash():
+    base_context = create_dummy_context()
+    parser = create_dummy_parser()
+    algorithm = create_dummy_algorithm(perform_func=_crashing_func)
+    input_path: str = "tests/test_internal/fixtures/data/10_inst.dat"
+    done_instances = {algorithm.get_name(): InstancesIndex()}
+    done_instances[algorithm.get_name()].add(parser._get_complete_instance_identifier(algorithm, {"id": 3, "item_count": 10}))
+
+    runner = concurrency_runners.BaseRunner()
+    with SupervisedProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("fork"), initializer=concurrency_runners.init_worker, 
+            initargs=(base_context, [algorithm], parser, done_instances), max_attempts=1) as executor:
+        ranges = list(runner.solve_ranges(base_context, executor, parser, _get_ranges(input_path, algorithm, 4)))
+
+    results = [result for _, range_results, _ in ranges for result in range_results]
+    assert len([result for result in results if isinstance(result, WorkerCrashError)]) == 1
+    assert sorted(result["id"] for result in results if not isinstance(result, Exception)) == [key for key in range(1, 501) if key not in (3, 5)]
+
+    # The range with the crashing instance is never completed
+    assert sorted(key for key, _, completed in ranges if completed) == [1, 2, 3]
+
+@pytest.mark.parametrize('lookahead', (1, 4, 100))
+def test_schedule_items(lookahead: int):
+    parser = create_dummy_parser()
+    flexmock(parser).should_receive("get_instance_cost").replace_with(lambda data: data["item_count"])
+    base_context = create_dummy_context()
+    base_context.lookahead = lookahead
+    items = [(i, None, {"item_count": count}) for i, count in enumerate([4, 40, 10, 35, 4, 15, 40, 20])]
+
+    base_context.schedule_name = concurrency_runners.SchedulingPolicies.FIFO.name
+    assert list(concurrency_runners.schedule_items(base_context, parser, items)) == items
+
+    base_context.schedule_name = concurrency_runners.SchedulingPolicies.LPT.name
+    scheduled = list(concurrency_runners.schedule_items(base_context, parser, items))
+    assert sorted(scheduled) == sorted(items)
+
+    if lookahead == 1:
+        assert scheduled == items
+    elif lookahead >= len(items):
+        # Largest first, ties keep their order
+        assert [item[0] for item in scheduled] == [1, 6, 3, 7, 5, 2, 0, 4]
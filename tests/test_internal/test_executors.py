@@ -0,0 +1,143 @@
+import os
+import sys
+import time
+import threading
+import multiprocessing
+import concurrent.futures
+import pytest
+from algorithm_tester.executors import Executors, InlineExecutor, SupervisedProcessPoolExecutor, InstanceTimeoutError, WorkerCrashError, create_executor, get_num_of_workers, start_watch, stop_watch
+from algorithm_tester_common.tester_dataclasses import AlgTesterContext
+from tests.test_internal.fixtures import create_dummy_context
+
+_initialized = list()
+
+def _initializer(value: int):
+    _initialized.append(value)
+
+def _failing_func():
+    raise Exception("Dummy exception")
+
+def _watched_sleep(detail: object, seconds: float) -> object:
+    start_watch(detail)
+    time.sleep(seconds)
+    stop_watch()
+
+    return detail
+
+def _crashing_func(value: int, marker: str = None) -> int:
+    if marker is None or not os.path.exists(marker):
+        if marker is not None:
+            open(marker, "w").close()
+        os._exit(1)
+
+    return value
+
+def test_inline_executor():
+    _initialized.clear()
+    executor = InlineExecutor(initializer=_initializer, initargs=(1,))
+    assert _initialized == [1]
+
+    future = executor.submit(lambda x: x*2, 2)
+    assert future.done()
+    assert future.result() == 4
+
+    future = executor.submit(_failing_func)
+    assert future.done()
+    with pytest.raises(Exception):
+        future.result()
+
+@pytest.mark.parametrize(['executor_name', 'executor_type'], 
+    [
+        (Executors.INLINE.name, InlineExecutor),
+        (Executors.THREAD.name, concurrent.futures.ThreadPoolExecutor),
+        (Executors.PROCESS.name, SupervisedProcessPoolExecutor),
+        (Executors.PROCESS_SPAWN.name, SupervisedProcessPoolExecutor)
+    ]
+)
+def test_create_executor(executor_name: str, executor_type: type):
+    base_context: AlgTesterContext = create_dummy_context()
+    base_context.executor_name = executor_name
+    base_context.jobs = 2
+
+    with create_executor(base_context) as executor:
+        assert isinstance(executor, executor_type)
+        assert executor.submit(pow, 2, 3).result() == 8
+
+def test_get_num_of_workers():
+    base_context: AlgTesterContext = create_dummy_context()
+    assert get_num_of_workers(base_context) >= 1
+
+    base_context.jobs = 3
+    assert get_num_of_workers(base_context) == 3
+
+def test_start_methods():
+    assert Executors.PROCESS.get_start_method() is None
+    assert Executors.PROCESS_FORKSERVER.get_start_method() == "forkserver"
+    assert Executors.THREAD.get_start_method() is None
+    assert not Executors.INLINE.is_process()
+
+def test_supervised_executor_timeout():
+    with SupervisedProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("fork"), timeout=0.5) as executor:
+        futures = [executor.submit(_watched_sleep, index, 60 if index == 3 else 0.05) for index in range(8)]
+
+        for index, future in enumerate(futures):
+            if index == 3:
+                with pytest.raises(InstanceTimeoutError) as e:
+                    future.result(timeout=30)
+                assert e.value.detail == 3
+                assert e.value.timeout == 0.5
+            else:
+                assert future.result(timeout=30) == index
+
+        # The pool is usable after its workers were replaced
+        assert executor.submit(pow, 2, 3).result(timeout=30) == 8
+
+def test_supervised_executor_crash(tmpdir):
+    marker: str = tmpdir.join("crashed").strpath
+
+    with SupervisedProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("fork"), max_attempts=2) as executor:
+        futures = [executor.submit(_watched_sleep, index, 0.05) for index in range(6)]
+        crashing = executor.submit(_crashing_func, 1)
+        crashing_once = executor.submit(_crashing_func, 2, marker)
+        futures.extend([executor.submit(_watched_sleep, index, 0.05) for index in range(6, 12)])
+
+        for index, future in enumerate(futures):
+            assert future.result(timeout=30) == index
+
+        with pytest.raises(WorkerCrashError) as e:
+            crashing.result(timeout=30)
+        assert e.value.attempts == 2
+
+        assert crashing_once.result(timeout=30) == 2
+
+def test_supervised_executor_submit_error():
+    # Spawned workers get pickled arguments of the initializer, a lock can not be pickled
+    executor = SupervisedProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"), initializer=_initializer, initargs=(threading.Lock(),))
+    with pytest.raises(TypeError):
+        executor.submit(pow, 2, 3)
+
+    # The task is not left running, so shutdown does not wait for it
+    assert len(executor._running) == 0
+    shutdown = threading.Thread(target=executor.shutdown)
+    shutdown.start()
+    shutdown.join(timeout=30)
+    assert not shutdown.is_alive()
+
+@pytest.mark.parametrize('version_info', ((3, 8, 0), (3, 9, 0)))
+def test_supervised_executor_shutdown_cancels_futures(monkeypatch, version_info):
+    # Pools before Python 3.9 do not accept cancel_futures
+    monkeypatch.setattr(sys, "version_info", version_info)
+    shutdown = concurrent.futures.ProcessPoolExecutor.shutdown
+    def checked_shutdown(self, wait=True, **kwargs):
+        assert version_info >= (3, 9) or "cancel_futures" not in kwargs
+        return shutdown(self, wait=wait, **kwargs)
+    monkeypatch.setattr(concurrent.futures.ProcessPoolExecutor, "shutdown", checked_shutdown)
+
+    executor = SupervisedProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("fork"))
+    futures = [executor.submit(time.sleep, 0.2) for _ in range(6)]
+    time.sleep(0.1)
+
+    executor.shutdown(wait=True, cancel_futures=True)
+    assert all(future.done() for future in futures)
+    assert any(future.cancelled() for future in futures)
+    assert not futures[0].cancelled()
@@ -81,7 +81,7 @@ def test_write_result(tmpdir):
     base_context: AlgTesterContext = create_dummy_context(parser=parser)
     base_context.output_dir = tmpdir.strpath
     output_files = {
-        'output_1.dat': open(f'{base_context.output_dir}/output_1.dat', "w")
+        'output_1.dat': concurrency_runners.open_output_file(base_context, parser, 'output_1.dat')
     }
 
     flexmock(parser).should_receive("write_result_to_file").times(3)
@@ -117,4 +117,37 @@ def test_write_result(tmpdir):
 #         )
 
 #     _runner.run_tester_for_data(base_context, algorithms, parser, list(), input_files_dict, output_files_dict)
-#     print
\ No newline at end of file
+#     print
+def test_get_data_for_executor_shares_instances():
+    parser = create_dummy_parser()
+    algorithms = [create_dummy_algorithm(name="DummyAlg1"), create_dummy_algorithm(name="DummyAlg2")]
+    base_context: AlgTesterContext = create_dummy_context(parser=parser)
+    input_files = _get_input_files(base_context.input_dir)
+
+    data_iter = _runner.get_data_for_executor(base_context, input_files, parser, algorithms)
+    (alg1, data1), (alg2, data2) = next(data_iter), next(data_iter)
+
+    # Parsed values are shared, runner keys are not
+    assert data1["things"] is data2["things"]
+    assert data1["algorithm_name"] == alg1.get_name()
+    assert data2["algorithm_name"] == alg2.get_name()
+    
+    _runner.close_all_files(input_files)
+
+def test_get_data_for_executor_copies_instances_for_threads():
+    parser = create_dummy_parser()
+    algorithms = [create_dummy_algorithm(name="DummyAlg1"), create_dummy_algorithm(name="DummyAlg2")]
+    base_context: AlgTesterContext = create_dummy_context(parser=parser)
+    base_context.executor_name = "THREAD"
+    input_files = _get_input_files(base_context.input_dir)
+
+    data_iter = _runner.get_data_for_executor(base_context, input_files, parser, algorithms)
+    (_, data1), (_, data2) = next(data_iter), next(data_iter)
+
+    # Algorithms in the same process can sort their input in place
+    expected = list(data2["things"])
+    data1["things"].reverse()
+    assert data1["things"] is not data2["things"]
+    assert data2["things"] == expected
+
+    _runner.close_all_files(input_files)
@@ -0,0 +1,47 @@
+import pytest
+from typing import List
+from algorithm_tester.helpers import ShardModes, get_input_files, is_in_shard
+from algorithm_tester.concurrency_runners import BaseRunner
+from algorithm_tester_common.tester_dataclasses import AlgTesterContext
+from tests.test_internal.fixtures import create_dummy_context, create_dummy_algorithm, create_dummy_parser
+
+def _create_files(tmpdir, paths: List[str]):
+    for path in paths:
+        tmpdir.join(path).ensure()
+
+def test_get_input_files(tmpdir):
+    _create_files(tmpdir, ["b.dat", "a.dat", "notes.txt", "nested/c.dat", "nested/deeper/d.dat", "skipped/e.dat"])
+
+    assert get_input_files(tmpdir.strpath) == ["a.dat", "b.dat", "nested/c.dat", "nested/deeper/d.dat", "notes.txt", "skipped/e.dat"]
+    assert get_input_files(tmpdir.strpath, recursive=False) == ["a.dat", "b.dat", "notes.txt"]
+    assert get_input_files(tmpdir.strpath, include=["*.dat"], exclude=["skipped", "b.*"]) == ["a.dat", "nested/c.dat", "nested/deeper/d.dat"]
+    assert get_input_files(tmpdir.strpath, include=["nested/deeper/*"]) == ["nested/deeper/d.dat"]
+
+@pytest.mark.parametrize('num_of_shards', (1, 3, 7))
+def test_shard_input_files(tmpdir, num_of_shards: int):
+    paths: List[str] = [f'dir_{index % 3}/file_{index}.dat' for index in range(50)]
+    _create_files(tmpdir, paths)
+
+    shards: List[List[str]] = [get_input_files(tmpdir.strpath, shard=(index, num_of_shards)) for index in range(num_of_shards)]
+
+    # Every file belongs to exactly one shard
+    assert sorted(path for shard in shards for path in shard) == sorted(paths)
+    assert shards == [get_input_files(tmpdir.strpath, shard=(index, num_of_shards)) for index in range(num_of_shards)]
+
+def test_shard_instances():
+    parser = create_dummy_parser()
+    algorithm = create_dummy_algorithm()
+    base_context: AlgTesterContext = create_dummy_context(parser=parser.get_name())
+    base_context.shard_by_name = ShardModes.INSTANCES.name
+    runner = BaseRunner()
+
+    ids: List[int] = list()
+    for index in range(3):
+        base_context.shard = (index, 3)
+        with open(f'{base_context.input_dir}/4_inst.dat', "r") as input_file:
+            shard_ids = [data["id"] for data, _ in runner.get_parsed_instances(base_context, input_file, parser, algorithm)]
+
+        assert all(is_in_shard(parser.get_instance_identifier({"id": id, "item_count": 4}), (index, 3)) for id in shard_ids)
+        ids.extend(shard_ids)
+
+    assert sorted(ids) == list(range(1, 501))
@@ -2,7 +2,7 @@ import os
 import pytest
 from flexmock import flexmock
 from algorithm_tester.concurrency_runners import get_click_options
-from algorithm_tester_common.tester_dataclasses import InstancesLogger, Parser, AlgTesterContext, Algorithm
+from algorithm_tester_common.tester_dataclasses import InstancesLogger, InstancesIndex, LogFsyncPolicy, Parser, AlgTesterContext, Algorithm
 from tests.test_internal.fixtures import create_dummy_algorithm, create_dummy_context, create_dummy_parser
 
 log_filename = ".instances_log.dat"
@@ -142,4 +142,67 @@ def test_get_num_of_done_instances(tmpdir, is_change_forced: bool, max_instances
         if max_instances_done_per_file is None:
             assert instances_logger.get_num_of_done_instances() != 0
         else:
-            assert instances_logger.get_num_of_done_instances() == num_of_input_files*max_instances_done_per_file
\ No newline at end of file
+            assert instances_logger.get_num_of_done_instances() == num_of_input_files*max_instances_done_per_file
+
+def test_instances_index():
+    index: InstancesIndex = InstancesIndex()
+    identifiers = [f'DummyAlgorithm {i},{i % 40}' for i in range(1000)]
+
+    for identifier in identifiers:
+        index.add(identifier)
+    # Duplicates are stored only once
+    index.add(identifiers[0])
+
+    assert len(index) == len(identifiers)
+    for identifier in identifiers:
+        assert identifier in index
+    
+    assert "DummyAlgorithm 1000,0" not in index
+    assert "Alg2 1,1" not in index
+
+@pytest.mark.parametrize('max_instances_done_per_file', (None, 10))
+def test_is_instance_already_done(tmpdir, max_instances_done_per_file: int):
+    base_context, algorithm, parser, instances_logger = prepare_objects(tmpdir.strpath, False, max_instances_done_per_file)
+
+    with open(f'{base_context.output_dir}/{log_filename}', "r") as log_file:
+        for instance_identifier in log_file:
+            assert instances_logger.is_instance_already_done(instance_identifier.strip())
+
+    assert not instances_logger.is_instance_already_done(f'{algorithm.get_name()} 100000,4')
+    assert not instances_logger.is_instance_already_done("UnknownAlgorithm 1,4")
+
+def _count_log_lines(output_dir: str) -> int:
+    filepath: str = f'{output_dir}/{log_filename}'
+    if not os.path.isfile(filepath):
+        return 0
+
+    with open(filepath, "r") as log_file:
+        return len(log_file.readlines())
+
+@pytest.mark.parametrize('fsync_policy', (LogFsyncPolicy.NONE, LogFsyncPolicy.BATCH))
+def test_group_commit(tmpdir, fsync_policy: LogFsyncPolicy):
+    output_dir: str = tmpdir.strpath
+    instances_logger: InstancesLogger = InstancesLogger(output_dir, False, commit_entries=5, fsync_policy=fsync_policy)
+
+    with open(f'{output_dir}/output.dat', "a") as output_file:
+        for i in range(12):
+            output_file.write(f'{i}\n')
+            instances_logger.write_instance_to_log(f'DummyAlgorithm {i},4', output_file)
+
+            # Log never gets ahead of output files
+            assert _count_log_lines(output_dir) == ((i + 1) // 5) * 5
+            with open(f'{output_dir}/output.dat', "r") as written_output:
+                assert len(written_output.readlines()) >= _count_log_lines(output_dir)
+
+        instances_logger.close_log()
+        assert _count_log_lines(output_dir) == 12
+
+def test_group_commit_always(tmpdir):
+    output_dir: str = tmpdir.strpath
+    instances_logger: InstancesLogger = InstancesLogger(output_dir, False, commit_entries=5, fsync_policy=LogFsyncPolicy.ALWAYS)
+
+    for i in range(3):
+        instances_logger.write_instance_to_log(f'DummyAlgorithm {i},4')
+        assert _count_log_lines(output_dir) == i + 1
+
+    instances_logger.close_log()
@@ -0,0 +1,170 @@
+import os
+import gc
+import math
+import pickle
+import tracemalloc
+import multiprocessing
+import pytest
+from flexmock import flexmock
+from typing import Dict, List
+from algorithm_tester.concurrency_runners import BaseRunner
+from algorithm_tester.executors import SupervisedProcessPoolExecutor, get_worker_index
+from algorithm_tester.measurements import TimingModes, ExtraColumnsAlgorithm, IsolatedMeasurement, ResourceUsage, TIMING_COLUMNS, NOISE_COLUMNS, RESOURCE_COLUMNS, MEMORY_COLUMNS, TIMEOUT_COLUMNS, isolate_worker, wrap_algorithm, get_relative_ci, measure_adaptive, get_timing_stats
+from algorithm_tester_common.tester_dataclasses import AlgTesterContext
+from tests.test_internal.fixtures import create_dummy_context, create_dummy_algorithm, get_base_parsed_data
+from tests.dummy_plugins.dummy_plugins import DummyAlgorithm
+
+def test_get_relative_ci():
+    assert get_relative_ci([1.0]) == math.inf
+    assert get_relative_ci([2.0, 2.0, 2.0]) == 0.0
+    assert get_relative_ci([1.0, 2.0, 3.0]) == pytest.approx(4.303 * 1.0 / math.sqrt(3) / 2.0)
+
+def test_measure_adaptive():
+    base_context: AlgTesterContext = create_dummy_context()
+    base_context.warmup_runs = 2
+    base_context.target_ci = 0.0
+    base_context.time_budget = 10000.0
+    base_context.max_repeats = 7
+    calls: List[int] = list()
+
+    def func():
+        calls.append(len(calls))
+        return {"call": len(calls)}
+
+    times, solution = measure_adaptive(base_context, func)
+    assert len(times) == 7
+    assert len(calls) == 9
+    assert solution["call"] == 9
+
+    # Time budget is exhausted after the first run
+    base_context.time_budget = 0.0
+    times, _ = measure_adaptive(base_context, func)
+    assert len(times) == 1
+
+def test_get_timing_stats():
+    stats: Dict[str, float] = get_timing_stats([0.001, 0.003, 0.002])
+
+    assert stats["elapsed_time"] == pytest.approx(2.0)
+    assert stats["elapsed_time_min"] == pytest.approx(1.0)
+    assert stats["elapsed_time_median"] == pytest.approx(2.0)
+    assert stats["elapsed_time_stddev"] == pytest.approx(1.0)
+    assert get_timing_stats([0.001])["elapsed_time_stddev"] == 0.0
+
+def test_wrap_algorithm():
+    base_context: AlgTesterContext = create_dummy_context()
+    algorithm = DummyAlgorithm()
+
+    assert wrap_algorithm(base_context, algorithm) is algorithm
+
+    base_context.check_time = True
+    base_context.timing_name = TimingModes.ADAPTIVE.name
+    wrapped = wrap_algorithm(base_context, algorithm)
+
+    assert isinstance(wrapped, ExtraColumnsAlgorithm)
+    assert wrapped.get_name() == algorithm.get_name()
+    assert wrapped.get_columns() == algorithm.get_columns() + TIMING_COLUMNS
+
+    unpickled = pickle.loads(pickle.dumps(wrapped))
+    assert unpickled.get_columns() == wrapped.get_columns()
+
+def test_get_solution_for_instance_timeout():
+    base_context: AlgTesterContext = create_dummy_context()
+    base_context.instance_timeout = 0.5
+    algorithm = create_dummy_algorithm(columns=["id", "elapsed_time"])
+
+    # Timed out instances are recorded in their own column
+    assert wrap_algorithm(base_context, algorithm).get_columns() == ["id", "elapsed_time", "timed_out"]
+    assert wrap_algorithm(base_context, create_dummy_algorithm()).get_columns() == create_dummy_algorithm().get_columns() + TIMEOUT_COLUMNS
+
+    solution = BaseRunner().get_solution_for_instance(base_context, algorithm, get_base_parsed_data(base_context, algorithm))
+    assert solution["timed_out"] is False
+
+def test_get_solution_for_instance_adaptive():
+    base_context: AlgTesterContext = create_dummy_context()
+    base_context.check_time = True
+    base_context.timing_name = TimingModes.ADAPTIVE.name
+    base_context.max_repeats = 5
+    algorithm = create_dummy_algorithm()
+
+    solution = BaseRunner().get_solution_for_instance(base_context, algorithm, get_base_parsed_data(base_context, algorithm))
+
+    for column in ["elapsed_time"] + TIMING_COLUMNS:
+        assert solution[column] >= 0
+    assert solution["elapsed_time_min"] <= solution["elapsed_time_median"]
+
+def test_isolated_measurement():
+    assert gc.isenabled()
+
+    with IsolatedMeasurement() as measurement:
+        assert not gc.isenabled()
+        sum(range(10000))
+
+    assert gc.isenabled()
+    stats: Dict[str, object] = measurement.get_noise_stats()
+    assert sorted(stats.keys()) == sorted(NOISE_COLUMNS)
+    assert measurement.involuntary_switches is None or measurement.involuntary_switches >= 0
+
+def _get_isolated_affinity(_) -> List[int]:
+    isolate_worker(get_worker_index())
+    return sorted(os.sched_getaffinity(0))
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="CPU affinity is not supported")
+def test_isolate_worker():
+    cpus: List[int] = sorted(os.sched_getaffinity(0))
+
+    with SupervisedProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("fork")) as executor:
+        assert executor.submit(_get_isolated_affinity, None).result() == [cpus[0]]
+
+    assert sorted(os.sched_getaffinity(0)) == cpus
+
+def test_get_solution_for_instance_isolated():
+    base_context: AlgTesterContext = create_dummy_context()
+    base_context.check_time = True
+    base_context.isolate = True
+    algorithm = create_dummy_algorithm()
+
+    assert wrap_algorithm(base_context, algorithm).get_columns() == algorithm.get_columns() + NOISE_COLUMNS
+
+    solution = BaseRunner().get_solution_for_instance(base_context, algorithm, get_base_parsed_data(base_context, algorithm))
+    assert solution["elapsed_time"] >= 0
+    assert isinstance(solution["noisy"], bool)
+    assert gc.isenabled()
+
+def test_resource_usage():
+    with ResourceUsage(track_memory=True) as usage:
+        data = [list(range(100)) for _ in range(1000)]
+
+    stats: Dict[str, object] = usage.get_resource_stats()
+    assert stats["peak_memory"] > 100*1000
+    assert not tracemalloc.is_tracing()
+    assert stats["cpu_user_time"] >= 0
+    assert stats["max_rss"] > 0
+    assert sorted(stats.keys()) == sorted(RESOURCE_COLUMNS + MEMORY_COLUMNS)
+
+def _allocating_func(context: AlgTesterContext, parsed_data: Dict[str, object]) -> Dict[str, object]:
+    parsed_data["data"] = [list(range(100)) for _ in range(1000)]
+    return parsed_data
+
+def test_get_solution_for_instance_resources():
+    base_context: AlgTesterContext = create_dummy_context()
+    algorithm = create_dummy_algorithm(perform_func=_allocating_func)
+    runner = BaseRunner()
+
+    solution = runner.get_solution_for_instance(base_context, algorithm, get_base_parsed_data(base_context, algorithm))
+    assert "cpu_user_time" not in solution
+
+    base_context.track_resources = True
+    base_context.track_memory = True
+    assert wrap_algorithm(base_context, algorithm).get_columns() == algorithm.get_columns() + RESOURCE_COLUMNS + MEMORY_COLUMNS
+
+    solution = runner.get_solution_for_instance(base_context, algorithm, get_base_parsed_data(base_context, algorithm))
+    assert solution["voluntary_ctx_switches"] >= 0
+    assert solution["peak_memory"] > 100*1000
+    assert not tracemalloc.is_tracing()
+
+    # Resources are accounted around all timed runs of the algorithm
+    base_context.check_time = True
+    base_context.time_retries = 3
+    flexmock(ResourceUsage).should_call("__enter__").once()
+    solution = runner.get_solution_for_instance(base_context, algorithm, get_base_parsed_data(base_context, algorithm))
+    assert solution["elapsed_time"] >= 0 and solution["peak_memory"] > 100*1000
@@ -0,0 +1,88 @@
+import os
+import queue
+import threading
+import pytest
+from flexmock import flexmock
+from typing import Dict, List
+from algorithm_tester.concurrency_runners import PipelineRunner, put_to_stage, get_from_stage, _PIPELINE_END
+from algorithm_tester.executors import Executors
+from algorithm_tester_common.tester_dataclasses import AlgTesterContext, InstancesLogger
+from tests.test_internal.fixtures import create_dummy_context, create_dummy_algorithm, create_dummy_parser
+from algorithm_tester.plugins import Plugins
+from algorithm_tester.helpers import create_path
+
+_runner: PipelineRunner = PipelineRunner()
+
+def test_pipeline_stages():
+    stage_queue: queue.Queue = queue.Queue(maxsize=2)
+    stop: threading.Event = threading.Event()
+    received: List[int] = list()
+
+    consumer = threading.Thread(target=lambda: received.extend(get_from_stage(stage_queue, stop)))
+    consumer.start()
+    for item in range(10):
+        assert put_to_stage(stage_queue, item, stop)
+    assert put_to_stage(stage_queue, _PIPELINE_END, stop)
+    consumer.join()
+
+    assert received == list(range(10))
+
+    # Stopped pipeline does not wait for a full queue
+    stage_queue.put(1)
+    stage_queue.put(2)
+    stop.set()
+    assert not put_to_stage(stage_queue, 3, stop)
+    assert list(get_from_stage(stage_queue, stop)) == []
+
+def _failing_once_perform(context: AlgTesterContext, parsed_data: Dict[str, object]) -> Dict[str, object]:
+    if parsed_data["id"] == 250 and context.is_forced:
+        raise Exception("Dummy exception")
+
+    return parsed_data
+
+def _prepare_plugins(parser, algorithms):
+    flexmock(Plugins)
+    Plugins.should_receive("get_parser").and_return(parser)
+
+    for algorithm in algorithms:
+        (Plugins.should_receive("get_algorithm")
+            .with_args(algorithm.get_name())
+            .and_return(algorithm))
+
+def _count_lines(output_dir: str, filename: str) -> int:
+    with open(f'{output_dir}/{filename}') as output_file:
+        return len(output_file.readlines())
+
+@pytest.mark.parametrize('executor', (Executors.THREAD.name, Executors.PROCESS_FORK.name))
+def test_compute_results(tmpdir, executor: str):
+    parser = create_dummy_parser(write_result=True)
+    algorithms = [create_dummy_algorithm(name="DummyAlg1"), create_dummy_algorithm(name="DummyAlg2", perform_func=_failing_once_perform)]
+    base_context: AlgTesterContext = create_dummy_context(algorithms=[alg.get_name() for alg in algorithms], parser=parser.get_name())
+    base_context.output_dir = tmpdir.strpath
+    base_context.executor_name = executor
+    base_context.max_in_flight = 4
+    input_files: List[str] = sorted(os.listdir(base_context.input_dir))
+
+    instances_logger: InstancesLogger = InstancesLogger(base_context.output_dir, base_context.is_forced)
+    create_path(base_context.output_dir)
+    _prepare_plugins(parser, algorithms)
+
+    _runner.init(instances_logger)
+    _runner.compute_results(base_context, input_files)
+    instances_logger.close_log()
+
+    for input_filename in input_files:
+        assert _count_lines(base_context.output_dir, input_filename.replace(".dat", "_DummyAlg1_sol.dat")) == 500
+        assert _count_lines(base_context.output_dir, input_filename.replace(".dat", "_DummyAlg2_sol.dat")) == 499
+
+    # Resume, only failed instances are computed
+    base_context.is_forced = False
+    instances_logger = InstancesLogger(base_context.output_dir, base_context.is_forced)
+    assert instances_logger.get_num_of_done_instances() == 2*500*len(algorithms) - 2
+
+    _runner.init(instances_logger)
+    _runner.compute_results(base_context, input_files)
+    instances_logger.close_log()
+
+    for input_filename in input_files:
+        assert _count_lines(base_context.output_dir, input_filename.replace(".dat", "_DummyAlg2_sol.dat")) == 500
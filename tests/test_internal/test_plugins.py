@@ -1,6 +1,11 @@
 import os
+import json
 from configparser import ConfigParser
 from algorithm_tester.plugins import Plugins
+import importlib.metadata
+from flexmock import flexmock
+import algorithm_tester.plugins as plugins_module
+from tests.dummy_plugins.dummy_plugins import DummyAlgorithm, DummyParser
 
 # def test_check_internal_communicators_preconditions():
 #     plugins: Plugins = Plugins()
@@ -21,4 +26,61 @@ from algorithm_tester.plugins import Plugins
 #     assert os.environ["slack_access_token"] == access_token
 #     assert os.environ["slack_channel_id"] == channel_id
 
-#     print
\ No newline at end of file
+#     print
+
+def _get_entry_points():
+    return [
+        importlib.metadata.EntryPoint(name="algorithms", value="tests.dummy_plugins", group="algorithm_tester.plugins"),
+        importlib.metadata.EntryPoint(name="parsers", value="tests.dummy_plugins", group="algorithm_tester.plugins")
+    ]
+
+def test_plugins_manifest(tmpdir, monkeypatch):
+    monkeypatch.delenv("slack_config", raising=False)
+    manifest_path: str = f'{tmpdir.strpath}/plugins_manifest.json'
+    flexmock(plugins_module).should_receive("iter_entry_points").replace_with(_get_entry_points).once()
+
+    plugins: Plugins = Plugins(manifest_path)
+    assert plugins.get_algorithm_names() == ["DummyAlgorithm", "DummyFailingAlgorithm"]
+    assert os.path.isfile(manifest_path)
+
+    # Entrypoints are not loaded again, plugins are instantiated when they are requested
+    plugins = Plugins(manifest_path)
+    assert plugins.get_parser_names() == ["DummyParser"]
+    assert plugins.get_communicator_names() == []
+    assert isinstance(plugins.get_parser("DummyParser"), DummyParser)
+    assert plugins.get_algorithm("DummyAlgorithm") is plugins.get_algorithm("DummyAlgorithm")
+    assert [alg.get_name() for alg in plugins.get_algorithms(with_names=["DummyFailingAlgorithm"])] == ["DummyFailingAlgorithm"]
+
+def test_plugins_manifest_outdated(tmpdir, monkeypatch):
+    monkeypatch.delenv("slack_config", raising=False)
+    manifest_path: str = f'{tmpdir.strpath}/plugins_manifest.json'
+    flexmock(plugins_module).should_receive("iter_entry_points").replace_with(_get_entry_points).twice()
+
+    assert isinstance(Plugins(manifest_path).get_algorithm("DummyAlgorithm"), DummyAlgorithm)
+
+    # A plugin module was changed
+    with open(manifest_path) as manifest_file:
+        manifest = json.load(manifest_file)
+    manifest["files"] = {path: mtime - 1 for path, mtime in manifest["files"].items()}
+    with open(manifest_path, "w") as manifest_file:
+        json.dump(manifest, manifest_file)
+
+    assert Plugins(manifest_path).get_algorithm_names() == ["DummyAlgorithm", "DummyFailingAlgorithm"]
+
+def test_plugins_manifest_working_directory(tmpdir, monkeypatch):
+    monkeypatch.delenv("slack_config", raising=False)
+    manifest_path: str = f'{tmpdir.strpath}/plugins_manifest.json'
+    flexmock(plugins_module).should_receive("iter_entry_points").replace_with(_get_entry_points).once()
+
+    work_dir = tmpdir.mkdir("work")
+    monkeypatch.chdir(work_dir.strpath)
+    search_path = plugins_module.sys.path
+    monkeypatch.setattr(plugins_module.sys, "path", ["", ".", work_dir.strpath] + search_path)
+    assert Plugins(manifest_path).get_algorithm_names() == ["DummyAlgorithm", "DummyFailingAlgorithm"]
+
+    # Files in the working directory or another working directory do not outdate the manifest
+    work_dir.join("results.txt").write("changed")
+    assert Plugins(manifest_path).get_algorithm_names() == ["DummyAlgorithm", "DummyFailingAlgorithm"]
+    monkeypatch.chdir(tmpdir.strpath)
+    monkeypatch.setattr(plugins_module.sys, "path", [tmpdir.strpath] + search_path)
+    assert Plugins(manifest_path).get_algorithm_names() == ["DummyAlgorithm", "DummyFailingAlgorithm"]
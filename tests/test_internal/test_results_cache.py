@@ -0,0 +1,206 @@
+import os
+import pytest
+from flexmock import flexmock
+from typing import Dict, List
+from algorithm_tester.concurrency_runners import Runner, Runners
+from algorithm_tester.results_cache import ResultsCache, DuplicatesCache, create_results_cache
+from algorithm_tester_common.tester_dataclasses import AlgTesterContext, InstancesLogger
+from tests.test_internal.fixtures import create_dummy_context, create_dummy_algorithm, create_dummy_parser, get_base_parsed_data
+from algorithm_tester.plugins import Plugins
+from algorithm_tester.helpers import create_path
+
+def _get_instance_data(base_context: AlgTesterContext, algorithm, id: int, output_filename: str = "output_filename", capacity: int = None) -> Dict[str, object]:
+    data: Dict[str, object] = get_base_parsed_data(base_context, algorithm)
+    data.update({"id": id, "item_count": 4, "capacity": id if capacity is None else capacity, "things": [(0, 1, 2)]})
+    data["output_filename"] = output_filename
+
+    return data
+
+def test_results_cache(tmpdir):
+    parser = create_dummy_parser()
+    algorithm = create_dummy_algorithm()
+    base_context: AlgTesterContext = create_dummy_context(algorithms=[algorithm.get_name()])
+    results_cache: ResultsCache = ResultsCache(f'{tmpdir.strpath}/results_cache.sqlite', parser)
+    results_cache.open()
+
+    data: Dict[str, object] = _get_instance_data(base_context, algorithm, 1)
+    key: str = results_cache.get_key(base_context, algorithm, data)
+    assert results_cache.get_solution(base_context, key, algorithm, data) is None
+
+    results_cache.put_solution(key, dict(data, best=5))
+    results_cache.close()
+
+    # Same content in another output file
+    results_cache.open()
+    other_data: Dict[str, object] = _get_instance_data(base_context, algorithm, 1, output_filename="other_filename")
+    assert results_cache.get_key(base_context, algorithm, other_data) == key
+
+    solution: Dict[str, object] = results_cache.get_solution(base_context, key, algorithm, other_data)
+    assert solution["best"] == 5
+    assert solution["output_filename"] == "other_filename"
+    assert solution["algorithm"] is algorithm
+
+    # Same content with another identifier
+    duplicate_data: Dict[str, object] = _get_instance_data(base_context, algorithm, 7, capacity=1)
+    assert results_cache.get_key(base_context, algorithm, duplicate_data) == key
+    assert results_cache.get_solution(base_context, key, algorithm, duplicate_data)["id"] == 7
+
+    # Different content or another version of the algorithm
+    assert results_cache.get_key(base_context, algorithm, _get_instance_data(base_context, algorithm, 2)) != key
+    flexmock(algorithm).should_receive("get_version").and_return("2")
+    assert results_cache.get_key(base_context, algorithm, data) != key
+    results_cache.close()
+
+def test_results_cache_eviction(tmpdir):
+    parser = create_dummy_parser()
+    algorithm = create_dummy_algorithm()
+    base_context: AlgTesterContext = create_dummy_context(algorithms=[algorithm.get_name()])
+    results_cache: ResultsCache = ResultsCache(f'{tmpdir.strpath}/results_cache.sqlite', parser, max_size=2000)
+    results_cache.open()
+
+    keys: List[str] = list()
+    for id in range(20):
+        data: Dict[str, object] = _get_instance_data(base_context, algorithm, id)
+        keys.append(results_cache.get_key(base_context, algorithm, data))
+        results_cache.put_solution(keys[-1], dict(data, padding="x"*100))
+
+        # The first solution is used all the time
+        assert results_cache.get_solution(base_context, keys[0], algorithm, data) is not None
+
+    cached: List[bool] = [results_cache.get_solution(base_context, key, algorithm, dict()) is not None for key in keys]
+    assert cached[0] and cached[-1]
+    assert not all(cached)
+    results_cache.close()
+
+def test_create_results_cache(tmpdir):
+    parser = create_dummy_parser()
+    base_context: AlgTesterContext = create_dummy_context()
+    path: str = f'{tmpdir.strpath}/results_cache.sqlite'
+    assert create_results_cache(base_context, parser, path=path) is None
+
+    base_context.result_cache = True
+    results_cache: ResultsCache = create_results_cache(base_context, parser, path=path)
+    assert results_cache is not None
+    results_cache.close()
+
+    # Measured results are never cached
+    base_context.check_time = True
+    assert create_results_cache(base_context, parser, path=path) is None
+
+def _prepare_plugins(parser, algorithms):
+    flexmock(Plugins)
+    Plugins.should_receive("get_parser").and_return(parser)
+
+    for algorithm in algorithms:
+        (Plugins.should_receive("get_algorithm")
+            .with_args(algorithm.get_name())
+            .and_return(algorithm))
+
+@pytest.mark.parametrize('runner_name', ("BASE", "FILES", "INSTANCES", "PIPELINE"))
+def test_compute_results_cached(tmpdir, runner_name: str):
+    performed: List[int] = list()
+    def perform(context: AlgTesterContext, parsed_data: Dict[str, object]) -> Dict[str, object]:
+        performed.append(parsed_data["id"])
+        return parsed_data
+
+    parser = create_dummy_parser(write_result=True)
+    algorithm = create_dummy_algorithm(perform_func=perform)
+    base_context: AlgTesterContext = create_dummy_context(algorithms=[algorithm.get_name()], parser=parser.get_name())
+    base_context.executor_name = "THREAD"
+    base_context.chunk_size = 8
+    input_files: List[str] = sorted(os.listdir(base_context.input_dir))
+    results_cache: ResultsCache = ResultsCache(f'{tmpdir.strpath}/results_cache.sqlite', parser)
+    runner: Runner = Runners[runner_name].value
+    _prepare_plugins(parser, [algorithm])
+
+    for output_dir in ("first", "second"):
+        base_context.output_dir = f'{tmpdir.strpath}/{output_dir}'
+        instances_logger: InstancesLogger = InstancesLogger(base_context.output_dir, base_context.is_forced)
+        create_path(base_context.output_dir)
+
+        results_cache.open()
+        runner.init(instances_logger, results_cache)
+        runner.compute_results(base_context, input_files)
+        instances_logger.close_log()
+        results_cache.close()
+
+    # Instances were computed only in the first output directory
+    assert len(performed) == 1000
+    for input_filename in input_files:
+        output_filename: str = input_filename.replace(".dat", f'_{algorithm.get_name()}_sol.dat')
+        with open(f'{tmpdir.strpath}/first/{output_filename}') as first, open(f'{tmpdir.strpath}/second/{output_filename}') as second:
+            assert sorted(first.readlines()) == sorted(second.readlines())
+
+    runner.init(None)
+
+def test_duplicates_cache():
+    parser = create_dummy_parser()
+    algorithm = create_dummy_algorithm()
+    base_context: AlgTesterContext = create_dummy_context(algorithms=[algorithm.get_name()])
+    duplicates_cache: DuplicatesCache = DuplicatesCache(parser, max_entries=2)
+
+    keys: List[str] = list()
+    for id in range(3):
+        data: Dict[str, object] = _get_instance_data(base_context, algorithm, id)
+        keys.append(duplicates_cache.get_key(base_context, algorithm, data))
+        duplicates_cache.put_solution(keys[-1], dict(data, best=id))
+
+    # Only the most recent solutions are kept
+    assert duplicates_cache.get_solution(base_context, keys[0], algorithm, dict()) is None
+
+    duplicate_data: Dict[str, object] = _get_instance_data(base_context, algorithm, 10, output_filename="other_filename", capacity=2)
+    solution: Dict[str, object] = duplicates_cache.get_solution(base_context, keys[2], algorithm, duplicate_data)
+    assert (solution["id"], solution["best"], solution["output_filename"]) == (10, 2, "other_filename")
+
+    solution_copy: Dict[str, object] = duplicates_cache.copy_solution(base_context, solution, algorithm, _get_instance_data(base_context, algorithm, 11))
+    assert (solution_copy["id"], solution_copy["best"]) == (11, 2)
+    assert solution_copy["things"] is not solution["things"]
+
+def _write_duplicate_inputs(input_dir: str, lines: List[str]):
+    # Every instance is in both files twice, always with another ID
+    for file_index, filename in enumerate(("a_inst.dat", "b_inst.dat")):
+        with open(f'{input_dir}/{filename}', "w") as input_file:
+            for copy_index in range(2):
+                for index, line in enumerate(lines):
+                    id: int = (2*file_index + copy_index)*len(lines) + index + 1
+                    input_file.write(f'{id} {line.split(" ", 1)[1]}')
+
+@pytest.mark.parametrize('runner_name', ("BASE", "FILES", "INSTANCES", "PIPELINE"))
+def test_compute_results_deduplicated(tmpdir, runner_name: str):
+    performed: List[int] = list()
+    def perform(context: AlgTesterContext, parsed_data: Dict[str, object]) -> Dict[str, object]:
+        performed.append(parsed_data["id"])
+        return parsed_data
+
+    parser = create_dummy_parser(write_result=True)
+    algorithm = create_dummy_algorithm(columns=["id", "capacity", "algorithm_name"], perform_func=perform)
+    base_context: AlgTesterContext = create_dummy_context(algorithms=[algorithm.get_name()], parser=parser.get_name())
+    with open(f'{base_context.input_dir}/4_inst.dat', "r") as input_file:
+        lines: List[str] = input_file.readlines()[:50]
+
+    base_context.input_dir = tmpdir.mkdir("input").strpath
+    base_context.output_dir = f'{tmpdir.strpath}/output'
+    base_context.executor_name = "THREAD"
+    base_context.chunk_size = 8
+    _write_duplicate_inputs(base_context.input_dir, lines)
+    input_files: List[str] = sorted(os.listdir(base_context.input_dir))
+
+    instances_logger: InstancesLogger = InstancesLogger(base_context.output_dir, base_context.is_forced)
+    create_path(base_context.output_dir)
+    runner: Runner = Runners[runner_name].value
+    _prepare_plugins(parser, [algorithm])
+
+    runner.init(instances_logger, duplicates_cache=DuplicatesCache(parser))
+    runner.compute_results(base_context, input_files)
+    instances_logger.close_log()
+    runner.init(None)
+
+    # Every instance was computed once, every row has its own identifier
+    assert len(performed) == len(lines)
+    for input_filename in input_files:
+        with open(f'{base_context.input_dir}/{input_filename}') as input_file:
+            expected: List[str] = sorted(f'{" ".join(line.split(" ")[0:3:2])} {algorithm.get_name()}\n' for line in input_file)
+
+        output_filename: str = input_filename.replace(".dat", f'_{algorithm.get_name()}_sol.dat')
+        with open(f'{base_context.output_dir}/{output_filename}') as output_file:
+            assert sorted(output_file.readlines()) == expected
@@ -0,0 +1,105 @@
+import os
+import math
+import pytest
+from flexmock import flexmock
+from typing import Dict, List
+from algorithm_tester.sinks import ColumnarSink, SQLiteSink, load_results
+from algorithm_tester.concurrency_runners import Runner, Runners
+from algorithm_tester.plugins import Plugins
+from algorithm_tester.helpers import create_path
+from algorithm_tester_common.tester_dataclasses import AlgTesterContext, InstancesLogger
+from tests.test_internal.fixtures import create_dummy_context, create_dummy_algorithm, create_dummy_parser
+
+def _get_rows(ids: List[int]) -> List[Dict[str, object]]:
+    return [{"id": id, "weight": id/2, "things": [(0, id)], "ignored": "x"} for id in ids]
+
+def test_columnar_sink(tmpdir):
+    path: str = f'{tmpdir.strpath}/output.columns'
+
+    sink: ColumnarSink = ColumnarSink(path, ["id", "weight", "things"])
+    sink.write_results_batch(_get_rows([1, 2]))
+    sink.close()
+    assert sink.closed
+
+    # Results are appended, uncommitted results of the last run are discarded
+    sink = ColumnarSink(path, ["id", "weight", "things", "best"])
+    sink.write_results_batch(_get_rows([3]))
+    sink.flush()
+    sink.write_results_batch(_get_rows([4]))
+    sink._columns["id"].commit()
+    for column_file in sink._columns.values():
+        column_file.close()
+
+    sink = ColumnarSink(path, ["id", "weight", "things", "best"])
+    sink.write_results_batch([{"id": 5, "weight": None, "things": None, "best": 10}])
+    sink.close()
+
+    results: Dict[str, object] = load_results(path)
+    assert list(results["id"]) == [1, 2, 3, 5]
+    assert list(results["weight"])[:3] == [0.5, 1.0, 1.5] and math.isnan(results["weight"][3])
+    assert results["things"] == ["[(0, 1)]", "[(0, 2)]", "[(0, 3)]", None]
+    assert all(math.isnan(value) for value in results["best"][:3]) and results["best"][3] == 10
+    assert "ignored" not in results
+
+def test_columnar_sink_conversion(tmpdir):
+    path: str = f'{tmpdir.strpath}/output.columns'
+
+    sink: ColumnarSink = ColumnarSink(path, ["value"])
+    for value in (1, None, 2.5, 3, "", "text"):
+        sink.write_results_batch([{"value": value}])
+        sink.flush()
+    sink.close()
+
+    # Values are converted as they were written, not through the float column
+    assert load_results(path)["value"] == ["1", None, "2.5", "3", "", "text"]
+
+    # Missing strings are kept when the column is opened again
+    sink = ColumnarSink(path, ["value"])
+    sink.write_results_batch([{"value": None}, {"value": "last"}])
+    sink.close()
+    assert load_results(path)["value"] == ["1", None, "2.5", "3", "", "text", None, "last"]
+
+def test_sqlite_sink(tmpdir):
+    path: str = f'{tmpdir.strpath}/output.sqlite'
+
+    sink: SQLiteSink = SQLiteSink(path, ["id", "weight", "things"])
+    sink.write_results_batch(_get_rows([1, 2]))
+    sink.close()
+
+    sink = SQLiteSink(path, ["id", "weight", "things", "best"])
+    sink.write_results_batch([{"id": 3, "best": 10}])
+    sink.close()
+
+    results: Dict[str, object] = load_results(path)
+    assert results["id"] == [1, 2, 3]
+    assert results["weight"] == [0.5, 1.0, None]
+    assert results["things"] == ["[(0, 1)]", "[(0, 2)]", None]
+    assert results["best"] == [None, None, 10]
+
+@pytest.mark.parametrize('runner_name', ("BASE", "FILES"))
+@pytest.mark.parametrize('sink_name', ("COLUMNAR", "SQLITE"))
+def test_compute_results_sink(tmpdir, runner_name: str, sink_name: str):
+    parser = create_dummy_parser()
+    algorithm = create_dummy_algorithm(columns=["id", "item_count", "capacity"])
+    base_context: AlgTesterContext = create_dummy_context(algorithms=[algorithm.get_name()], parser=parser.get_name())
+    base_context.output_dir = tmpdir.strpath
+    base_context.executor_name = "THREAD"
+    base_context.output_sink_name = sink_name
+    input_files: List[str] = sorted(os.listdir(base_context.input_dir))
+
+    flexmock(Plugins)
+    Plugins.should_receive("get_parser").and_return(parser)
+    Plugins.should_receive("get_algorithm").with_args(algorithm.get_name()).and_return(algorithm)
+
+    instances_logger: InstancesLogger = InstancesLogger(base_context.output_dir, base_context.is_forced)
+    create_path(base_context.output_dir)
+    runner: Runner = Runners[runner_name].value
+    runner.init(instances_logger)
+    runner.compute_results(base_context, input_files)
+    instances_logger.close_log()
+
+    suffix: str = ".columns" if sink_name == "COLUMNAR" else ".sqlite"
+    for input_filename in input_files:
+        results: Dict[str, object] = load_results(f'{tmpdir.strpath}/{input_filename.replace(".dat", f"_{algorithm.get_name()}_sol{suffix}")}')
+        assert sorted(results["id"]) == list(range(1, 501))
+        assert set(results["item_count"]) == {int(input_filename.split("_")[0])}
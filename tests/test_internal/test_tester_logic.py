@@ -1,13 +1,17 @@
 import os
+import shutil
 import pytest
-import flexmock
+from flexmock import flexmock
 import algorithm_tester.tester_logic as tester_logic
 from algorithm_tester.concurrency_runners import Runner, BaseRunner, ConcurrentFilesRunner, ConcurrentInstancesRunner
 from algorithm_tester.plugins import Plugins
+from algorithm_tester.writers import BufferedResultsWriter
 from algorithm_tester_common.tester_dataclasses import AlgTesterContext, Algorithm, Parser, Communicator, InstancesLogger
+from tests.dummy_plugins.dummy_plugins import DummyParser
 from tests.test_internal.fixtures import create_dummy_context, create_dummy_algorithm, get_base_parsed_data, create_dummy_parser 
 
-def test_count_instances():
+def test_count_instances(tmpdir, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", tmpdir.strpath)
     parser: Parser = create_dummy_parser()
     ctx: AlgTesterContext = create_dummy_context(parser=parser, algorithms=["Alg1", "Alg2"])
 
@@ -24,7 +28,48 @@ def test_count_instances():
     assert ctx.num_of_instances == 500*2*len(ctx.algorithm_names)
     print
 
-def test_run_tester(tmpdir):
+@pytest.mark.parametrize('executor', ("INLINE", "THREAD", "PROCESS_FORK"))
+def test_count_instances_cached(tmpdir, monkeypatch, executor: str):
+    monkeypatch.setenv("XDG_CACHE_HOME", f'{tmpdir.strpath}/cache')
+    # Parser is sent to process workers
+    parser: Parser = DummyParser()
+    ctx: AlgTesterContext = create_dummy_context(parser=parser, algorithms=["Alg1"])
+    ctx.executor_name = executor
+    ctx.jobs = 2
+    ctx.input_dir = f'{tmpdir.strpath}/data'
+    shutil.copytree("tests/test_internal/fixtures/data", ctx.input_dir)
+    input_files = sorted(os.listdir(ctx.input_dir))
+
+    flexmock(Plugins)
+    (Plugins.should_receive("get_parser").and_return(parser))
+
+    tester_logic.count_instances(ctx, input_files)
+    assert ctx.num_of_instances == 500*2
+
+    # Counts of unchanged files are cached
+    flexmock(parser).should_receive("get_num_of_instances").and_return(1).once()
+    with open(f'{ctx.input_dir}/{input_files[0]}', "a") as input_file:
+        input_file.write("1 1 1 1 1\n")
+
+    tester_logic.count_instances(ctx, input_files, parallel=False)
+    assert ctx.num_of_instances == 500 + 1
+
+def test_start_counting_instances(tmpdir, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", tmpdir.strpath)
+    parser: Parser = create_dummy_parser()
+    ctx: AlgTesterContext = create_dummy_context(parser=parser, algorithms=["Alg1", "Alg2"])
+    input_files = sorted(os.listdir(ctx.input_dir))
+
+    flexmock(Plugins)
+    (Plugins.should_receive("get_parser").and_return(parser))
+
+    thread = tester_logic.start_counting_instances(ctx, input_files)
+    thread.join()
+
+    assert ctx.num_of_instances == 500*2*2
+
+def test_run_tester(tmpdir, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", tmpdir.strpath)
     parser: Parser = create_dummy_parser()
     algorithms = ["Alg1", "Alg2"]
     communicators = ["Slack"]
@@ -51,4 +96,28 @@ def test_run_tester(tmpdir):
 
     assert os.path.isdir(ctx.output_dir)
 
-    print
\ No newline at end of file
+    print
+def test_run_tester_flushes_batches(tmpdir, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", tmpdir.strpath)
+    parser: Parser = create_dummy_parser(write_result=True)
+    algorithm: Algorithm = create_dummy_algorithm()
+    ctx: AlgTesterContext = create_dummy_context(parser=parser, algorithms=[algorithm.get_name()])
+    ctx.output_dir = f'{tmpdir.strpath}/Test'
+
+    flexmock(Plugins)
+    Plugins.should_receive("get_parser").and_return(parser)
+    Plugins.should_receive("get_algorithm").and_return(algorithm)
+
+    flushes = list()
+    flush = BufferedResultsWriter.flush
+    def counted_flush(self):
+        flushes.append(self.name)
+        flush(self)
+    monkeypatch.setattr(BufferedResultsWriter, "flush", counted_flush)
+
+    tester_logic.run_tester(ctx.algorithm_names, ctx.concurrency_runner_name, ctx.check_time, ctx.time_retries, ctx.parser_name, ctx.communicator_names, ctx.max_files_to_check, ctx.is_forced, ctx.min_time_between_communications, ctx.input_dir, ctx.output_dir, ctx.extra_options)
+
+    # With default options output files are flushed with batches of results, not after every result
+    with open(f'{ctx.output_dir}/.instances_log.dat') as instances_log:
+        assert len(instances_log.readlines()) == 500*2
+    assert 0 < len(flushes) <= 2*(500 // 256 + 1)
@@ -0,0 +1,116 @@
+import pickle
+import multiprocessing
+import pytest
+from typing import Dict, List
+import algorithm_tester.concurrency_runners as concurrency_runners
+import algorithm_tester.transports as transports
+from algorithm_tester.executors import SupervisedProcessPoolExecutor
+from algorithm_tester.transports import Transports, SharedChunk, SharedMemoryPool, SharedTuples, get_tuples_width, load_shared_values, unload_shared_values, release_attached, shared_memory
+from algorithm_tester_common.tester_dataclasses import AlgTesterContext
+from tests.test_internal.fixtures import create_dummy_context, create_dummy_algorithm
+
+pytestmark = pytest.mark.skipif(shared_memory is None, reason="Shared memory is not supported")
+
+def test_get_tuples_width():
+    assert get_tuples_width([(0, 1, 2), (1, 3, 4)]) == 3
+    assert get_tuples_width([]) == 0
+    assert get_tuples_width([(0, 1), (1, 2, 3)]) == 0
+    assert get_tuples_width([(0, 1.5)]) == 0
+    assert get_tuples_width([(0, 2**64)]) == 0
+    assert get_tuples_width("things") == 0
+
+def test_shared_chunk():
+    things: List[tuple] = [(pos, pos*2, -pos) for pos in range(100)]
+    instances_data: List[Dict[str, object]] = [{"id": 1, "things": things}, {"id": 2, "name": "no tuples"}]
+
+    pool = SharedMemoryPool()
+    shared_chunk = SharedChunk(instances_data, pool)
+    try:
+        shared_data = shared_chunk.instances_data
+        assert shared_data[1] is instances_data[1]
+        assert instances_data[0]["things"] is things
+
+        shared_things = shared_data[0]["things"]
+        assert isinstance(shared_things, SharedTuples)
+        assert len(shared_things) == 100
+        assert shared_things == things
+        assert shared_things[5] == (5, 10, -5)
+        assert shared_things[-1] == (99, 198, -99)
+        assert shared_things[2:4] == things[2:4]
+        with pytest.raises(IndexError):
+            shared_things[100]
+
+        unpickled = pickle.loads(pickle.dumps(shared_things))
+        assert list(unpickled) == things
+
+        # Workers index a list instead of the segment
+        data = dict(shared_data[0])
+        loaded = load_shared_values(data)
+        assert type(data["things"]) is list and data["things"] == things
+        unload_shared_values(data, loaded)
+        assert data["things"] is shared_things
+
+        results = [dict(shared_data[0]), ValueError()]
+        shared_chunk.restore_results(results, instances_data)
+        assert results[0]["things"] is things
+    finally:
+        release_attached()
+        shared_chunk.close()
+        pool.close()
+
+def test_shared_memory_pool():
+    pool = SharedMemoryPool(segment_size=80)
+    try:
+        assert pool.allocate(6) == (0, 0)
+        assert pool.allocate(4) == (0, 6)
+        # Chunks that do not fit go to the next segment, larger chunks get a larger one
+        assert pool.allocate(2) == (1, 0)
+        assert pool.allocate(20) == (2, 0)
+        assert pool.get_segment(2).size >= 160
+
+        # Segments are reused once all their chunks are freed
+        pool.free(0)
+        assert pool.allocate(5) == (1, 2)
+        pool.free(0)
+        assert pool.allocate(5) == (0, 0)
+    finally:
+        pool.close()
+
+    # Segments are reused by chunks, so workers attach them once
+    release_attached()
+    pool = SharedMemoryPool()
+    try:
+        things: List[tuple] = [(pos, pos) for pos in range(10)]
+        chunks = [SharedChunk([{"things": things}], pool) for _ in range(3)]
+        for shared_chunk in chunks:
+            assert list(shared_chunk.instances_data[0]["things"]) == things
+            shared_chunk.close()
+
+        assert len({shared_chunk.instances_data[0]["things"]._name for shared_chunk in chunks}) == 1
+        release_attached(keep=1)
+        assert len(transports._attached) == 1
+    finally:
+        release_attached()
+        pool.close()
+
+def _sum_costs(context: AlgTesterContext, parsed_data: Dict[str, object]) -> Dict[str, object]:
+    assert isinstance(parsed_data["things"], list)
+    parsed_data["best"] = sum(cost for _, _, cost in parsed_data["things"])
+    return parsed_data
+
+def test_solve_in_chunks_shared_memory():
+    base_context = create_dummy_context()
+    base_context.chunk_size = 3
+    base_context.transport_name = Transports.SHARED_MEMORY.name
+    algorithm = create_dummy_algorithm(perform_func=_sum_costs)
+    items = [(i, algorithm, {"id": i, "algorithm_name": algorithm.get_name(), "things": [(pos, 1, i) for pos in range(i + 1)]}) for i in range(10)]
+
+    runner = concurrency_runners.BaseRunner()
+    with SupervisedProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("fork"), initializer=concurrency_runners.init_worker,
+            initargs=(base_context, [algorithm])) as executor:
+        results = dict(runner.solve_in_chunks(base_context, executor, items))
+
+    for key, result in results.items():
+        assert result["best"] == key*(key + 1)
+        assert result["things"] == [(pos, 1, key) for pos in range(key + 1)]
+        assert isinstance(result["things"], list)
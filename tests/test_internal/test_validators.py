@@ -0,0 +1,53 @@
+import click
+import pytest
+from flexmock import flexmock
+from algorithm_tester import validators
+from algorithm_tester.validators import validate_enum_name, validate_executor_options, validate_parse_in_workers
+from algorithm_tester.concurrency_runners import Runners
+from algorithm_tester.executors import Executors
+
+def test_validate_enum_name():
+    validate_executor = validate_enum_name(Executors)
+    assert validate_executor(None, None, "process-spawn") == "PROCESS_SPAWN"
+    assert validate_executor(None, None, "Thread") == "THREAD"
+
+    # Values of runners are not names
+    assert validate_enum_name(Runners)(None, None, "pipeline") == "PIPELINE"
+
+    for value in ["threads", "", None]:
+        with pytest.raises(click.BadParameter):
+            validate_executor(None, None, value)
+
+def test_validate_executor_options_track_memory():
+    with pytest.raises(click.BadParameter):
+        validate_executor_options("FILES", "THREAD", 2, False, False, True)
+
+    # Single workers and processes measure alone
+    validate_executor_options("FILES", "THREAD", 1, False, False, True)
+    validate_executor_options("INSTANCES", "PROCESS", 2, False, False, True)
+    validate_executor_options("BASE", "THREAD", 2, False, False, True)
+
+def test_validate_executor_options_track_resources():
+    validate_executor_options("FILES", "THREAD", 2, False, True, False)
+
+    flexmock(validators).should_receive("is_rusage_per_thread").and_return(False)
+    with pytest.raises(click.BadParameter):
+        validate_executor_options("FILES", "THREAD", 2, False, True, False)
+
+def test_validate_executor_options_isolate():
+    with pytest.raises(click.BadParameter):
+        validate_executor_options("PIPELINE", "THREAD", 1, True, False, False)
+
+    validate_executor_options("PIPELINE", "INLINE", None, True, False, False)
+    validate_executor_options("FILES", "PROCESS_SPAWN", 4, True, False, False)
+    validate_executor_options("BASE", "THREAD", 4, True, False, False)
+
+def test_validate_parse_in_workers():
+    for runner in ["BASE", "PIPELINE"]:
+        with pytest.raises(click.BadParameter):
+            validate_parse_in_workers(runner, True)
+
+        validate_parse_in_workers(runner, False)
+
+    validate_parse_in_workers("FILES", True)
+    validate_parse_in_workers("INSTANCES", True)
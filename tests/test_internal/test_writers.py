@@ -0,0 +1,75 @@
+import os
+from flexmock import flexmock
+from typing import Dict, List
+from algorithm_tester.writers import BufferedResultsWriter
+from algorithm_tester.compression import Compressions, open_output
+from algorithm_tester_common.tester_dataclasses import InstancesLogger
+from tests.test_internal.fixtures import create_dummy_algorithm, create_dummy_parser
+
+def _read_lines(path: str) -> List[str]:
+    with open(path) as output_file:
+        return output_file.readlines()
+
+def test_buffered_results_writer(tmpdir):
+    parser = create_dummy_parser(write_result=True)
+    algorithm = create_dummy_algorithm()
+    output_path: str = f'{tmpdir.strpath}/output.dat'
+    flexmock(parser).should_call("write_results_batch").times(3)
+
+    writer = BufferedResultsWriter(open(output_path, "a"), parser, batch_size=3, batch_interval=60000.0)
+    for index in range(7):
+        writer.write_result({"id": index, "algorithm": algorithm})
+
+    # Two full batches were written, one result is buffered
+    writer._output_file.flush()
+    assert len(_read_lines(output_path)) == 6
+
+    writer.close()
+    assert writer.closed
+    assert len(_read_lines(output_path)) == 7
+
+def test_buffered_results_writer_interval(tmpdir):
+    parser = create_dummy_parser(write_result=True)
+    algorithm = create_dummy_algorithm()
+    output_path: str = f'{tmpdir.strpath}/output.dat'
+
+    with BufferedResultsWriter(open(output_path, "a"), parser, batch_size=100, batch_interval=0.0) as writer:
+        writer.write_result({"id": 1, "algorithm": algorithm})
+        writer._output_file.flush()
+        assert len(_read_lines(output_path)) == 1
+
+def test_buffered_results_writer_log_commit(tmpdir):
+    parser = create_dummy_parser(write_result=True)
+    algorithm = create_dummy_algorithm()
+    output_path: str = f'{tmpdir.strpath}/output.dat'
+    instances_logger: InstancesLogger = InstancesLogger(tmpdir.strpath, False, commit_entries=2)
+
+    with BufferedResultsWriter(open(output_path, "a"), parser, batch_size=100, batch_interval=60000.0) as writer:
+        for index in range(2):
+            data: Dict[str, object] = {"id": index, "item_count": 1, "algorithm": algorithm}
+            writer.write_result(data)
+            instances_logger.write_instance_to_log(parser._get_complete_instance_identifier(algorithm, data), writer)
+
+        # Results are in the output file before their instances are logged
+        assert len(_read_lines(output_path)) == 2
+        assert len(_read_lines(f'{tmpdir.strpath}/.instances_log.dat')) == 2
+
+    instances_logger.close_log()
+
+def test_buffered_results_writer_unwritten_stream(tmpdir):
+    parser = create_dummy_parser(write_result=True)
+    algorithm = create_dummy_algorithm()
+    output_path: str = f'{tmpdir.strpath}/output.dat.xz'
+    instances_logger: InstancesLogger = InstancesLogger(tmpdir.strpath, False, commit_entries=1)
+
+    with BufferedResultsWriter(open_output(output_path, Compressions.XZ), parser, batch_size=1, batch_interval=60000.0) as writer:
+        data: Dict[str, object] = {"id": 1, "item_count": 1, "algorithm": algorithm}
+        writer.write_result(data)
+        instances_logger.write_instance_to_log(parser._get_complete_instance_identifier(algorithm, data), writer)
+
+        # The xz stream is not written yet, so neither is the log
+        assert writer.unwritten_size > 0
+        assert not os.path.exists(f'{tmpdir.strpath}/.instances_log.dat')
+
+    instances_logger.close_log()
+    assert len(_read_lines(f'{tmpdir.strpath}/.instances_log.dat')) == 1